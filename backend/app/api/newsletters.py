@@ -3,24 +3,53 @@
 웰니스 리트리트 뉴스레터 관련 모든 API 엔드포인트
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, asc, and_, or_
 
-from app.core.database import get_db
-from app.models.newsletter import Newsletter, NewsletterSource
+from app.core.config import settings
+from app.core.data_version import bump_data_version, get_data_version
+from app.core.database import get_db, get_read_db, mark_primary_reads
+from app.core.events import event_broker
+from app.core.page_cache import page_cache, cached_page_response
+from app.models.newsletter import Newsletter, NewsletterSource, CollectionRun, CollectionSourceRun
 from app.schemas.newsletter import (
     NewsletterResponse, NewsletterDetailResponse, NewsletterListResponse,
     NewsletterSearchParams, NewsletterStats, NewsletterSourceResponse,
-    NewsletterCreate, NewsletterUpdate
+    NewsletterCreate, NewsletterUpdate, NewsletterDashboard,
+    CollectionRunResponse, CollectionSourceRunResponse,
+    DurationEnum, PriceRangeEnum, PrimaryCategoryEnum
 )
-from app.services.newsletter_collector import CollectionScheduler
+from app.services.near_duplicate import NearDuplicateIndex
+from app.services.tag_index import filter_by_tags, sync_tags, tag_counts
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/newsletters", tags=["newsletters"])
 
 
+def _newsletter_response(newsletter: Newsletter) -> NewsletterResponse:
+    """Newsletter 모델 → 목록용 응답 스키마"""
+    return NewsletterResponse(
+        id=newsletter.id,
+        title=newsletter.title,
+        summary=newsletter.summary,
+        source=newsletter.source,
+        source_url=newsletter.source_url,
+        primary_category=newsletter.primary_category,
+        secondary_category=newsletter.secondary_category,
+        tags=newsletter.tags or [],
+        location_display=newsletter.location_display,
+        duration_display=newsletter.duration_display,
+        price_display=newsletter.price_display,
+        quality_score=newsletter.quality_score,
+        views=newsletter.views,
+        published_date=newsletter.published_date,
+        collected_date=newsletter.collected_date
+    )
+
+
 @router.get("/", response_model=NewsletterListResponse)
 async def get_newsletters(
     page: int = Query(1, ge=1, description="페이지 번호"),
@@ -28,13 +57,18 @@ async def get_newsletters(
     query: Optional[str] = Query(None, min_length=1, max_length=100, description="검색 키워드"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     source: Optional[str] = Query(None, description="소스 필터"),
+    country: Optional[str] = Query(None, max_length=50, description="국가 필터"),
+    duration: Optional[DurationEnum] = Query(None, description="프로그램 기간 필터"),
+    price_range: Optional[PriceRangeEnum] = Query(None, description="가격대 필터"),
+    tag: Optional[List[str]] = Query(None, description="태그 필터 (여러 개 지정 가능)"),
+    tag_mode: str = Query("all", pattern="^(all|any)$", description="다중 태그 조건 (all: AND, any: OR)"),
     sort_by: str = Query("collected_date", description="정렬 기준"),
     sort_order: str = Query("desc", description="정렬 순서 (asc/desc)"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     뉴스레터 목록 조회
-    검색, 필터링, 페이징, 정렬 지원
+    검색, 필터링(카테고리/소스/국가/기간/가격대/태그), 페이징, 정렬 지원
     """
     try:
         # 기본 쿼리
@@ -46,7 +80,7 @@ async def get_newsletters(
                 or_(
                     Newsletter.title.contains(query),
                     Newsletter.summary.contains(query),
-                    Newsletter.content.contains(query)
+                    Newsletter.content_text.contains(query)  # 마크업 없는 평문에서 검색
                 )
             )
         
@@ -58,6 +92,18 @@ async def get_newsletters(
         if source:
             base_query = base_query.filter(Newsletter.source == source)
         
+        # 구조화 필터 (인덱스 컬럼 사용)
+        if country:
+            base_query = base_query.filter(Newsletter.country == country)
+        if duration:
+            base_query = base_query.filter(Newsletter.duration == duration.value)
+        if price_range:
+            base_query = base_query.filter(Newsletter.price_range == price_range.value)
+        
+        # 태그 필터 (newsletter_tags 역색인 사용)
+        if tag:
+            base_query = filter_by_tags(base_query, tag, match_all=(tag_mode == "all"))
+        
         # 정렬 적용
         sort_column = getattr(Newsletter, sort_by, Newsletter.collected_date)
         if sort_order.lower() == "desc":
@@ -73,26 +119,7 @@ async def get_newsletters(
         newsletters = base_query.offset(offset).limit(per_page).all()
         
         # 응답 데이터 구성
-        newsletter_responses = []
-        for newsletter in newsletters:
-            newsletter_response = NewsletterResponse(
-                id=newsletter.id,
-                title=newsletter.title,
-                summary=newsletter.summary,
-                source=newsletter.source,
-                source_url=newsletter.source_url,
-                primary_category=newsletter.primary_category,
-                secondary_category=newsletter.secondary_category,
-                tags=newsletter.tags or [],
-                location_display=newsletter.location_display,
-                duration_display=newsletter.duration_display,
-                price_display=newsletter.price_display,
-                quality_score=newsletter.quality_score,
-                views=newsletter.views,
-                published_date=newsletter.published_date,
-                collected_date=newsletter.collected_date
-            )
-            newsletter_responses.append(newsletter_response)
+        newsletter_responses = [_newsletter_response(newsletter) for newsletter in newsletters]
         
         # 페이지 정보 계산
         total_pages = (total + per_page - 1) // per_page
@@ -110,6 +137,95 @@ async def get_newsletters(
         raise HTTPException(status_code=500, detail="뉴스레터 목록을 조회할 수 없습니다")
 
 
+def _top_per_category(db: Session, per_category: int) -> dict:
+    """
+    카테고리별 최신 뉴스레터 N개
+    ROW_NUMBER() OVER (PARTITION BY primary_category ...) 윈도우 쿼리 한 번으로 조회
+    """
+    from sqlalchemy import func
+    
+    categories = [category.value for category in PrimaryCategoryEnum]
+    ranked = db.query(
+        Newsletter.id.label("id"),
+        func.row_number().over(
+            partition_by=Newsletter.primary_category,
+            order_by=Newsletter.collected_date.desc()
+        ).label("rank")
+    ).filter(
+        Newsletter.is_active == True,
+        Newsletter.primary_category.in_(categories)
+    ).subquery()
+    
+    newsletters = db.query(Newsletter).join(
+        ranked, ranked.c.id == Newsletter.id
+    ).filter(
+        ranked.c.rank <= per_category
+    ).order_by(Newsletter.primary_category, ranked.c.rank).all()
+    
+    result = {category: [] for category in categories}
+    for newsletter in newsletters:
+        result[newsletter.primary_category].append(_newsletter_response(newsletter))
+    return result
+
+
+@router.get("/dashboard", response_model=NewsletterDashboard)
+async def get_dashboard(
+    request: Request,
+    per_category: int = Query(5, ge=1, le=20, description="카테고리별 뉴스레터 수"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    메인 페이지 대시보드
+    카테고리별 최신 뉴스레터와 통계를 한 응답으로 제공하고, 데이터 버전 단위로 통째로 캐시
+    """
+    try:
+        version = get_data_version()
+        cache_key = f"dashboard:{per_category}"
+        page = page_cache.get(cache_key, version)
+        
+        if page is None:
+            dashboard = NewsletterDashboard(
+                categories=_top_per_category(db, per_category),
+                stats=_collect_stats(db),
+                data_version=version
+            )
+            page = page_cache.set(
+                cache_key, version, dashboard.model_dump_json().encode("utf-8"),
+                media_type="application/json"
+            )
+        
+        return cached_page_response(page, request)
+        
+    except Exception as e:
+        logger.error(f"대시보드 조회 오류: {e}")
+        raise HTTPException(status_code=500, detail="대시보드를 조회할 수 없습니다")
+
+
+@router.get("/stream")
+async def stream_newsletters(request: Request):
+    """
+    새로 수집된 뉴스레터와 수집 진행 상황 실시간 스트림 (Server-Sent Events)
+    이벤트: newsletter, collection_started, collection_progress, collection_completed
+    """
+    subscription = event_broker.subscribe()
+    
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                event = await subscription.get(timeout=settings.SSE_HEARTBEAT_SECONDS)
+                # 이벤트가 없으면 프록시가 연결을 끊지 않도록 주석 전송
+                yield event.encode() if event is not None else ": ping\n\n"
+        finally:
+            event_broker.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/{newsletter_id}", response_model=NewsletterDetailResponse)
 async def get_newsletter_detail(
     newsletter_id: str = Path(..., description="뉴스레터 ID"),
@@ -162,7 +278,7 @@ async def get_newsletter_detail(
 
 
 @router.get("/categories/", response_model=List[dict])
-async def get_categories(db: Session = Depends(get_db)):
+async def get_categories(db: Session = Depends(get_read_db)):
     """
     사용 가능한 카테고리 목록 조회
     카테고리별 뉴스레터 개수 포함
@@ -192,7 +308,7 @@ async def get_categories(db: Session = Depends(get_db)):
 
 
 @router.get("/sources/", response_model=List[dict])
-async def get_sources(db: Session = Depends(get_db)):
+async def get_sources(db: Session = Depends(get_read_db)):
     """
     뉴스레터 소스 목록 조회
     소스별 뉴스레터 개수 포함
@@ -218,10 +334,27 @@ async def get_sources(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="소스를 조회할 수 없습니다")
 
 
+@router.get("/tags/", response_model=List[dict])
+async def get_tags(
+    limit: int = Query(50, ge=1, le=200, description="조회할 태그 개수"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    태그 클라우드 조회
+    태그별 활성 뉴스레터 개수 (많은 순)
+    """
+    try:
+        return tag_counts(db, limit=limit)
+        
+    except Exception as e:
+        logger.error(f"태그 조회 오류: {e}")
+        raise HTTPException(status_code=500, detail="태그를 조회할 수 없습니다")
+
+
 @router.get("/popular/", response_model=List[NewsletterResponse])
 async def get_popular_newsletters(
     limit: int = Query(10, ge=1, le=50, description="조회할 인기 뉴스레터 개수"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     인기 뉴스레터 조회 (조회수 기준)
@@ -232,23 +365,7 @@ async def get_popular_newsletters(
         ).order_by(desc(Newsletter.views)).limit(limit).all()
         
         return [
-            NewsletterResponse(
-                id=newsletter.id,
-                title=newsletter.title,
-                summary=newsletter.summary,
-                source=newsletter.source,
-                source_url=newsletter.source_url,
-                primary_category=newsletter.primary_category,
-                secondary_category=newsletter.secondary_category,
-                tags=newsletter.tags or [],
-                location_display=newsletter.location_display,
-                duration_display=newsletter.duration_display,
-                price_display=newsletter.price_display,
-                quality_score=newsletter.quality_score,
-                views=newsletter.views,
-                published_date=newsletter.published_date,
-                collected_date=newsletter.collected_date
-            )
+            _newsletter_response(newsletter)
             for newsletter in newsletters
         ]
         
@@ -260,7 +377,7 @@ async def get_popular_newsletters(
 @router.get("/recent/", response_model=List[NewsletterResponse])
 async def get_recent_newsletters(
     limit: int = Query(10, ge=1, le=50, description="조회할 최신 뉴스레터 개수"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     최신 뉴스레터 조회 (수집일 기준)
@@ -271,23 +388,7 @@ async def get_recent_newsletters(
         ).order_by(desc(Newsletter.collected_date)).limit(limit).all()
         
         return [
-            NewsletterResponse(
-                id=newsletter.id,
-                title=newsletter.title,
-                summary=newsletter.summary,
-                source=newsletter.source,
-                source_url=newsletter.source_url,
-                primary_category=newsletter.primary_category,
-                secondary_category=newsletter.secondary_category,
-                tags=newsletter.tags or [],
-                location_display=newsletter.location_display,
-                duration_display=newsletter.duration_display,
-                price_display=newsletter.price_display,
-                quality_score=newsletter.quality_score,
-                views=newsletter.views,
-                published_date=newsletter.published_date,
-                collected_date=newsletter.collected_date
-            )
+            _newsletter_response(newsletter)
             for newsletter in newsletters
         ]
         
@@ -296,60 +397,65 @@ async def get_recent_newsletters(
         raise HTTPException(status_code=500, detail="최신 뉴스레터를 조회할 수 없습니다")
 
 
+def _collect_stats(db: Session) -> NewsletterStats:
+    """통계 집계 (/stats/, /dashboard 공용)"""
+    from sqlalchemy import func
+    from datetime import datetime, timedelta
+    
+    # 기본 통계
+    total_newsletters = db.query(func.count(Newsletter.id)).scalar()
+    active_newsletters = db.query(func.count(Newsletter.id)).filter(
+        Newsletter.is_active == True
+    ).scalar()
+    
+    # 소스 통계
+    total_sources = db.query(func.count(NewsletterSource.id)).scalar()
+    active_sources = db.query(func.count(NewsletterSource.id)).filter(
+        NewsletterSource.is_active == True
+    ).scalar()
+    
+    # 평균 품질 점수
+    avg_quality = db.query(func.avg(Newsletter.quality_score)).filter(
+        Newsletter.is_active == True
+    ).scalar() or 0.0
+    
+    # 카테고리별 분포
+    categories = db.query(
+        Newsletter.primary_category,
+        func.count(Newsletter.id).label('count')
+    ).filter(
+        and_(Newsletter.is_active == True, Newsletter.primary_category.isnot(None))
+    ).group_by(Newsletter.primary_category).all()
+    
+    categories_distribution = {
+        category.primary_category: category.count
+        for category in categories
+    }
+    
+    # 최근 24시간 수집량
+    yesterday = datetime.now() - timedelta(days=1)
+    recent_count = db.query(func.count(Newsletter.id)).filter(
+        Newsletter.collected_date >= yesterday
+    ).scalar()
+    
+    return NewsletterStats(
+        total_newsletters=total_newsletters or 0,
+        active_newsletters=active_newsletters or 0,
+        total_sources=total_sources or 0,
+        active_sources=active_sources or 0,
+        avg_quality_score=float(avg_quality),
+        categories_distribution=categories_distribution,
+        recent_collection_count=recent_count or 0
+    )
+
+
 @router.get("/stats/", response_model=NewsletterStats)
-async def get_newsletter_stats(db: Session = Depends(get_db)):
+async def get_newsletter_stats(db: Session = Depends(get_read_db)):
     """
     뉴스레터 통계 정보 조회
     """
     try:
-        from sqlalchemy import func
-        from datetime import datetime, timedelta
-        
-        # 기본 통계
-        total_newsletters = db.query(func.count(Newsletter.id)).scalar()
-        active_newsletters = db.query(func.count(Newsletter.id)).filter(
-            Newsletter.is_active == True
-        ).scalar()
-        
-        # 소스 통계
-        total_sources = db.query(func.count(NewsletterSource.id)).scalar()
-        active_sources = db.query(func.count(NewsletterSource.id)).filter(
-            NewsletterSource.is_active == True
-        ).scalar()
-        
-        # 평균 품질 점수
-        avg_quality = db.query(func.avg(Newsletter.quality_score)).filter(
-            Newsletter.is_active == True
-        ).scalar() or 0.0
-        
-        # 카테고리별 분포
-        categories = db.query(
-            Newsletter.primary_category,
-            func.count(Newsletter.id).label('count')
-        ).filter(
-            and_(Newsletter.is_active == True, Newsletter.primary_category.isnot(None))
-        ).group_by(Newsletter.primary_category).all()
-        
-        categories_distribution = {
-            category.primary_category: category.count
-            for category in categories
-        }
-        
-        # 최근 24시간 수집량
-        yesterday = datetime.now() - timedelta(days=1)
-        recent_count = db.query(func.count(Newsletter.id)).filter(
-            Newsletter.collected_date >= yesterday
-        ).scalar()
-        
-        return NewsletterStats(
-            total_newsletters=total_newsletters or 0,
-            active_newsletters=active_newsletters or 0,
-            total_sources=total_sources or 0,
-            active_sources=active_sources or 0,
-            avg_quality_score=float(avg_quality),
-            categories_distribution=categories_distribution,
-            recent_collection_count=recent_count or 0
-        )
+        return _collect_stats(db)
         
     except Exception as e:
         logger.error(f"통계 조회 오류: {e}")
@@ -358,28 +464,87 @@ async def get_newsletter_stats(db: Session = Depends(get_db)):
 
 # 관리자용 API들
 @router.post("/collect/")
-async def trigger_collection(db: Session = Depends(get_db)):
+async def trigger_collection(
+    memory_profile: Optional[bool] = Query(None, description="소스별 메모리 측정 (기본값: COLLECTION_MEMORY_PROFILING)"),
+    db: Session = Depends(get_db)
+):
     """
     수동 뉴스레터 수집 실행 (관리자용)
+    memory_profile=true 이면 결과의 memory에 소스별 최대 메모리/상위 할당 위치 포함
     """
+    # 수집기는 첫 수집 요청 때 로드 (API 전용 워커의 시작 시간 단축)
+    from app.services.newsletter_collector import CollectionScheduler, CollectionInProgressError
+    
     try:
         scheduler = CollectionScheduler(db)
-        result = await scheduler.run_collection()
+        result = await scheduler.run_collection(memory_profile=memory_profile)
         
         return {
             "message": "뉴스레터 수집이 완료되었습니다",
             "result": result
         }
         
+    except CollectionInProgressError:
+        raise HTTPException(status_code=409, detail="이미 수집이 진행 중입니다")
     except Exception as e:
         logger.error(f"수집 실행 오류: {e}")
         raise HTTPException(status_code=500, detail="수집을 실행할 수 없습니다")
 
 
+@router.get("/collect/runs", response_model=List[CollectionRunResponse])
+async def get_collection_runs(
+    limit: int = Query(20, ge=1, le=200, description="조회할 최근 실행 수"),
+    source: Optional[str] = Query(None, description="이 소스의 기록만 포함"),
+    include_sources: bool = Query(True, description="소스별 단계 기록 포함"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    최근 수집 실행 기록 (관리자용)
+    소스별 단계 시간(fetch/parse/filter/dedup/enrich/persist)으로 병목 소스/단계 확인
+    """
+    try:
+        runs = db.query(CollectionRun).order_by(desc(CollectionRun.id)).limit(limit).all()
+        
+        # 소스별 기록은 한 번에 조회해서 실행별로 묶기
+        source_runs = {}
+        if include_sources and runs:
+            query = db.query(CollectionSourceRun).filter(
+                CollectionSourceRun.run_id.in_([run.id for run in runs])
+            )
+            if source:
+                query = query.filter(CollectionSourceRun.source == source)
+            for source_run in query.order_by(CollectionSourceRun.id).all():
+                source_runs.setdefault(source_run.run_id, []).append(
+                    CollectionSourceRunResponse.from_orm(source_run)
+                )
+        
+        return [
+            CollectionRunResponse(
+                id=run.id,
+                trigger=run.trigger,
+                status=run.status,
+                started_at=run.started_at,
+                finished_at=run.finished_at,
+                duration_seconds=run.duration_seconds,
+                sources_total=run.sources_total or 0,
+                newsletters_collected=run.newsletters_collected or 0,
+                errors=run.errors or 0,
+                error_message=run.error_message,
+                sources=source_runs.get(run.id, [])
+            )
+            for run in runs
+        ]
+        
+    except Exception as e:
+        logger.error(f"수집 실행 기록 조회 오류: {e}")
+        raise HTTPException(status_code=500, detail="수집 실행 기록을 조회할 수 없습니다")
+
+
 @router.put("/{newsletter_id}", response_model=NewsletterDetailResponse)
 async def update_newsletter(
     newsletter_id: str,
     newsletter_update: NewsletterUpdate,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
@@ -396,8 +561,14 @@ async def update_newsletter(
         for field, value in update_data.items():
             setattr(newsletter, field, value)
         
+        # 태그 변경 시 역색인 동기화
+        if "tags" in update_data:
+            sync_tags(db, newsletter)
+        
         db.commit()
         db.refresh(newsletter)
+        mark_primary_reads(response)
+        bump_data_version()
         
         return NewsletterDetailResponse.from_orm(newsletter)
         
@@ -411,6 +582,7 @@ async def update_newsletter(
 @router.delete("/{newsletter_id}")
 async def delete_newsletter(
     newsletter_id: str,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
@@ -424,7 +596,12 @@ async def delete_newsletter(
             raise HTTPException(status_code=404, detail="뉴스레터를 찾을 수 없습니다")
         
         newsletter.is_active = False
+        
+        # 근사 중복 인덱스에서 제거 (삭제된 기사와 비교해 새 기사를 거부하지 않도록)
+        NearDuplicateIndex().remove(db, [newsletter.id])
         db.commit()
+        mark_primary_reads(response)
+        bump_data_version()
         
         return {"message": "뉴스레터가 삭제되었습니다"}
         
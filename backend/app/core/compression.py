@@ -0,0 +1,266 @@
+"""
+응답 압축 미들웨어
+API JSON/HTML 응답을 gzip 또는 brotli로 압축하고 전송 바이트와 CPU 비용을 집계
+"""
+import threading
+import time
+import zlib
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # 선택 의존성: 없으면 gzip만 사용
+except ImportError:
+    brotli = None
+
+DEFAULT_COMPRESSIBLE_TYPES: FrozenSet[str] = frozenset({
+    "application/json",
+    "application/javascript",
+    "application/x-ndjson",
+    "application/xml",
+    "image/svg+xml",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+    "text/xml",
+})
+
+# 스트림 이벤트는 청크 단위 즉시 전달이 중요하므로 허용 목록과 무관하게 제외
+_NEVER_COMPRESS_TYPES: FrozenSet[str] = frozenset({"text/event-stream"})
+_SKIP_STATUS_CODES = {204, 206, 304}
+
+
+class CompressionStats:
+    """인코딩별 압축 통계 (원본/전송 바이트, 압축 CPU 시간)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._encodings: Dict[str, Dict[str, float]] = {}
+        self.skipped = 0
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int, cpu_seconds: float, streamed: bool = False) -> None:
+        with self._lock:
+            entry = self._encodings.setdefault(encoding, {
+                "responses": 0, "streamed": 0, "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0,
+            })
+            entry["responses"] += 1
+            entry["streamed"] += int(streamed)
+            entry["bytes_in"] += bytes_in
+            entry["bytes_out"] += bytes_out
+            entry["cpu_seconds"] += cpu_seconds
+
+    def record_skip(self) -> None:
+        with self._lock:
+            self.skipped += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """헬스 체크/벤치마크용 요약"""
+        with self._lock:
+            encodings = {}
+            for encoding, entry in self._encodings.items():
+                bytes_in = entry["bytes_in"]
+                encodings[encoding] = {
+                    **entry,
+                    "cpu_ms": round(entry["cpu_seconds"] * 1000, 3),
+                    "ratio": round(entry["bytes_out"] / bytes_in, 4) if bytes_in else None,
+                    "cpu_us_per_kb": round(entry["cpu_seconds"] * 1e6 / (bytes_in / 1024), 2) if bytes_in else None,
+                }
+                del encodings[encoding]["cpu_seconds"]
+            return {"encodings": encodings, "skipped": self.skipped}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._encodings.clear()
+            self.skipped = 0
+
+
+class _Compressor:
+    """gzip/brotli 공통 인터페이스"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._impl = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._impl = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)  # wbits 31 = gzip 헤더
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        """청크 압축 (flush=True면 지금까지의 출력을 내보내 스트리밍 지연을 막음)"""
+        if self.encoding == "br":
+            out = self._impl.process(data)
+            return out + self._impl.flush() if flush else out
+        out = self._impl.compress(data)
+        return out + self._impl.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self) -> bytes:
+        return self._impl.finish() if self.encoding == "br" else self._impl.flush()
+
+
+def accepted_encodings(accept_encoding: str) -> Set[str]:
+    """Accept-Encoding에서 클라이언트가 받는 인코딩 목록 (q=0으로 거부한 인코딩 제외)"""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        name, _, value = params.replace(" ", "").partition("=")
+        if name.lower() == "q":
+            try:
+                if float(value) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(token)
+    return accepted
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding에서 사용할 인코딩 선택 (brotli 우선, q=0 제외)"""
+    accepted = accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    """
+    순수 ASGI 압축 미들웨어
+    최소 크기/Content-Type 허용 목록 적용, 스트리밍 응답은 청크 단위로 압축
+    이미 Content-Encoding이 있는 응답(사전 압축 정적 파일, 캐시 페이지)은 그대로 전달
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        compressible_types: FrozenSet[str] = DEFAULT_COMPRESSIBLE_TYPES,
+        stats: Optional[CompressionStats] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.compressible_types = compressible_types - _NEVER_COMPRESS_TYPES
+        self.stats = stats if stats is not None else compression_stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """요청 하나의 응답 메시지를 가로채 압축 여부를 결정"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[_Compressor] = None
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_seconds = 0.0
+
+    def _is_compressible(self, message: Message) -> bool:
+        if message["status"] in _SKIP_STATUS_CODES:
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return media_type in self.middleware.compressible_types
+
+    def _compress(self, data: bytes, flush: bool = False, finish: bool = False) -> bytes:
+        started = time.thread_time()
+        out = self.compressor.compress(data, flush)
+        if finish:
+            out += self.compressor.finish()
+        self.cpu_seconds += time.thread_time() - started
+        self.bytes_in += len(data)
+        self.bytes_out += len(out)
+        return out
+
+    def _compressed_headers(self, content_length: Optional[int]) -> List[Tuple[bytes, bytes]]:
+        headers = MutableHeaders(raw=list(self.start_message["headers"]))
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        # 인코딩이 바뀌면 바이트가 달라지므로 강한 ETag를 약한 ETag로 변경
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        return headers.raw
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            self.start_message = message
+            if not self._is_compressible(message):
+                self.passthrough = True
+                await self._send(message)
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        stats = self.middleware.stats
+
+        if self.compressor is None:
+            # 첫 본문 청크: 단일 응답은 크기 기준으로 판단, 스트리밍은 무조건 압축
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                stats.record_skip()
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+
+            self.compressor = _Compressor(self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+            if not more_body:
+                compressed = self._compress(body, finish=True)
+                self.start_message["headers"] = self._compressed_headers(len(compressed))
+                await self._send(self.start_message)
+                await self._send({"type": "http.response.body", "body": compressed})
+                stats.record(self.encoding, self.bytes_in, self.bytes_out, self.cpu_seconds)
+                return
+
+            self.start_message["headers"] = self._compressed_headers(None)
+            await self._send(self.start_message)
+
+        if more_body:
+            chunk = self._compress(body, flush=True)
+            if chunk:
+                await self._send({"type": "http.response.body", "body": chunk, "more_body": True})
+            return
+
+        await self._send({"type": "http.response.body", "body": self._compress(body, finish=True)})
+        stats.record(self.encoding, self.bytes_in, self.bytes_out, self.cpu_seconds, streamed=True)
+
+
+# 전역 압축 통계 인스턴스
+compression_stats = CompressionStats()
@@ -3,7 +3,7 @@
 환경변수 기반 설정 관리
 """
 import os
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -18,6 +18,15 @@ class Settings(BaseSettings):
     # 데이터베이스 설정
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./wellness_newsletter.db")
     SQL_ECHO: bool = os.getenv("SQL_ECHO", "false").lower() == "true"
+    READ_DATABASE_URL: Optional[str] = os.getenv("READ_DATABASE_URL")  # 읽기 전용 레플리카 (선택)
+    READ_YOUR_WRITES_SECONDS: int = int(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+    
+    # SQL 프로파일링 설정 (요청별 문장 수/DB 시간 집계, Server-Timing 헤더)
+    SQL_PROFILING_ENABLED: bool = os.getenv("SQL_PROFILING_ENABLED", "false").lower() == "true"
+    SQL_SERVER_TIMING: bool = os.getenv("SQL_SERVER_TIMING", "true").lower() == "true"  # 프로파일링 중일 때 헤더 추가 (문장 수/시간만)
+    SQL_SERVER_TIMING_STATEMENTS: bool = os.getenv("SQL_SERVER_TIMING_STATEMENTS", "false").lower() == "true"  # 헤더에 SQL 문장 포함 (로컬 디버그 전용)
+    SQL_SLOW_QUERY_MS: float = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))  # 느린 쿼리 경고 임계값 (0이면 미사용)
+    SQL_N_PLUS_ONE_THRESHOLD: int = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))  # 같은 SELECT 반복 경고 횟수
     
     # API 설정
     API_PREFIX: str = "/api/v1"
@@ -34,12 +43,58 @@ class Settings(BaseSettings):
     # 뉴스레터 수집 설정
     COLLECTION_ENABLED: bool = os.getenv("COLLECTION_ENABLED", "true").lower() == "true"
     COLLECTION_INTERVAL_HOURS: int = int(os.getenv("COLLECTION_INTERVAL_HOURS", "24"))
+    # 서버 시작 시 예약 수집 루프 실행 여부 (명시적으로 켜야 함, 꺼져 있으면 수동 수집만)
+    SCHEDULED_COLLECTION_ENABLED: bool = os.getenv("SCHEDULED_COLLECTION_ENABLED", "false").lower() == "true"
     MAX_CONTENT_LENGTH: int = int(os.getenv("MAX_CONTENT_LENGTH", "50000"))  # 50KB
+    COLLECTION_RUN_HISTORY: int = int(os.getenv("COLLECTION_RUN_HISTORY", "500"))  # 보관할 수집 실행 기록 수 (0이면 무제한)
+    
+    # 수집 메모리 프로파일링 (tracemalloc, 켜면 수집이 눈에 띄게 느려지므로 진단할 때만)
+    COLLECTION_MEMORY_PROFILING: bool = os.getenv("COLLECTION_MEMORY_PROFILING", "false").lower() == "true"
+    COLLECTION_MEMORY_TOP: int = int(os.getenv("COLLECTION_MEMORY_TOP", "5"))  # 소스별 상위 할당 위치 수
+    COLLECTION_MEMORY_WARN_MB: float = float(os.getenv("COLLECTION_MEMORY_WARN_MB", "200"))  # 소스별 최대 사용량 경고 기준
+    
+    # 멀티 워커 설정 (파일 잠금 기반 리더 선출)
+    LEADER_LOCK_FILE: str = os.getenv("LEADER_LOCK_FILE", "logs/collection_leader.lock")  # 예약 수집 리더
+    COLLECTION_LOCK_FILE: str = os.getenv("COLLECTION_LOCK_FILE", "logs/collection_run.lock")  # 수집 동시 실행 방지
+    BOOTSTRAP_LOCK_FILE: str = os.getenv("BOOTSTRAP_LOCK_FILE", "logs/bootstrap.lock")  # 시작 시 테이블 생성 직렬화
+    LEADER_POLL_SECONDS: int = int(os.getenv("LEADER_POLL_SECONDS", "30"))  # 리더 확인/수집 주기 점검 간격
     
     # 품질 관리 설정
     MIN_QUALITY_SCORE: float = float(os.getenv("MIN_QUALITY_SCORE", "0.3"))
     DEFAULT_QUALITY_WEIGHT: float = 1.0
     
+    # 근사 중복 검사 설정 (MinHash LSH)
+    NEAR_DUPLICATE_ENABLED: bool = os.getenv("NEAR_DUPLICATE_ENABLED", "true").lower() == "true"
+    NEAR_DUPLICATE_THRESHOLD: float = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.85"))  # 추정 자카드 유사도
+    
+    # 웹 소스 수집 이력 (이미 처리한 기사 URL: seen_urls 테이블 + 메모리 블룸 필터)
+    SEEN_URL_ENABLED: bool = os.getenv("SEEN_URL_ENABLED", "true").lower() == "true"
+    SEEN_URL_RETENTION_DAYS: int = int(os.getenv("SEEN_URL_RETENTION_DAYS", "90"))  # 이 기간 목록에서 안 보인 URL은 압축 때 삭제
+    SEEN_URL_COMPACT_INTERVAL_HOURS: int = int(os.getenv("SEEN_URL_COMPACT_INTERVAL_HOURS", "24"))
+    SEEN_URL_BLOOM_CAPACITY: int = int(os.getenv("SEEN_URL_BLOOM_CAPACITY", "100000"))  # 최소 용량 (저장된 URL 수의 2배가 더 크면 그 값)
+    SEEN_URL_BLOOM_ERROR_RATE: float = float(os.getenv("SEEN_URL_BLOOM_ERROR_RATE", "0.01"))  # 오탐률 (오탐은 DB에서 한 번 더 확인)
+    
+    # 요청 제한 설정 (sqlite:// 는 워커 간 공유되는 WAL 카운터, memory:// 는 프로세스별)
+    RATE_LIMIT_STORAGE_URI: str = os.getenv("RATE_LIMIT_STORAGE_URI", "sqlite:///logs/rate_limits.db")
+    RATE_LIMIT_STRATEGY: str = os.getenv("RATE_LIMIT_STRATEGY", "sliding-window-counter")  # fixed-window / sliding-window-counter
+    
+    # 캐시 설정
+    DATA_VERSION_FILE: str = os.getenv("DATA_VERSION_FILE", "logs/data_version")  # 워커 간 공유 데이터 버전
+    LANDING_RATE_LIMIT: str = os.getenv("LANDING_RATE_LIMIT", "120/minute")  # 메인 페이지 요청 제한
+    
+    # 응답 압축 설정
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "500"))  # 이보다 작은 응답은 압축하지 않음 (바이트)
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+    
+    # 실시간 스트림(SSE) 설정
+    SSE_QUEUE_SIZE: int = int(os.getenv("SSE_QUEUE_SIZE", "100"))  # 구독자별 최대 대기 이벤트 수
+    SSE_HEARTBEAT_SECONDS: int = int(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))  # 연결 유지용 주석 전송 간격
+    
+    # 메트릭 설정 (/metrics, Prometheus 텍스트 형식)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    
     # 페이징 설정
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
@@ -53,6 +108,13 @@ class Settings(BaseSettings):
     REQUEST_DELAY: float = float(os.getenv("REQUEST_DELAY", "1.0"))  # 요청 간격 (초)
     REQUEST_TIMEOUT: int = int(os.getenv("REQUEST_TIMEOUT", "30"))  # 요청 타임아웃 (초)
     
+    # 외부 요청 연결 풀 설정 (수집 실행 간 연결 재사용)
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))  # 유휴 연결 유지 시간 (초)
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "true").lower() == "true"  # h2 패키지가 있을 때만 적용
+    DNS_CACHE_TTL: float = float(os.getenv("DNS_CACHE_TTL", "300"))  # 호스트 이름 해석 캐시 (초, 0이면 미사용)
+    
     # RSS 피드 설정
     RSS_TIMEOUT: int = int(os.getenv("RSS_TIMEOUT", "30"))
     RSS_USER_AGENT: str = "WellnessNewsletterRSSBot/1.0"
@@ -0,0 +1,41 @@
+"""
+데이터 버전 관리
+수집/관리자 수정 등 화면에 보이는 데이터가 바뀔 때 버전을 올려 캐시를 무효화
+버전은 파일에 저장하므로 여러 워커 프로세스가 같은 값을 본다
+"""
+import logging
+import os
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_data_version() -> str:
+    """현재 데이터 버전 (파일이 없으면 "0")"""
+    try:
+        with open(settings.DATA_VERSION_FILE, encoding="utf-8") as f:
+            return f.read().strip() or "0"
+    except FileNotFoundError:
+        return "0"
+
+
+def bump_data_version() -> str:
+    """
+    데이터 버전 갱신
+    프로세스마다 고유한 값을 원자적으로 기록해 동시 갱신에도 이전 버전과 겹치지 않음
+    """
+    version = f"{time.time_ns()}-{os.getpid()}"
+    version_dir = os.path.dirname(settings.DATA_VERSION_FILE)
+    if version_dir:
+        os.makedirs(version_dir, exist_ok=True)
+    
+    tmp_path = f"{settings.DATA_VERSION_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(version)
+        os.replace(tmp_path, settings.DATA_VERSION_FILE)
+    except OSError as e:
+        logger.warning(f"데이터 버전 갱신 실패: {e}")
+    return version
@@ -2,12 +2,19 @@
 데이터베이스 설정 및 연결 관리
 SQLAlchemy를 사용한 데이터베이스 설정
 """
+import hashlib
+import logging
 import os
-from sqlalchemy import create_engine
+import time
+from fastapi import Request, Response
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
-from typing import Generator
+from sqlalchemy.schema import CreateIndex, CreateTable
+from typing import Generator, List, Optional
+
+logger = logging.getLogger(__name__)
 
 # 환경변수에서 데이터베이스 URL 가져오기 (기본값: SQLite)
 DATABASE_URL = os.getenv(
@@ -15,23 +22,69 @@ DATABASE_URL = os.getenv(
     "sqlite:///./wellness_newsletter.db"
 )
 
+# 읽기 전용 레플리카 URL (선택, 미설정 시 SQLite는 mode=ro 연결 사용)
+READ_DATABASE_URL = os.getenv("READ_DATABASE_URL")
+
+# 쓰기 직후 읽기를 주 DB로 보내는 기간 (레플리카 지연 대비, 초)
+READ_YOUR_WRITES_SECONDS = int(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+PRIMARY_READ_COOKIE = "db_primary_until"
+
+SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() == "true"  # 개발시 SQL 로그
+
 # SQLite 사용 시 특별 설정
 if DATABASE_URL.startswith("sqlite"):
     engine = create_engine(
         DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
-        echo=os.getenv("SQL_ECHO", "false").lower() == "true"  # 개발시 SQL 로그
+        echo=SQL_ECHO
     )
+    
+    @event.listens_for(engine, "connect")
+    def _enable_wal(dbapi_connection, connection_record):
+        """WAL 모드: 읽기 연결이 수집 쓰기에 막히지 않도록 설정"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
 else:
     # PostgreSQL 등 다른 DB 사용 시
     engine = create_engine(
         DATABASE_URL,
-        echo=os.getenv("SQL_ECHO", "false").lower() == "true"
+        echo=SQL_ECHO
     )
 
+
+def _sqlite_read_only_url(url: str) -> Optional[str]:
+    """파일 기반 SQLite URL을 읽기 전용(mode=ro) URI로 변환"""
+    path = url.split(":///", 1)[1] if ":///" in url else ""
+    if not path or path.startswith(":memory:") or path.startswith("file:"):
+        return None
+    return f"sqlite:///file:{path}?mode=ro&uri=true"
+
+
+def _create_read_engine():
+    """읽기 전용 엔진 생성 (불가능하면 주 엔진 공유)"""
+    if READ_DATABASE_URL:
+        connect_args = {"check_same_thread": False} if READ_DATABASE_URL.startswith("sqlite") else {}
+        return create_engine(READ_DATABASE_URL, connect_args=connect_args, echo=SQL_ECHO)
+    
+    if DATABASE_URL.startswith("sqlite"):
+        read_only_url = _sqlite_read_only_url(DATABASE_URL)
+        if read_only_url:
+            return create_engine(
+                read_only_url,
+                connect_args={"check_same_thread": False},
+                echo=SQL_ECHO
+            )
+    
+    return engine
+
+
+read_engine = _create_read_engine()
+
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 # Base 모델 (models에서 import해서 사용)
 Base = declarative_base()
@@ -39,7 +92,7 @@ Base = declarative_base()
 
 def get_db() -> Generator:
     """
-    데이터베이스 세션 의존성
+    데이터베이스 세션 의존성 (주 DB, 쓰기용)
     FastAPI dependency로 사용
     """
     db = SessionLocal()
@@ -49,13 +102,150 @@ def get_db() -> Generator:
         db.close()
 
 
-def create_tables():
+def prefers_primary(request: Request) -> bool:
+    """
+    읽기 요청을 주 DB로 보내야 하는지 판단
+    최근 쓰기를 한 클라이언트(쿠키) 또는 X-Read-Consistency: primary 헤더
+    """
+    if request.headers.get("x-read-consistency", "").lower() == "primary":
+        return True
+    
+    primary_until = request.cookies.get(PRIMARY_READ_COOKIE)
+    if primary_until:
+        try:
+            return time.time() < float(primary_until)
+        except ValueError:
+            return False
+    return False
+
+
+def get_read_db(request: Request) -> Generator:
+    """
+    읽기 전용 데이터베이스 세션 의존성
+    GET 엔드포인트에서 사용, read-your-writes 조건이면 주 DB 사용
+    """
+    db = SessionLocal() if prefers_primary(request) else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def mark_primary_reads(response: Response) -> None:
+    """
+    쓰기 직후 일정 시간 동안 해당 클라이언트의 읽기를 주 DB로 고정
+    관리자 PUT/DELETE 응답에서 호출
+    """
+    primary_until = time.time() + READ_YOUR_WRITES_SECONDS
+    response.set_cookie(
+        PRIMARY_READ_COOKIE,
+        f"{primary_until:.3f}",
+        max_age=READ_YOUR_WRITES_SECONDS,
+        httponly=True,
+        samesite="lax"
+    )
+
+
+def upgrade_schema(metadata) -> List[str]:
+    """
+    기존 테이블에 누락된 컬럼/인덱스 추가
+    create_all은 기존 테이블을 변경하지 않으므로 모델에 추가된 컬럼을 보완
+    반환값: 추가된 "테이블.컬럼" 목록
+    """
+    inspector = inspect(engine)
+    added = []
+    
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                added.append(f"{table.name}.{column.name}")
+    
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    
+    if added:
+        logger.info(f"스키마 업그레이드: 컬럼 추가 {added}")
+    return added
+
+
+SCHEMA_META_TABLE = "schema_meta"
+
+
+def schema_fingerprint(metadata) -> str:
+    """모델 메타데이터(테이블/인덱스 DDL)의 해시 - 모델이 바뀌면 값이 달라진다"""
+    digest = hashlib.sha256()
+    for table in metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=engine.dialect)).encode("utf-8"))
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=engine.dialect)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _stored_schema_fingerprint() -> Optional[str]:
+    """마지막으로 스키마를 맞춘 시점의 지문 (없으면 None)"""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(
+                text(f"SELECT value FROM {SCHEMA_META_TABLE} WHERE key = 'fingerprint'")
+            ).scalar()
+    except Exception:
+        return None
+
+
+def _store_schema_fingerprint(fingerprint: str) -> None:
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {SCHEMA_META_TABLE} (key VARCHAR(64) PRIMARY KEY, value VARCHAR(128))"
+        ))
+        conn.execute(text(f"DELETE FROM {SCHEMA_META_TABLE} WHERE key = 'fingerprint'"))
+        conn.execute(
+            text(f"INSERT INTO {SCHEMA_META_TABLE} (key, value) VALUES ('fingerprint', :value)"),
+            {"value": fingerprint}
+        )
+
+
+def create_tables() -> bool:
     """
     모든 테이블 생성
     애플리케이션 시작 시 호출
+    스키마 지문이 저장된 값과 같으면 create_all/upgrade_schema(인스펙션)를 건너뛴다
+    반환값: 스키마 확인/업그레이드를 실제로 실행했는지 여부
     """
-    from app.models.newsletter import Base as NewsletterBase
+    from app.models.newsletter import Base as NewsletterBase, backfill_derived_columns
+    from app.services.html_cleaner import backfill_content_text
+    from app.services.tag_index import backfill_tags
+    
+    fingerprint = schema_fingerprint(NewsletterBase.metadata)
+    if _stored_schema_fingerprint() == fingerprint:
+        return False
+    
+    existing_tables = set(inspect(engine).get_table_names())
     NewsletterBase.metadata.create_all(bind=engine)
+    
+    added = upgrade_schema(NewsletterBase.metadata)
+    db = SessionLocal()
+    try:
+        if any(column.startswith("newsletters.") for column in added):
+            updated = backfill_derived_columns(db)
+            logger.info(f"파생 컬럼 백필 완료: {updated}개")
+        if "newsletters.content_text" in added:
+            updated = backfill_content_text(db)
+            logger.info(f"평문 본문 백필 완료: {updated}개")
+        if "newsletters" in existing_tables and "newsletter_tags" not in existing_tables:
+            backfill_tags(db)
+    finally:
+        db.close()
+    
+    _store_schema_fingerprint(fingerprint)
+    return True
 
 
 def drop_tables():
@@ -64,4 +254,6 @@ def drop_tables():
     테스트나 재설정 시 사용
     """
     from app.models.newsletter import Base as NewsletterBase
-    NewsletterBase.metadata.drop_all(bind=engine)
\ No newline at end of file
+    NewsletterBase.metadata.drop_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {SCHEMA_META_TABLE}"))
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+프로세스 내 이벤트 브로커
+수집기가 발행한 이벤트(새 뉴스레터, 수집 진행 상황)를 SSE 구독자들에게 전달
+구독자별 큐는 크기가 제한되어 있어 느린 클라이언트가 수집기를 막지 않는다 (가득 차면 오래된 이벤트부터 버림)
+"""
+import asyncio
+import itertools
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Event:
+    """SSE 이벤트 한 건"""
+
+    __slots__ = ("id", "type", "data")
+
+    def __init__(self, event_id: int, event_type: str, data: Dict[str, Any]):
+        self.id = event_id
+        self.type = event_type
+        self.data = data
+
+    def encode(self) -> str:
+        """text/event-stream 형식으로 직렬화"""
+        payload = json.dumps(self.data, ensure_ascii=False, default=str)
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    """구독자 한 명의 제한된 이벤트 큐"""
+
+    def __init__(self, maxsize: int, loop: asyncio.AbstractEventLoop):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.loop = loop
+        self.dropped = 0
+
+    def offer(self, event: Event) -> None:
+        """논블로킹 전달 (큐가 가득 차면 가장 오래된 이벤트를 버림)"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self.queue.put_nowait(event)
+            self.dropped += 1
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """다음 이벤트 (timeout 내에 없으면 None)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBroker:
+    """팬아웃 발행/구독 브로커"""
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.published = 0
+
+    def subscribe(self) -> Subscription:
+        """현재 이벤트 루프에 구독 등록"""
+        subscription = Subscription(self.queue_size, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+        if subscription.dropped:
+            logger.info(f"SSE 구독 종료: 느린 클라이언트로 이벤트 {subscription.dropped}개 버림")
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> int:
+        """
+        이벤트 발행 (구독자가 없으면 아무 일도 하지 않음)
+        다른 스레드에서 호출돼도 각 구독자의 이벤트 루프에서 큐에 넣는다
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+        if not subscribers:
+            return 0
+
+        event = Event(next(self._ids), event_type, {**data, "timestamp": datetime.now().isoformat()})
+        self.published += 1
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        for subscription in subscribers:
+            if subscription.loop is current_loop:
+                subscription.offer(event)
+            elif not subscription.loop.is_closed():
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+        return len(subscribers)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return {
+            "subscribers": len(subscribers),
+            "published": self.published,
+            "dropped": sum(subscription.dropped for subscription in subscribers),
+        }
+
+
+# 전역 이벤트 브로커 인스턴스
+event_broker = EventBroker(queue_size=settings.SSE_QUEUE_SIZE)
@@ -0,0 +1,265 @@
+"""
+외부 요청용 공유 HTTP 클라이언트
+수집기가 실행마다 새 httpx.AsyncClient를 만들지 않도록 애플리케이션 수명 동안 하나의 연결 풀을 유지
+- 연결 수/keep-alive 한도 조정, h2 패키지가 있으면 HTTP/2 사용
+- 호스트 이름 해석 결과를 TTL 동안 캐시 (같은 피드 호스트에 반복 연결할 때 DNS 조회 생략)
+- 새 연결(핸드셰이크) 수와 연결 재사용률 통계
+- 리다이렉트를 따라감 (이전에 RSS/robots.txt를 가져오던 feedparser/urllib과 같은 동작, 예: http → https 이전)
+httpx는 첫 사용 시점에 import (수집하지 않는 워커의 시작 시간 단축)
+DNS 캐시/연결 수 집계는 httpx 전송 계층 내부의 httpcore 연결 풀 백엔드를 감싸는 방식이라
+pyproject.toml에서 httpx/httpcore 메이저 버전을 고정하고, 구조가 다르면 기본 백엔드로 동작
+"""
+import asyncio
+import ipaddress
+import logging
+import socket
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": settings.USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+    "DNT": "1",
+}
+
+
+class OutboundHTTPStats:
+    """외부 요청 통계 (요청 수, 새 연결 수, DNS 캐시 적중)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.connections_opened = 0
+            self.dns_lookups = 0
+            self.dns_cache_hits = 0
+            self.http_versions: Counter = Counter()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_response(self, http_version: str) -> None:
+        with self._lock:
+            self.http_versions[http_version] += 1
+
+    def record_connection(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_dns(self, cache_hit: bool) -> None:
+        with self._lock:
+            if cache_hit:
+                self.dns_cache_hits += 1
+            else:
+                self.dns_lookups += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            reused = max(self.requests - self.connections_opened, 0)
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "connections_reused": reused,
+                "reuse_ratio": round(reused / self.requests, 3) if self.requests else 0.0,
+                "dns_lookups": self.dns_lookups,
+                "dns_cache_hits": self.dns_cache_hits,
+                "http_versions": dict(self.http_versions),
+            }
+
+
+class DNSCache:
+    """호스트 이름 → 주소 목록 TTL 캐시 (실패한 주소는 호출 측에서 invalidate)"""
+
+    def __init__(self, ttl: float, stats: OutboundHTTPStats):
+        self.ttl = ttl
+        self.stats = stats
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        try:
+            ipaddress.ip_address(host)
+            return [host]  # IP 주소는 해석할 필요 없음
+        except ValueError:
+            pass
+
+        key = (host, port)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            self.stats.record_dns(cache_hit=True)
+            return entry[1]
+
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self.stats.record_dns(cache_hit=False)
+        if self.ttl > 0 and addresses:
+            self._entries[key] = (now + self.ttl, addresses)
+        return addresses
+
+    def invalidate(self, host: str, port: int) -> None:
+        self._entries.pop((host, port), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class _CachingNetworkBackend:
+    """
+    httpcore 네트워크 백엔드 래퍼
+    connect_tcp 호출(= 새 연결 핸드셰이크)을 세고, 호스트 이름 대신 캐시된 주소로 연결
+    TLS SNI/인증서 검증은 httpcore가 원래 호스트 이름으로 처리하므로 영향 없음
+    """
+
+    def __init__(self, backend, dns_cache: DNSCache, stats: OutboundHTTPStats):
+        self._backend = backend
+        self._dns_cache = dns_cache
+        self._stats = stats
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self._stats.record_connection()
+        addresses = await self._dns_cache.resolve(host, port)
+        last_error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+                )
+            except Exception as e:
+                last_error = e
+        # 모든 주소가 실패하면 캐시를 비워 다음 연결에서 다시 조회
+        self._dns_cache.invalidate(host, port)
+        if last_error is None:
+            raise OSError(f"주소를 찾을 수 없습니다: {host}")
+        raise last_error
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+def _install_network_backend(transport, dns_cache: DNSCache, stats: OutboundHTTPStats) -> bool:
+    """
+    전송 계층의 httpcore 연결 풀 백엔드를 캐시 백엔드로 교체
+    httpx가 백엔드 지정 인자를 제공하지 않아 내부 속성을 사용 - 예상한 구조가 아니면 교체하지 않고 False
+    """
+    pool = getattr(transport, "_pool", None)
+    backend = getattr(pool, "_network_backend", None)
+    if backend is None or not callable(getattr(backend, "connect_tcp", None)):
+        return False
+    pool._network_backend = _CachingNetworkBackend(backend, dns_cache, stats)
+    return True
+
+
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401 - 선택 의존성 (httpx[http2])
+        return True
+    except ImportError:
+        return False
+
+
+class OutboundHTTPClient:
+    """
+    애플리케이션 범위 httpx.AsyncClient 보관소
+    get_client()는 처음 호출될 때 클라이언트를 만들고, 라이프사이클 종료 시 aclose()
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
+        dns_cache_ttl: float = 300.0,
+        timeout: float = 30.0,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.timeout = timeout
+        self.stats = OutboundHTTPStats()
+        self.dns_cache = DNSCache(dns_cache_ttl, self.stats)
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._http2_active = False
+        self._dns_cache_active = False
+
+    def get_client(self) -> "httpx.AsyncClient":
+        """공유 클라이언트 (없거나 닫혔으면 새로 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> "httpx.AsyncClient":
+        import httpx
+
+        self._http2_active = self.http2 and http2_available()
+        if self.http2 and not self._http2_active:
+            logger.info("h2 패키지가 없어 외부 요청은 HTTP/1.1로 처리합니다")
+
+        transport = httpx.AsyncHTTPTransport(
+            http2=self._http2_active,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            retries=1,  # 연결 단계 실패만 재시도 (keep-alive 연결이 서버에서 끊긴 경우)
+        )
+        self._dns_cache_active = _install_network_backend(transport, self.dns_cache, self.stats)
+        if not self._dns_cache_active:
+            logger.warning("httpx/httpcore 내부 구조가 예상과 달라 DNS 캐시/연결 수 집계 없이 기본 네트워크 백엔드를 사용합니다")
+
+        async def on_request(request):
+            self.stats.record_request()
+
+        async def on_response(response):
+            self.stats.record_response(response.http_version)
+
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=self.timeout,
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,  # feedparser/urllib으로 가져오던 RSS/robots.txt와 같은 동작
+            event_hooks={"request": [on_request], "response": [on_response]},
+        )
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "open": self._client is not None and not self._client.is_closed,
+            "http2": self._http2_active,
+            "dns_cache": self._dns_cache_active,
+            **self.stats.snapshot(),
+        }
+
+
+# 전역 외부 요청 클라이언트 (lifespan 종료 시 닫힘)
+outbound_http = OutboundHTTPClient(
+    max_connections=settings.HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    http2=settings.HTTP2_ENABLED,
+    dns_cache_ttl=settings.DNS_CACHE_TTL,
+    timeout=settings.REQUEST_TIMEOUT,
+)
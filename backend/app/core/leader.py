@@ -0,0 +1,118 @@
+"""
+워커 간 리더 선출
+여러 uvicorn 워커 중 하나만 예약 수집을 실행하도록 파일 잠금(advisory lock)을 사용
+잠금은 프로세스가 죽으면 OS가 해제하므로 다른 워커가 다음 확인 주기에 리더를 이어받는다
+"""
+import logging
+import os
+import socket
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 잠금 미지원 → 단일 프로세스로 가정
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def _open_lock_file(path: str) -> int:
+    lock_dir = os.path.dirname(path)
+    if lock_dir:
+        os.makedirs(lock_dir, exist_ok=True)
+    return os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    배타적 파일 잠금 (블로킹)
+    시작 시 테이블 생성/기본 데이터 설정처럼 워커들이 차례로 실행해야 하는 작업에 사용
+    """
+    fd = _open_lock_file(path)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+@contextmanager
+def try_file_lock(path: str) -> Iterator[bool]:
+    """
+    배타적 파일 잠금 (논블로킹)
+    다른 프로세스가 잡고 있으면 False를 돌려주고 바로 빠져나온다
+    """
+    fd = _open_lock_file(path)
+    acquired = False
+    try:
+        if fcntl is None:
+            acquired = True
+        else:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                acquired = True
+            except BlockingIOError:
+                acquired = False
+        yield acquired
+    finally:
+        if acquired and fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+class LeaderElector:
+    """
+    파일 잠금 기반 리더 선출
+    리더는 잠금 파일 디스크립터를 계속 열어 두고, 팔로워는 주기적으로 try_acquire()를 호출
+    """
+
+    def __init__(self, lock_path: str):
+        self.lock_path = lock_path
+        self._fd: Optional[int] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """리더 잠금 시도 (이미 리더면 True)"""
+        if self._fd is not None:
+            return True
+
+        fd = _open_lock_file(self.lock_path)
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return False
+
+        # 진단용으로 현재 리더 정보 기록 (잠금 자체는 flock이 보장)
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{socket.gethostname()}:{os.getpid()}\n".encode("utf-8"))
+        self._fd = fd
+        logger.info(f"수집 리더로 선출됨 (pid={os.getpid()})")
+        return True
+
+    def release(self) -> None:
+        """리더 잠금 해제 (종료 시)"""
+        if self._fd is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+        logger.info(f"수집 리더 잠금 해제 (pid={os.getpid()})")
+
+    def current_leader(self) -> Optional[str]:
+        """잠금 파일에 기록된 리더 정보 (host:pid)"""
+        try:
+            with open(self.lock_path, encoding="utf-8") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
@@ -0,0 +1,303 @@
+"""
+Prometheus 텍스트 형식 메트릭
+외부 의존성 없이 카운터/게이지/히스토그램을 제공하고 /metrics 에서 노출
+- 값은 스레드별 샤드(dict)에 기록하므로 기록 경로에 잠금이 없다 (스크레이프 시 샤드를 합산)
+- 메트릭은 워커 프로세스별 값이므로 멀티 워커에서는 워커마다 스크레이프한다
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 기본 버킷 (초 단위 지연 시간)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+COLLECTION_BUCKETS = (0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[Any], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    """스레드별 샤드를 가진 메트릭 기본 클래스"""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+
+    def _shard(self) -> dict:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            self._shards.append(shard)  # list.append는 원자적
+            return shard
+
+    def _merged_shards(self) -> Iterable[dict]:
+        # dict.copy()는 GIL 아래에서 원자적이라 기록 중인 샤드도 안전하게 읽힌다
+        return [shard.copy() for shard in list(self._shards)]
+
+    def reset(self) -> None:
+        for shard in list(self._shards):
+            shard.clear()
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def inc(self, labels: Tuple = (), amount: float = 1) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def values(self) -> Dict[Tuple, float]:
+        totals: Dict[Tuple, float] = {}
+        for shard in self._merged_shards():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.values().items())
+        ]
+
+
+class Gauge(Counter):
+    """증감 가능한 게이지 (진행 중 요청 수 등, 샤드 합계가 현재 값)"""
+
+    type_name = "gauge"
+
+    def dec(self, labels: Tuple = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (샤드에는 버킷별 개수, 합계, 개수를 기록)"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: Tuple = ()) -> None:
+        shard = self._shard()
+        state = shard.get(labels)
+        if state is None:
+            state = shard[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+        state[2] += 1
+
+    def values(self) -> Dict[Tuple, Tuple[List[int], float, int]]:
+        totals: Dict[Tuple, list] = {}
+        for shard in self._merged_shards():
+            for labels, (counts, total, count) in shard.items():
+                merged = totals.setdefault(labels, [[0] * (len(self.buckets) + 1), 0.0, 0])
+                for index, bucket_count in enumerate(list(counts)):
+                    merged[0][index] += bucket_count
+                merged[1] += total
+                merged[2] += count
+        return {labels: (state[0], state[1], state[2]) for labels, state in totals.items()}
+
+    def render(self) -> List[str]:
+        lines = []
+        for labels, (counts, total, count) in sorted(self.values().items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 텍스트 형식 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 전역 레지스트리와 메트릭 정의
+registry = MetricsRegistry()
+
+# API
+http_requests_total = registry.counter(
+    "http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (초)", ("method", "route")
+)
+http_response_size_bytes = registry.histogram(
+    "http_response_size_bytes", "HTTP 응답 본문 크기 (전송 바이트)", ("method", "route"), buckets=SIZE_BUCKETS
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수", ("method",)
+)
+
+# 수집기
+collector_source_duration_seconds = registry.histogram(
+    "collector_source_duration_seconds", "소스별 수집 소요 시간 (초)", ("source", "type"), buckets=COLLECTION_BUCKETS
+)
+collector_bytes_fetched_total = registry.counter(
+    "collector_bytes_fetched_total", "소스에서 내려받은 바이트 수", ("source",)
+)
+collector_entries_total = registry.counter(
+    "collector_entries_total", "수집 단계별 항목 수 (parsed/filtered/deduped/inserted)", ("source", "stage")
+)
+collector_errors_total = registry.counter(
+    "collector_errors_total", "수집 오류 수", ("source",)
+)
+collector_runs_total = registry.counter(
+    "collector_runs_total", "수집 실행 횟수", ()
+)
+
+# 데이터베이스
+db_queries_total = registry.counter(
+    "db_queries_total", "실행한 SQL 문 수", ("operation",)
+)
+db_query_duration_seconds = registry.histogram(
+    "db_query_duration_seconds", "SQL 문 실행 시간 (초)", ("operation",), buckets=DB_LATENCY_BUCKETS
+)
+
+
+def _statement_operation(statement: str) -> str:
+    """SQL 문 종류 (SELECT/INSERT/UPDATE/...)"""
+    head = statement.lstrip()[:16].split(None, 1)
+    return head[0].upper() if head else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_metrics_started", None)
+    if started is None:
+        return
+    operation = (_statement_operation(statement),)
+    db_queries_total.inc(operation)
+    db_query_duration_seconds.observe(time.perf_counter() - started, operation)
+
+
+def instrument_engine(engine) -> None:
+    """SQLAlchemy 엔진의 커서 실행 이벤트로 쿼리 수/시간 기록 (여러 번 호출해도 한 번만 등록)"""
+    from sqlalchemy import event
+
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class MetricsMiddleware:
+    """
+    요청별 지연 시간/응답 크기/진행 중 요청 수를 기록하는 순수 ASGI 미들웨어
+    route 라벨은 경로 템플릿(/api/v1/newsletters/{newsletter_id})을 사용해 라벨 수가 늘지 않도록 한다
+    """
+
+    def __init__(self, app, excluded_paths: Sequence[str] = ()):
+        self.app = app
+        self.excluded_paths = set(excluded_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        started = time.perf_counter()
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        http_requests_in_flight.inc((method,))
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec((method,))
+            route = _route_label(scope)
+            http_requests_total.inc((method, route, str(status_code)))
+            http_request_duration_seconds.observe(time.perf_counter() - started, (method, route))
+            http_response_size_bytes.observe(response_size, (method, route))
+
+
+def _route_label(scope) -> str:
+    """매칭된 라우트의 경로 템플릿 (정적 파일 마운트는 마운트 경로, 그 외는 <unmatched>)"""
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    root_path: Optional[str] = scope.get("root_path")
+    if root_path:
+        return root_path
+    return "<unmatched>"
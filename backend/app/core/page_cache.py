@@ -0,0 +1,88 @@
+"""
+렌더링된 페이지 캐시
+Jinja2 렌더링 결과와 미리 gzip 압축한 바이트를 데이터 버전 단위로 보관
+"""
+import gzip
+import hashlib
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+from app.core.compression import accepted_encodings
+
+
+class CachedPage:
+    """캐시된 페이지 (원본/압축 바이트와 표현별 ETag)"""
+
+    __slots__ = ("version", "body", "gzip_body", "etag", "gzip_etag", "media_type")
+
+    def __init__(self, version: str, body: bytes, media_type: str = "text/html; charset=utf-8"):
+        self.version = version
+        self.body = body
+        self.gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+        digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+        # 바이트가 다른 표현이므로 gzip 본문에는 별도의 강한 ETag 사용
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gzip"'
+        self.media_type = media_type
+
+
+class RenderedPageCache:
+    """키별 렌더링 결과 캐시 (데이터 버전이 바뀌면 자동 무효화)"""
+
+    def __init__(self):
+        self._pages: Dict[str, CachedPage] = {}
+
+    def get(self, key: str, version: str) -> Optional[CachedPage]:
+        """현재 데이터 버전과 일치하는 캐시 조회"""
+        page = self._pages.get(key)
+        if page is None or page.version != version:
+            return None
+        return page
+
+    def set(self, key: str, version: str, body: bytes, media_type: str = "text/html; charset=utf-8") -> CachedPage:
+        """렌더링 결과 저장"""
+        page = CachedPage(version, body, media_type)
+        self._pages[key] = page
+        return page
+
+    def clear(self) -> None:
+        self._pages.clear()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 약한 비교 (쉼표로 구분된 목록과 "*" 지원)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        # 압축 미들웨어가 약한 ETag(W/)로 바꿔 보낸 경우도 같은 표현으로 간주
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def cached_page_response(page: CachedPage, request: Request) -> Response:
+    """
+    캐시된 페이지 응답 생성
+    gzip 지원 클라이언트에는 미리 압축한 바이트 전송, 선택된 표현의 ETag가 If-None-Match와 일치하면 304
+    """
+    use_gzip = "gzip" in accepted_encodings(request.headers.get("accept-encoding", ""))
+    headers = {
+        "ETag": page.gzip_etag if use_gzip else page.etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+
+    if _etag_matches(request.headers.get("if-none-match", ""), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(page.gzip_body, media_type=page.media_type, headers=headers)
+
+    return Response(page.body, media_type=page.media_type, headers=headers)
+
+
+# 전역 페이지 캐시 인스턴스
+page_cache = RenderedPageCache()
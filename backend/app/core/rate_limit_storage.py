@@ -0,0 +1,174 @@
+"""
+요청 제한(rate limit) 공유 저장소
+slowapi/limits용 SQLite(WAL) 카운터 저장소 - 외부 서비스 없이 워커 간 카운터를 공유하고 재시작 후에도 유지
+모듈을 import하면 "sqlite://" 스킴이 limits 저장소 레지스트리에 등록된다
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from math import floor
+from typing import Optional, Tuple
+
+from limits.storage import Storage
+from limits.storage.base import SlidingWindowCounterSupport, TimestampedSlidingWindow
+
+logger = logging.getLogger(__name__)
+
+PURGE_EVERY = 1000  # incr N회마다 만료된 카운터 정리
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_counters (
+    key TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+# 만료된 카운터는 새 창으로 초기화, 아니면 누적 (단일 문장이라 워커 간에도 원자적)
+_INCR_SQL = """
+INSERT INTO rate_limit_counters (key, count, expires_at) VALUES (?, ?, ?)
+ON CONFLICT(key) DO UPDATE SET
+    count = CASE WHEN expires_at <= ? THEN excluded.count ELSE count + excluded.count END,
+    expires_at = CASE WHEN expires_at <= ? THEN excluded.expires_at ELSE expires_at END
+RETURNING count
+"""
+
+
+def _path_from_uri(uri: str) -> str:
+    """sqlite:///relative/path.db, sqlite:////absolute/path.db (SQLAlchemy URL과 같은 규칙)"""
+    path = uri.split("://", 1)[1]
+    if path.startswith("/"):
+        path = path[1:]
+    return path or "rate_limits.db"
+
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """
+    SQLite WAL 기반 카운터 저장소
+    fixed-window, sliding-window-counter 전략 지원 (moving-window 미지원)
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, busy_timeout: float = 5.0, **options):
+        self.path = _path_from_uri(uri)
+        self.busy_timeout = float(busy_timeout)
+        self._local = threading.local()
+        self._incr_calls = 0
+
+        db_dir = os.path.dirname(self.path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._connection().execute(_SCHEMA)
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 연결 (autocommit 모드, 명시적 트랜잭션만 사용)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _incr(self, connection: sqlite3.Connection, key: str, expiry: float, amount: int, now: float) -> int:
+        return connection.execute(_INCR_SQL, (key, amount, now + expiry, now, now)).fetchone()[0]
+
+    def _get(self, connection: sqlite3.Connection, key: str, now: float) -> Tuple[int, float]:
+        row = connection.execute(
+            "SELECT count, expires_at FROM rate_limit_counters WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+        return (row[0], row[1]) if row else (0, now)
+
+    def _maybe_purge(self, connection: sqlite3.Connection, now: float) -> None:
+        self._incr_calls += 1
+        if self._incr_calls % PURGE_EVERY == 0:
+            connection.execute("DELETE FROM rate_limit_counters WHERE expires_at <= ?", (now,))
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        """카운터 증가 (없거나 만료됐으면 expiry초짜리 새 창 시작)"""
+        connection = self._connection()
+        now = time.time()
+        count = self._incr(connection, key, expiry, amount, now)
+        self._maybe_purge(connection, now)
+        return count
+
+    def decr(self, key: str, amount: int = 1) -> int:
+        row = self._connection().execute(
+            "UPDATE rate_limit_counters SET count = MAX(count - ?, 0) WHERE key = ? AND expires_at > ? RETURNING count",
+            (amount, key, time.time()),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get(self, key: str) -> int:
+        return self._get(self._connection(), key, time.time())[0]
+
+    def get_expiry(self, key: str) -> float:
+        return self._get(self._connection(), key, time.time())[1]
+
+    def clear(self, key: str) -> None:
+        self._connection().execute("DELETE FROM rate_limit_counters WHERE key = ?", (key,))
+
+    def check(self) -> bool:
+        try:
+            self._connection().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> Optional[int]:
+        return self._connection().execute("DELETE FROM rate_limit_counters").rowcount
+
+    def _sliding_window_info(
+        self, connection: sqlite3.Connection, key: str, expiry: int, now: float
+    ) -> Tuple[int, float, int, float]:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count = self._get(connection, previous_key, now)[0]
+        current_count = self._get(connection, current_key, now)[0]
+        previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry if previous_count else 0.0
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        """
+        슬라이딩 윈도우 카운터 획득
+        조회와 증가를 한 쓰기 트랜잭션(BEGIN IMMEDIATE)으로 묶어 워커 간 경쟁 상태가 없다
+        """
+        if amount > limit:
+            return False
+
+        connection = self._connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            previous_count, previous_ttl, current_count, _ = self._sliding_window_info(connection, key, expiry, now)
+            weighted_count = previous_count * previous_ttl / expiry + current_count
+            if floor(weighted_count) + amount > limit:
+                connection.execute("COMMIT")
+                return False
+
+            _, current_key = self.sliding_window_keys(key, expiry, now)
+            self._incr(connection, current_key, 2 * expiry, amount, now)
+            self._maybe_purge(connection, now)
+            connection.execute("COMMIT")
+            return True
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        return self._sliding_window_info(self._connection(), key, expiry, time.time())
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        self._connection().execute(
+            "DELETE FROM rate_limit_counters WHERE key IN (?, ?)", (previous_key, current_key)
+        )
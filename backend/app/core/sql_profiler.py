@@ -0,0 +1,175 @@
+"""
+요청별 SQL 프로파일링
+SQLAlchemy 커서 실행 이벤트를 요청 단위(contextvar)로 모아 문장 수/DB 시간/상위 문장을 집계
+- 느린 쿼리 로그: 임계값(ms)을 넘은 문장은 요청 밖(수집기 등)에서도 경고
+- N+1 경고: 한 요청에서 같은 문장이 임계 횟수 이상 반복되면 경고
+- Server-Timing 헤더: 브라우저 개발자 도구/curl -v 에서 DB 시간 확인 (SQL 문장은 별도 디버그 설정일 때만)
+"""
+import logging
+import re
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")  # IN (?, ?, ?) → IN (?)
+
+
+def normalize_statement(statement: str) -> str:
+    """파라미터 개수만 다른 문장을 같은 문장으로 묶기 위한 정규화"""
+    return _IN_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class RequestProfile:
+    """요청 하나의 SQL 실행 기록"""
+
+    __slots__ = ("statement_count", "total_time", "statements")
+
+    def __init__(self):
+        self.statement_count = 0
+        self.total_time = 0.0
+        # 정규화된 문장 → [실행 횟수, 누적 시간, 최대 시간]
+        self.statements: Dict[str, List[float]] = {}
+
+    def record(self, statement: str, duration: float) -> None:
+        self.statement_count += 1
+        self.total_time += duration
+        entry = self.statements.get(statement)
+        if entry is None:
+            self.statements[statement] = [1, duration, duration]
+        else:
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] = max(entry[2], duration)
+
+    def top_statements(self, limit: int = 3) -> List[Tuple[str, int, float]]:
+        """누적 시간이 긴 문장 순 (문장, 횟수, 누적 시간)"""
+        ranked = sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)
+        return [(statement, int(entry[0]), entry[1]) for statement, entry in ranked[:limit]]
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold번 이상 반복된 SELECT (N+1 의심)"""
+        return [
+            (statement, int(entry[0]))
+            for statement, entry in self.statements.items()
+            if entry[0] >= threshold and statement.upper().startswith("SELECT")
+        ]
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("sql_profile", default=None)
+
+
+class SQLProfiler:
+    """엔진 이벤트 등록과 느린 쿼리 판정"""
+
+    def __init__(self, slow_query_ms: float = 200.0, n_plus_one_threshold: int = 5):
+        self.slow_query_seconds = slow_query_ms / 1000 if slow_query_ms > 0 else None
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    def instrument(self, engine) -> None:
+        """SQLAlchemy 엔진에 커서 실행 이벤트 등록 (여러 번 호출해도 한 번만 등록)"""
+        from sqlalchemy import event
+
+        if event.contains(engine, "before_cursor_execute", self._before_cursor_execute):
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._profile_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_profile_started", None)
+        if started is None:
+            return
+        duration = time.perf_counter() - started
+
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.record(normalize_statement(statement), duration)
+
+        if self.slow_query_seconds is not None and duration >= self.slow_query_seconds:
+            logger.warning(f"느린 쿼리 ({duration * 1000:.1f}ms): {normalize_statement(statement)[:500]}")
+
+
+def _server_timing_desc(text: str) -> str:
+    """Server-Timing desc 값 (따옴표 문자열, 길이 제한)"""
+    text = text.replace("\\", "").replace('"', "'")
+    return text[:80]
+
+
+def server_timing_header(profile: RequestProfile, top: int = 3, include_statements: bool = False) -> str:
+    """
+    db 합계 + 누적 시간 상위 문장을 Server-Timing 항목으로
+    헤더는 클라이언트에 그대로 보이므로 문장 본문은 include_statements(디버그용)일 때만 포함
+    """
+    entries = [f'db;dur={profile.total_time * 1000:.2f};desc="{profile.statement_count} queries"']
+    for index, (statement, count, total) in enumerate(profile.top_statements(top), 1):
+        desc = _server_timing_desc(f"{count}x {statement}" if include_statements else f"{count}x")
+        entries.append(f'sql-{index};dur={total * 1000:.2f};desc="{desc}"')
+    return ", ".join(entries)
+
+
+class SQLProfilerMiddleware:
+    """
+    요청마다 프로파일을 시작하고 응답 헤더(Server-Timing)와 N+1 경고를 남기는 순수 ASGI 미들웨어
+    응답 시작 시점까지 실행된 문장이 헤더에 반영된다 (스트리밍 응답의 이후 쿼리는 로그로만 확인)
+    """
+
+    def __init__(self, app, profiler: SQLProfiler, server_timing: bool = True, top_statements: int = 3,
+                 server_timing_statements: bool = False):
+        self.app = app
+        self.profiler = profiler
+        self.server_timing = server_timing
+        self.top_statements = top_statements
+        self.server_timing_statements = server_timing_statements
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and self.server_timing and profile.statement_count:
+                headers = list(message.get("headers", []))
+                value = server_timing_header(profile, self.top_statements, self.server_timing_statements)
+                headers.append((b"server-timing", value.encode("latin-1", "replace")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_profile.reset(token)
+            self._report(scope, profile)
+
+    def _report(self, scope, profile: RequestProfile) -> None:
+        if not profile.statement_count:
+            return
+        path = scope.get("path", "")
+        for statement, count in profile.repeated_statements(self.profiler.n_plus_one_threshold):
+            logger.warning(f"N+1 의심: {scope.get('method')} {path} - 같은 쿼리 {count}회 실행: {statement[:300]}")
+        logger.debug(
+            f"SQL 프로파일: {scope.get('method')} {path} - "
+            f"{profile.statement_count}개 문장, {profile.total_time * 1000:.1f}ms"
+        )
+
+
+# 전역 프로파일러 (느린 쿼리 로그는 항상, 요청 집계는 SQL_PROFILING_ENABLED일 때 미들웨어로)
+sql_profiler = SQLProfiler(
+    slow_query_ms=settings.SQL_SLOW_QUERY_MS,
+    n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD
+)
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """현재 요청의 SQL 프로파일 (프로파일링 중이 아니면 None)"""
+    return _current_profile.get()
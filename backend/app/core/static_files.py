@@ -0,0 +1,123 @@
+"""
+정적 파일 제공
+빌드된(파일명 해시) 자산은 immutable 캐시 헤더와 미리 압축된 .br/.gz 변형으로 제공
+"""
+import json
+import logging
+import mimetypes
+import os
+from typing import Dict, Optional, Tuple
+
+import anyio
+from fastapi.staticfiles import StaticFiles
+from starlette.staticfiles import NotModifiedResponse
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.types import Scope
+
+logger = logging.getLogger(__name__)
+
+DIST_DIR = "dist"  # scripts/build_assets.py 출력 디렉토리 (static 기준)
+MANIFEST_FILE = "manifest.json"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Accept-Encoding 우선순위: brotli → gzip
+_PRECOMPRESSED_VARIANTS: Tuple[Tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_encodings(scope: Scope) -> set:
+    """Accept-Encoding 헤더에서 허용된 인코딩 목록 (q=0 제외)"""
+    accepted = set()
+    for part in Headers(scope=scope).get("accept-encoding", "").split(","):
+        token, _, params = part.strip().partition(";")
+        if token and params.replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.add(token.lower())
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles 확장
+    dist/ 아래 해시 파일명 자산에 1년 immutable 캐시 적용, 미리 압축된 변형 우선 제공
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if not path.startswith(f"{DIST_DIR}/"):
+            return await super().get_response(path, scope)
+
+        accepted = _accepted_encodings(scope)
+        for encoding, suffix in _PRECOMPRESSED_VARIANTS:
+            if encoding not in accepted:
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+            if stat_result is None:
+                continue
+            media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            response = FileResponse(
+                full_path,
+                stat_result=stat_result,
+                media_type=media_type,
+                method=scope["method"],
+                headers={
+                    "Content-Encoding": encoding,
+                    "Vary": "Accept-Encoding",
+                    "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+                },
+            )
+            # 압축본도 원본과 같이 If-None-Match/If-Modified-Since 조건부 요청에 304 응답
+            if self.is_not_modified(response.headers, Headers(scope=scope)):
+                return NotModifiedResponse(response.headers)
+            return response
+
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+
+class AssetManifest:
+    """
+    빌드 매니페스트 기반 자산 URL 해석
+    템플릿에서 asset_url('css/sanctuary.css') 형태로 사용, 빌드 전에는 원본 경로 반환
+    """
+
+    def __init__(self, static_dir: str, url_prefix: str = "/static"):
+        self.static_dir = static_dir
+        self.url_prefix = url_prefix.rstrip("/")
+        self.manifest_path = os.path.join(static_dir, DIST_DIR, MANIFEST_FILE)
+        self._mtime: Optional[float] = None
+        self._entries: Dict[str, str] = {}
+
+    def _load(self) -> Dict[str, str]:
+        """매니페스트가 바뀐 경우에만 다시 로드"""
+        try:
+            mtime = os.stat(self.manifest_path).st_mtime
+        except FileNotFoundError:
+            self._mtime, self._entries = None, {}
+            return self._entries
+
+        if mtime != self._mtime:
+            try:
+                with open(self.manifest_path, encoding="utf-8") as f:
+                    self._entries = json.load(f)
+                self._mtime = mtime
+            except (OSError, ValueError) as e:
+                logger.warning(f"자산 매니페스트 로드 실패: {e}")
+                self._entries = {}
+        return self._entries
+
+    @property
+    def version(self) -> str:
+        """
+        매니페스트 버전 (수정 시각, 빌드 전에는 "0")
+        렌더링 페이지 캐시 키에 포함해 재빌드로 지워진 해시 파일을 참조하는 페이지를 무효화
+        """
+        self._load()
+        return str(self._mtime) if self._mtime is not None else "0"
+
+    def url(self, logical_path: str) -> str:
+        """논리 경로 → 실제 제공 URL"""
+        return f"{self.url_prefix}/{self._load().get(logical_path, logical_path)}"
+
+    __call__ = url
@@ -2,6 +2,7 @@
 웰니스 리트리트 뉴스레터 서비스 메인 애플리케이션
 FastAPI 기반 백엔드 서버
 """
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -9,55 +10,86 @@ from typing import Dict, Any
 
 from fastapi import FastAPI, HTTPException, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy.orm import Session
 
+from app.core.compression import CompressionMiddleware, compression_stats
 from app.core.config import settings, setup_logging
-from app.core.database import create_tables, get_db
+from app.core.data_version import get_data_version
+from app.core.events import event_broker
+from app.core.http_client import outbound_http
+from app.core.database import create_tables, engine, get_read_db, read_engine
+from app.core.leader import LeaderElector, file_lock
+from app.core import metrics
+from app.core import rate_limit_storage  # noqa: F401 - sqlite:// 요청 제한 저장소 등록
+from app.core.page_cache import page_cache, cached_page_response
+from app.core.sql_profiler import SQLProfilerMiddleware, sql_profiler
+from app.core.static_files import AssetManifest, PrecompressedStaticFiles
 from app.api.newsletters import router as newsletters_router
 from app.models.newsletter import NewsletterSource
-from app.services.newsletter_collector import CollectionScheduler
 
 # 로깅 설정
 setup_logging()
 logger = logging.getLogger(__name__)
 
-# Rate Limiter 설정
-limiter = Limiter(key_func=get_remote_address)
+# Rate Limiter 설정 (카운터는 워커 간 공유 저장소에 보관)
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    strategy=settings.RATE_LIMIT_STRATEGY
+)
+
+# 예약 수집 리더 선출 (워커 프로세스마다 하나)
+leader_elector = LeaderElector(settings.LEADER_LOCK_FILE)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     애플리케이션 라이프사이클 관리
-    시작시: 데이터베이스 테이블 생성, 기본 데이터 설정
+    시작시: 데이터베이스 테이블 생성, 기본 데이터 설정, 예약 수집 루프 시작
     종료시: 정리 작업
     """
     # 시작시 작업
     logger.info("애플리케이션 시작 중...")
     
-    # 데이터베이스 테이블 생성
-    create_tables()
-    logger.info("데이터베이스 테이블 생성 완료")
-    
-    # 기본 뉴스레터 소스 설정
-    await setup_default_sources()
+    # 테이블 생성/기본 소스 설정 (블로킹 작업이라 스레드에서 실행, 이벤트 루프를 막지 않음)
+    await asyncio.to_thread(bootstrap_database)
     
     # 디렉토리 생성
     os.makedirs("logs", exist_ok=True)
     os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
     
+    # 예약 수집 (SCHEDULED_COLLECTION_ENABLED로 켠 경우, 리더 잠금을 가진 워커만 실행)
+    collection_task = None
+    if settings.COLLECTION_ENABLED and settings.SCHEDULED_COLLECTION_ENABLED:
+        # 수집기 의존성(feedparser/bs4/httpx)은 수집을 실행할 워커에서만 로드
+        from app.services.newsletter_collector import run_scheduled_collection
+        from app.services.url_frontier import seen_url_frontier
+        if settings.SEEN_URL_ENABLED:
+            # 웹 소스 수집 이력 블룸 필터 미리 적재 (수동 수집만 하는 워커는 첫 수집 때 적재)
+            await asyncio.to_thread(seen_url_frontier.load)
+        collection_task = asyncio.create_task(run_scheduled_collection(leader_elector))
+    
     logger.info("애플리케이션 시작 완료")
     
     yield
     
     # 종료시 작업
     logger.info("애플리케이션 종료 중...")
+    if collection_task is not None:
+        collection_task.cancel()
+        try:
+            await collection_task
+        except asyncio.CancelledError:
+            pass
+    
+    # 외부 요청 연결 풀 정리
+    await outbound_http.aclose()
 
 
 # FastAPI 애플리케이션 생성
@@ -81,33 +113,72 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 정적 파일 및 템플릿 설정
-app.mount("/static", StaticFiles(directory="../frontend/static"), name="static")
+# SQL 프로파일링 (느린 쿼리 로그는 항상, 요청별 집계/Server-Timing은 설정 시)
+sql_profiler.instrument(engine)
+sql_profiler.instrument(read_engine)
+if settings.SQL_PROFILING_ENABLED:
+    app.add_middleware(
+        SQLProfilerMiddleware,
+        profiler=sql_profiler,
+        server_timing=settings.SQL_SERVER_TIMING,
+        server_timing_statements=settings.SQL_SERVER_TIMING_STATEMENTS
+    )
+
+# 응답 압축 미들웨어 (gzip/brotli)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+# 메트릭 미들웨어 (가장 바깥: 압축 후 전송 바이트와 전체 처리 시간 기록)
+if settings.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware, excluded_paths=["/metrics"])
+    metrics.instrument_engine(engine)
+    metrics.instrument_engine(read_engine)
+
+# 정적 파일 및 템플릿 설정 (빌드된 자산은 해시 파일명 + 사전 압축본 제공)
+STATIC_DIR = "../frontend/static"
+app.mount("/static", PrecompressedStaticFiles(directory=STATIC_DIR), name="static")
 templates = Jinja2Templates(directory="../frontend/templates")
+asset_manifest = AssetManifest(STATIC_DIR)
+templates.env.globals["asset_url"] = asset_manifest
 
 # API 라우터 등록
 app.include_router(newsletters_router, prefix=settings.API_PREFIX)
 
 
 @app.get("/", response_class=HTMLResponse)
-@limiter.limit("10/minute")
-async def read_root(request: Request, db: Session = Depends(get_db)):
-    """메인 페이지"""
+@limiter.limit(settings.LANDING_RATE_LIMIT)
+async def read_root(request: Request, db: Session = Depends(get_read_db)):
+    """
+    메인 페이지
+    렌더링 결과를 데이터 버전 단위로 캐시 (수집/관리자 수정, 자산 재빌드 시 무효화)
+    """
     try:
-        # 최신 뉴스레터 몇 개 가져오기
-        from app.models.newsletter import Newsletter
-        recent_newsletters = db.query(Newsletter).filter(
-            Newsletter.is_active == True
-        ).order_by(Newsletter.collected_date.desc()).limit(6).all()
+        version = f"{get_data_version()}:{asset_manifest.version}"
+        page = page_cache.get("index", version)
         
-        return templates.TemplateResponse(
-            "index.html",
-            {
-                "request": request,
-                "newsletters": recent_newsletters,
-                "app_name": settings.APP_NAME
-            }
-        )
+        if page is None:
+            # 최신 뉴스레터 몇 개 가져오기
+            from app.models.newsletter import Newsletter
+            recent_newsletters = db.query(Newsletter).filter(
+                Newsletter.is_active == True
+            ).order_by(Newsletter.collected_date.desc()).limit(6).all()
+            
+            rendered = templates.TemplateResponse(
+                "index.html",
+                {
+                    "request": request,
+                    "newsletters": recent_newsletters,
+                    "app_name": settings.APP_NAME
+                }
+            )
+            page = page_cache.set("index", version, rendered.body)
+        
+        return cached_page_response(page, request)
     except Exception as e:
         logger.error(f"메인 페이지 오류: {e}")
         return templates.TemplateResponse(
@@ -137,10 +208,25 @@ async def health_check():
         "status": "healthy",
         "app_name": settings.APP_NAME,
         "version": settings.APP_VERSION,
-        "environment": os.getenv("ENVIRONMENT", "development")
+        "environment": os.getenv("ENVIRONMENT", "development"),
+        "compression": compression_stats.snapshot(),
+        "event_stream": event_broker.stats(),
+        "outbound_http": outbound_http.snapshot(),
+        "collection_leader": {
+            "is_leader": leader_elector.is_leader,
+            "current": leader_elector.current_leader()
+        }
     }
 
 
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Prometheus 텍스트 형식 메트릭 (워커 프로세스별 값)"""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="메트릭이 비활성화되어 있습니다")
+    return PlainTextResponse(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.get("/admin")
 async def admin_redirect():
     """관리자 페이지 -> 메인 페이지로 리다이렉트 (에이전트 회의 결과: 한 곳에서 모든 기능)"""
@@ -148,10 +234,27 @@ async def admin_redirect():
     return RedirectResponse(url="/", status_code=301)
 
 
-async def setup_default_sources():
+def bootstrap_database():
+    """
+    시작 시 데이터베이스 준비
+    워커가 여러 개여도 테이블 생성/기본 소스 설정은 한 번에 하나씩 실행
+    """
+    with file_lock(settings.BOOTSTRAP_LOCK_FILE):
+        # 데이터베이스 테이블 생성 (스키마 지문이 같으면 건너뜀)
+        if create_tables():
+            logger.info("데이터베이스 테이블 생성 완료")
+        else:
+            logger.info("데이터베이스 스키마 변경 없음 (확인 생략)")
+        
+        # 기본 뉴스레터 소스 설정
+        setup_default_sources()
+
+
+def setup_default_sources():
     """
     기본 뉴스레터 소스 설정
     Writer가 제안한 우선 수집 대상 설정
+    이름이 이미 있는 소스는 건너뛰는 일괄 upsert 한 번으로 처리
     """
     default_sources = [
         {
@@ -189,19 +292,30 @@ async def setup_default_sources():
     db = SessionLocal()
     
     try:
-        for source_data in default_sources:
-            # 이미 존재하는지 확인
-            existing = db.query(NewsletterSource).filter(
-                NewsletterSource.name == source_data["name"]
-            ).first()
-            
-            if not existing:
-                source = NewsletterSource(**source_data)
-                db.add(source)
-                logger.info(f"기본 소스 추가: {source_data['name']}")
+        dialect = db.get_bind().dialect.name
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        elif dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            insert = None
+        
+        if insert is not None:
+            stmt = insert(NewsletterSource.__table__).on_conflict_do_nothing(index_elements=["name"])
+            added = db.execute(stmt, default_sources).rowcount
+        else:
+            # ON CONFLICT 미지원 DB: 기존 이름을 한 번에 조회해 없는 것만 추가
+            existing = {
+                name for (name,) in db.query(NewsletterSource.name).filter(
+                    NewsletterSource.name.in_([source["name"] for source in default_sources])
+                )
+            }
+            new_sources = [source for source in default_sources if source["name"] not in existing]
+            db.add_all(NewsletterSource(**source) for source in new_sources)
+            added = len(new_sources)
         
         db.commit()
-        logger.info("기본 뉴스레터 소스 설정 완료")
+        logger.info(f"기본 뉴스레터 소스 설정 완료 (추가 {added}개)")
         
     except Exception as e:
         logger.error(f"기본 소스 설정 오류: {e}")
@@ -2,8 +2,9 @@
 뉴스레터 데이터 모델
 Writer의 컨텐츠 스키마 요구사항을 반영한 SQLAlchemy 모델
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, JSON, Index, UniqueConstraint, event
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -21,9 +22,10 @@ class Newsletter(Base):
     # 기본 정보
     title = Column(String(500), nullable=False, index=True)
     summary = Column(String(300))  # 150자 이내 요약 (여유분 포함)
-    content = Column(Text, nullable=False)
+    content = Column(Text, nullable=False)  # 정제 HTML (표시용)
+    content_text = Column(Text)  # 정규화 평문 (분석/검색용, html_cleaner)
     source = Column(String(100), nullable=False, index=True)  # newsletter_name
-    source_url = Column(String(500))  # 원본 링크
+    source_url = Column(String(500), index=True)  # 원본 링크
     
     # 분류 정보 (Writer 요구사항 반영)
     primary_category = Column(String(50), index=True)  # mind_wellness, body_wellness 등
@@ -36,6 +38,11 @@ class Newsletter(Base):
     # 프로그램 정보 (JSON으로 구조화)
     program_info = Column(JSON)  # {"duration": "기간", "price_range": "가격대", ...}
     
+    # 구조화 필터용 비정규화 컬럼 (location/program_info에서 파생, 아래 복합 인덱스 사용)
+    country = Column(String(50))
+    duration = Column(String(20))
+    price_range = Column(String(20))
+    
     # 메타데이터
     published_date = Column(DateTime, index=True)  # 발행일
     collected_date = Column(DateTime, default=func.now(), index=True)  # 수집일
@@ -52,9 +59,35 @@ class Newsletter(Base):
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     
+    # 필터 + 활성 상태 + 최신순 정렬을 인덱스만으로 처리
+    __table_args__ = (
+        Index("ix_newsletters_country_active_collected", "country", "is_active", "collected_date"),
+        Index("ix_newsletters_duration_active_collected", "duration", "is_active", "collected_date"),
+        Index("ix_newsletters_price_range_active_collected", "price_range", "is_active", "collected_date"),
+        Index("ix_newsletters_primary_category_active_collected", "primary_category", "is_active", "collected_date"),
+    )
+    
     def __repr__(self):
         return f"<Newsletter(id={self.id}, title={self.title[:50]}...)>"
     
+    def sync_content_text(self) -> None:
+        """본문만 바뀌고 평문이 갱신되지 않았으면 다시 추출 (관리자 수정 등)"""
+        from sqlalchemy import inspect
+        from app.services.html_cleaner import html_to_text
+        
+        state = inspect(self)
+        content_changed = state.attrs.content.history.has_changes()
+        if self.content_text is None or (content_changed and not state.attrs.content_text.history.has_changes()):
+            self.content_text = html_to_text(self.content)
+    
+    def sync_structured_fields(self) -> None:
+        """location/program_info JSON에서 필터용 컬럼 갱신"""
+        location = self.location or {}
+        program_info = self.program_info or {}
+        self.country = _as_text(location.get("country"))
+        self.duration = _as_text(program_info.get("duration"))
+        self.price_range = _as_text(program_info.get("price_range"))
+    
     @property
     def location_display(self) -> str:
         """위치 정보를 사용자 친화적 문자열로 반환"""
@@ -86,6 +119,78 @@ class Newsletter(Base):
         return self.program_info["price_range"]
 
 
+def _as_text(value: Any) -> Optional[str]:
+    """Enum 값을 포함한 JSON 값을 문자열 컬럼 값으로 변환"""
+    if value is None:
+        return None
+    return str(getattr(value, "value", value))
+
+
+@event.listens_for(Newsletter, "before_insert")
+@event.listens_for(Newsletter, "before_update")
+def _sync_newsletter_structured_fields(mapper, connection, target):
+    """수집/관리자 수정 시 필터용 컬럼과 평문 본문 자동 동기화"""
+    target.sync_structured_fields()
+    target.sync_content_text()
+
+
+def backfill_derived_columns(db: Session, chunk_size: int = 1000) -> int:
+    """
+    기존 뉴스레터의 파생 컬럼 채우기
+    스키마 업그레이드로 컬럼이 새로 추가된 경우 호출
+    """
+    from sqlalchemy import update
+    
+    updated = 0
+    last_id = None
+    while True:
+        query = db.query(Newsletter.id, Newsletter.location, Newsletter.program_info)
+        if last_id is not None:
+            query = query.filter(Newsletter.id > last_id)
+        rows = query.order_by(Newsletter.id).limit(chunk_size).all()
+        if not rows:
+            break
+        
+        values = []
+        for row in rows:
+            location = row.location or {}
+            program_info = row.program_info or {}
+            values.append({
+                "id": row.id,
+                "country": _as_text(location.get("country")),
+                "duration": _as_text(program_info.get("duration")),
+                "price_range": _as_text(program_info.get("price_range")),
+            })
+        db.execute(update(Newsletter), values)
+        db.commit()
+        
+        last_id = rows[-1].id
+        updated += len(rows)
+    
+    return updated
+
+
+class NewsletterTag(Base):
+    """
+    정규화된 뉴스레터 태그 (Newsletter.tags의 역색인)
+    태그별 최신순 조회를 위해 (tag, collected_date) 인덱스 사용
+    """
+    __tablename__ = "newsletter_tags"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    newsletter_id = Column(String, nullable=False, index=True)
+    tag = Column(String(50), nullable=False)
+    collected_date = Column(DateTime)  # 뉴스레터 수집일 복사본 (정렬용)
+    
+    __table_args__ = (
+        Index("ix_newsletter_tags_tag_collected", "tag", "collected_date"),
+        UniqueConstraint("newsletter_id", "tag", name="uq_newsletter_tags_newsletter_tag"),
+    )
+    
+    def __repr__(self):
+        return f"<NewsletterTag(tag={self.tag}, newsletter_id={self.newsletter_id})>"
+
+
 class NewsletterSource(Base):
     """뉴스레터 소스 관리 모델"""
     __tablename__ = "newsletter_sources"
@@ -135,4 +240,139 @@ class ContentQuality(Base):
     evaluated_at = Column(DateTime, default=func.now())
     
     def __repr__(self):
-        return f"<ContentQuality(newsletter_id={self.newsletter_id}, score={self.total_score})>"
\ No newline at end of file
+        return f"<ContentQuality(newsletter_id={self.newsletter_id}, score={self.total_score})>"
+
+
+class JobCheckpoint(Base):
+    """배치 작업 진행 위치 (작업 결과와 같은 트랜잭션에서 기록해 재개 시 중복 처리 방지)"""
+    __tablename__ = "job_checkpoints"
+    
+    name = Column(String(50), primary_key=True)  # 작업 이름 (예: 'quality_rescore')
+    last_id = Column(String)  # 마지막으로 처리한 뉴스레터 id
+    processed = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<JobCheckpoint(name={self.name}, last_id={self.last_id})>"
+
+
+class NewsletterSignature(Base):
+    """근사 중복 검출용 MinHash 시그니처"""
+    __tablename__ = "newsletter_signatures"
+    
+    newsletter_id = Column(String, primary_key=True)
+    signature = Column(JSON, nullable=False)  # MinHash 값 배열
+    created_at = Column(DateTime, default=func.now())
+    
+    def __repr__(self):
+        return f"<NewsletterSignature(newsletter_id={self.newsletter_id})>"
+
+
+class NewsletterLSHBucket(Base):
+    """LSH 밴드 버킷 (밴드 해시 → 뉴스레터)"""
+    __tablename__ = "newsletter_lsh_buckets"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    bucket_key = Column(String(24), nullable=False, index=True)  # "밴드번호:해시"
+    newsletter_id = Column(String, nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<NewsletterLSHBucket(bucket_key={self.bucket_key}, newsletter_id={self.newsletter_id})>"
+
+
+class SeenUrl(Base):
+    """
+    웹 소스 수집 이력 (소스별로 이미 처리한 기사 URL)
+    목록 페이지에서 다시 보이면 분석/중복 검사 없이 건너뛴다 (url_frontier)
+    """
+    __tablename__ = "seen_urls"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String(100), nullable=False)
+    url_hash = Column(String(32), nullable=False)  # 정규화 URL의 blake2b-128 (hex)
+    url = Column(String(500))  # 확인용 원본 URL
+    first_seen = Column(DateTime, default=func.now())
+    last_seen = Column(DateTime, default=func.now(), index=True)  # 목록에서 마지막으로 본 시각 (압축 기준)
+    
+    __table_args__ = (
+        UniqueConstraint("source", "url_hash", name="uq_seen_urls_source_url_hash"),
+    )
+    
+    def __repr__(self):
+        return f"<SeenUrl(source={self.source}, url={self.url})>"
+
+
+class CollectionRun(Base):
+    """수집 실행 기록 (실행 1회 = 1행)"""
+    __tablename__ = "collection_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    trigger = Column(String(20), nullable=False, default="manual")  # 'manual', 'scheduled'
+    status = Column(String(20), nullable=False, default="running")  # 'running', 'completed', 'failed'
+    started_at = Column(DateTime, default=func.now(), index=True)
+    finished_at = Column(DateTime)
+    duration_seconds = Column(Float)
+    
+    # 합계
+    sources_total = Column(Integer, default=0)
+    newsletters_collected = Column(Integer, default=0)
+    errors = Column(Integer, default=0)
+    error_message = Column(Text)
+    
+    def __repr__(self):
+        return f"<CollectionRun(id={self.id}, status={self.status})>"
+
+
+class CollectionSourceRun(Base):
+    """
+    수집 실행 안의 소스별 기록
+    단계별 소요 시간(ms)과 단계별 항목 수로 병목 소스/단계를 찾는다
+    """
+    __tablename__ = "collection_source_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, nullable=False, index=True)
+    source = Column(String(100), nullable=False, index=True)
+    source_type = Column(String(20))
+    status = Column(String(20), nullable=False)  # 'success', 'failed', 'skipped'
+    started_at = Column(DateTime)
+    duration_ms = Column(Float, default=0.0)
+    
+    # 응답 정보
+    http_status = Column(Integer)
+    bytes_fetched = Column(Integer, default=0)
+    
+    # 단계별 소요 시간 (ms)
+    fetch_ms = Column(Float, default=0.0)  # HTTP 요청 (robots.txt 포함)
+    parse_ms = Column(Float, default=0.0)  # 피드/HTML 파싱과 항목 추출
+    filter_ms = Column(Float, default=0.0)  # 웰니스 관련성 검사
+    dedup_ms = Column(Float, default=0.0)  # 해시/근사 중복 검사
+    enrich_ms = Column(Float, default=0.0)  # 분류, 위치/프로그램 추출, 품질 평가
+    persist_ms = Column(Float, default=0.0)  # 저장, 태그/시그니처 색인, 커밋
+    wait_ms = Column(Float, default=0.0)  # 요청 간격 대기 (REQUEST_DELAY)
+    
+    # 단계별 항목 수
+    entries_parsed = Column(Integer, default=0)
+    entries_filtered = Column(Integer, default=0)  # 관련성 검사에서 제외
+    entries_deduped = Column(Integer, default=0)
+    entries_inserted = Column(Integer, default=0)
+    errors = Column(Integer, default=0)
+    error_message = Column(Text)
+    
+    # 메모리 프로파일링 모드에서만 기록 (tracemalloc)
+    peak_memory_bytes = Column(Integer)  # 소스 수집 중 최대 증가량
+    memory_delta_bytes = Column(Integer)  # 소스 수집 후 남은 증가량
+    memory_top = Column(JSON)  # [{"site": "파일:줄", "size_bytes": ..., "count": ...}] 파싱 직후 상위 할당 위치
+    
+    def __repr__(self):
+        return f"<CollectionSourceRun(run_id={self.run_id}, source={self.source}, status={self.status})>"
+    
+    @property
+    def slowest_stage(self) -> Optional[str]:
+        """대기 시간을 제외하고 가장 오래 걸린 단계"""
+        stages = {
+            stage: getattr(self, f"{stage}_ms") or 0.0
+            for stage in ("fetch", "parse", "filter", "dedup", "enrich", "persist")
+        }
+        stage = max(stages, key=stages.get)
+        return stage if stages[stage] > 0 else None
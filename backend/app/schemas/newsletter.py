@@ -102,7 +102,7 @@ class NewsletterBase(BaseModel):
 
 class NewsletterCreate(NewsletterBase):
     """뉴스레터 생성 스키마"""
-    pass
+    content_text: Optional[str] = Field(None, description="정규화 평문 (수집 시 html_cleaner 결과, 없으면 content에서 추출)")
 
 
 class NewsletterUpdate(BaseModel):
@@ -179,6 +179,7 @@ class NewsletterSearchParams(BaseModel):
     query: Optional[str] = Field(None, min_length=1, max_length=100, description="검색 키워드")
     category: Optional[PrimaryCategoryEnum] = None
     location_type: Optional[LocationTypeEnum] = None
+    country: Optional[str] = Field(None, max_length=50, description="국가")
     duration: Optional[DurationEnum] = None
     price_range: Optional[PriceRangeEnum] = None
     source: Optional[str] = None
@@ -250,6 +251,63 @@ class NewsletterStats(BaseModel):
     recent_collection_count: int  # 최근 24시간 수집량
 
 
+class NewsletterDashboard(BaseModel):
+    """메인 페이지 대시보드 (카테고리별 최신 뉴스레터 + 통계를 한 번에)"""
+    categories: Dict[str, List[NewsletterResponse]]
+    stats: NewsletterStats
+    data_version: str  # 캐시 단위 (수집/관리자 수정 시 변경)
+
+
+# 수집 실행 기록 스키마들
+class CollectionSourceRunResponse(BaseModel):
+    """소스별 수집 기록 (단계별 소요 시간은 ms)"""
+    source: str
+    source_type: Optional[str]
+    status: str
+    started_at: Optional[datetime]
+    duration_ms: float
+    http_status: Optional[int]
+    bytes_fetched: int
+    fetch_ms: float
+    parse_ms: float
+    filter_ms: float
+    dedup_ms: float
+    enrich_ms: float
+    persist_ms: float
+    wait_ms: float
+    slowest_stage: Optional[str]  # 대기 제외 가장 오래 걸린 단계
+    entries_parsed: int
+    entries_filtered: int
+    entries_deduped: int
+    entries_inserted: int
+    errors: int
+    error_message: Optional[str]
+    peak_memory_bytes: Optional[int] = None  # 메모리 프로파일링 모드에서만
+    memory_delta_bytes: Optional[int] = None
+    memory_top: Optional[List[Dict[str, Any]]] = None
+
+    class Config:
+        from_attributes = True
+
+
+class CollectionRunResponse(BaseModel):
+    """수집 실행 기록"""
+    id: int
+    trigger: str
+    status: str
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    duration_seconds: Optional[float]
+    sources_total: int
+    newsletters_collected: int
+    errors: int
+    error_message: Optional[str]
+    sources: List[CollectionSourceRunResponse] = []
+
+    class Config:
+        from_attributes = True
+
+
 class QualityMetrics(BaseModel):
     """품질 지표"""
     newsletter_id: str
@@ -0,0 +1,221 @@
+"""
+수집 실행 추적
+소스별 단계 시간(fetch/parse/filter/dedup/enrich/persist/wait)과 단계별 항목 수,
+응답 바이트/HTTP 상태를 모아 collection_source_runs 테이블 행으로 저장
+항목 수/바이트는 Prometheus 메트릭(app.core.metrics)에도 같이 기록한다
+메모리 프로파일링 모드(MemoryProfiler)에서는 소스별 최대 메모리와 상위 할당 위치도 기록
+"""
+import logging
+import os
+import sysconfig
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.core import metrics
+from app.models.newsletter import CollectionSourceRun
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("fetch", "parse", "filter", "dedup", "enrich", "persist", "wait")
+ENTRY_STAGES = ("parsed", "filtered", "deduped", "inserted")
+
+
+class SourceTrace:
+    """소스 하나의 수집 추적 (수집기 메서드에 전달되어 단계마다 누적)"""
+
+    def __init__(self, source_name: str, source_type: Optional[str] = None):
+        self.source_name = source_name
+        self.source_type = source_type
+        self.status = "success"
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+        self.duration = None
+        self.timings: Dict[str, float] = dict.fromkeys(STAGES, 0.0)  # 초
+        self.counts: Dict[str, int] = dict.fromkeys(ENTRY_STAGES, 0)
+        self.http_status: Optional[int] = None
+        self.bytes_fetched = 0
+        self.errors = 0
+        self.error_message: Optional[str] = None
+        # 메모리 프로파일링 (MemoryProfiler.measure 안에서만 설정)
+        self.memory: Optional["MemoryProfiler"] = None
+        self.peak_memory_bytes: Optional[int] = None
+        self.memory_delta_bytes: Optional[int] = None
+        self.memory_top: Optional[List[Dict[str, Any]]] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """with trace.stage("parse"): ... 구간 시간을 단계에 누적"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += time.perf_counter() - started
+            if name == "parse" and self.memory is not None:
+                self.memory.capture_parsed(self)
+
+    def count(self, stage: str, amount: int = 1) -> None:
+        """단계별 항목 수 (parsed/filtered/deduped/inserted)"""
+        self.counts[stage] += amount
+        metrics.collector_entries_total.inc((self.source_name, stage), amount)
+
+    def record_response(self, status_code: int, size: int) -> None:
+        self.http_status = status_code
+        self.bytes_fetched += size
+        metrics.collector_bytes_fetched_total.inc((self.source_name,), size)
+
+    def record_error(self, error: Any = None) -> None:
+        """항목 처리 오류 (소스 수집은 계속)"""
+        self.errors += 1
+        if error is not None and self.error_message is None:
+            self.error_message = str(error)[:1000]
+
+    def fail(self, error: Any) -> None:
+        """소스 전체 실패 (다운로드/파싱 실패 등)"""
+        self.status = "failed"
+        self.error_message = str(error)[:1000]
+
+    def skip(self, reason: str) -> None:
+        self.status = "skipped"
+        self.error_message = reason
+
+    def finish(self) -> float:
+        """소스 종료 (반환값: 전체 소요 시간, 초)"""
+        if self.duration is None:
+            self.duration = time.perf_counter() - self._started
+        return self.duration
+
+    def to_record(self, run_id: int) -> CollectionSourceRun:
+        """collection_source_runs 행"""
+        duration = self.finish()
+        return CollectionSourceRun(
+            run_id=run_id,
+            source=self.source_name,
+            source_type=self.source_type,
+            status=self.status,
+            started_at=self.started_at,
+            duration_ms=round(duration * 1000, 2),
+            http_status=self.http_status,
+            bytes_fetched=self.bytes_fetched,
+            entries_parsed=self.counts["parsed"],
+            entries_filtered=self.counts["filtered"],
+            entries_deduped=self.counts["deduped"],
+            entries_inserted=self.counts["inserted"],
+            errors=self.errors,
+            error_message=self.error_message,
+            peak_memory_bytes=self.peak_memory_bytes,
+            memory_delta_bytes=self.memory_delta_bytes,
+            memory_top=self.memory_top,
+            **{f"{stage}_ms": round(seconds * 1000, 2) for stage, seconds in self.timings.items()},
+        )
+
+
+class MemoryProfiler:
+    """
+    tracemalloc 기반 소스별 메모리 측정 (수집 실행 동안만 추적)
+    - 최대 증가량: 소스 시작 시점 대비 tracemalloc 최고치 (BeautifulSoup 트리/거대 피드가 여기서 드러남)
+    - 상위 할당 위치: 첫 파싱 단계가 끝난 직후 스냅샷과 시작 스냅샷의 차이 (파싱 결과가 살아 있는 시점)
+      파싱 전에 끝난 소스(다운로드 실패 등)는 종료 시점 스냅샷과 비교
+    """
+
+    # 추적 도구 자체와 import 시스템의 할당은 제외
+    _FILTERS = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    )
+
+    def __init__(self, top: int = 5, warn_bytes: Optional[int] = None):
+        self.top = top
+        self.warn_bytes = warn_bytes
+        self._started_here = False
+        self._baseline = 0
+        self._before: Optional[tracemalloc.Snapshot] = None
+        self._parsed: Optional[tracemalloc.Snapshot] = None
+
+    def start(self) -> None:
+        """추적 시작 (이미 다른 곳에서 추적 중이면 그대로 사용하고 종료도 하지 않음)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_here = True
+
+    def stop(self) -> None:
+        if self._started_here:
+            tracemalloc.stop()
+            self._started_here = False
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(self._FILTERS)
+
+    def _top_sites(self, snapshot: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+        grown = [stat for stat in snapshot.compare_to(self._before, "lineno") if stat.size_diff > 0]
+        return [
+            {
+                "site": f"{_short_path(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                "size_bytes": stat.size_diff,
+                "count": stat.count_diff,
+            }
+            for stat in grown[:self.top]
+        ]
+
+    def capture_parsed(self, trace: SourceTrace) -> None:
+        """첫 파싱 단계 직후 스냅샷 (이후 호출은 무시)"""
+        if self._before is not None and self._parsed is None:
+            self._parsed = self._snapshot()
+
+    @contextmanager
+    def measure(self, trace: SourceTrace) -> Iterator[None]:
+        """소스 하나를 감싸서 trace에 메모리 지표 기록"""
+        self._before = self._snapshot()
+        self._parsed = None
+        self._baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        trace.memory = self
+        try:
+            yield
+        finally:
+            trace.memory = None
+            current, peak = tracemalloc.get_traced_memory()
+            trace.peak_memory_bytes = max(0, peak - self._baseline)
+            trace.memory_delta_bytes = current - self._baseline
+            trace.memory_top = self._top_sites(self._parsed or self._snapshot())
+            self._before = self._parsed = None
+
+            if self.warn_bytes and trace.peak_memory_bytes >= self.warn_bytes:
+                logger.warning(
+                    f"소스 메모리 사용량 큼: {trace.source_name} - 최대 {trace.peak_memory_bytes / 1048576:.1f}MB "
+                    f"(상위 할당: {trace.memory_top[0]['site'] if trace.memory_top else '-'})"
+                )
+
+
+def memory_summary(traces: List[SourceTrace]) -> List[Dict[str, Any]]:
+    """실행 결과에 붙일 소스별 메모리 요약 (최대 사용량 큰 순)"""
+    measured = [trace for trace in traces if trace.peak_memory_bytes is not None]
+    measured.sort(key=lambda trace: trace.peak_memory_bytes, reverse=True)
+    return [
+        {
+            "source": trace.source_name,
+            "peak_bytes": trace.peak_memory_bytes,
+            "delta_bytes": trace.memory_delta_bytes,
+            "bytes_fetched": trace.bytes_fetched,
+            "top": trace.memory_top,
+        }
+        for trace in measured
+    ]
+
+
+def _short_path(filename: str) -> str:
+    """site-packages/표준 라이브러리/프로젝트 경로 앞부분을 잘라 읽기 쉬운 위치로"""
+    index = filename.rfind("site-packages" + os.sep)
+    if index != -1:
+        return filename[index + len("site-packages") + 1:]
+    stdlib = sysconfig.get_paths()["stdlib"] + os.sep
+    if filename.startswith(stdlib):
+        return filename[len(stdlib):]
+    index = filename.rfind(os.sep + "app" + os.sep)
+    if index != -1:
+        return filename[index + 1:]
+    return filename
@@ -0,0 +1,376 @@
+"""
+수집 시점 HTML 정리
+RSS/웹 본문의 마크업을 한 번만 파싱해서
+- 분석/검색용 정규화 평문 (Newsletter.content_text)
+- 표시용 정제 HTML (Newsletter.content: 허용 태그/속성만, 스크립트·스타일 등은 내용째 제거)
+을 만들고 MAX_CONTENT_LENGTH로 자른다
+lxml(C 파서)이 있으면 사용하고, 없으면 표준 라이브러리 html.parser로 같은 규칙을 적용
+"""
+import hashlib
+import logging
+import re
+import threading
+from html import escape, unescape
+from html.parser import HTMLParser
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
+
+from sqlalchemy.orm import Session
+
+try:
+    from lxml import etree  # 선택 의존성 (backend[fast-html]): 없으면 html.parser 사용
+except ImportError:
+    etree = None
+
+logger = logging.getLogger(__name__)
+
+# 내용째 버리는 태그
+DROP_TAGS = frozenset({
+    "script", "style", "iframe", "object", "embed", "noscript", "template", "svg", "math",
+    "form", "button", "select", "textarea", "head", "title",
+})
+# 표시용 HTML에 남기는 태그 (나머지는 태그만 벗기고 내용 유지)
+ALLOWED_TAGS = frozenset({
+    "a", "b", "blockquote", "br", "code", "em", "figcaption", "figure", "h1", "h2", "h3", "h4", "h5", "h6",
+    "hr", "i", "img", "li", "ol", "p", "pre", "strong", "sub", "sup", "table", "tbody", "td", "th", "thead",
+    "tr", "u", "ul",
+})
+ALLOWED_ATTRIBUTES = {
+    "a": frozenset({"href", "title"}),
+    "img": frozenset({"src", "alt", "title"}),
+    "td": frozenset({"colspan", "rowspan"}),
+    "th": frozenset({"colspan", "rowspan"}),
+}
+URL_ATTRIBUTES = frozenset({"href", "src"})
+SAFE_URL_SCHEMES = frozenset({"", "http", "https", "mailto"})
+# 평문에서 줄을 나누는 블록 태그
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "figcaption", "figure",
+    "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+    "section", "table", "td", "th", "tr", "ul",
+})
+VOID_TAGS = frozenset({"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"})
+# 끝 태그 생략 규칙 (새 태그가 열리면 직전 태그가 닫힘) - lxml은 파서가 처리, html.parser 경로용
+IMPLIED_END = {
+    "li": frozenset({"li"}),
+    "tr": frozenset({"tr", "td", "th"}),
+    "td": frozenset({"td", "th"}),
+    "th": frozenset({"td", "th"}),
+}
+CLOSES_PARAGRAPH = BLOCK_TAGS - {"br", "td", "th", "tr", "li", "dd", "dt", "figcaption"}
+# lxml은 인코딩 선언이 있는 XML 선언을 str 입력으로 받지 않음 (XHTML 피드 본문)
+XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+PARAGRAPH_OVERHEAD = len("<p></p>")
+
+
+class CleanedContent(NamedTuple):
+    text: str  # 정규화 평문 (분석/검색)
+    html: str  # 정제 HTML (표시)
+    truncated: bool
+
+
+class _Builder:
+    """파서 이벤트(시작 태그/끝 태그/텍스트)를 받아 정제 HTML과 평문을 동시에 만든다"""
+
+    def __init__(self):
+        self.html: List[str] = []
+        self.text: List[str] = []
+        self._skip = 0  # DROP_TAGS 안쪽 깊이
+        self._open: List[str] = []  # 출력한 허용 태그 스택 (닫히지 않은 태그 정리용)
+
+    def start(self, tag: str, attrs: Iterable[Tuple[str, Optional[str]]]) -> None:
+        if self._skip:
+            if tag in DROP_TAGS and tag not in VOID_TAGS:
+                self._skip += 1
+            return
+        if tag in DROP_TAGS:
+            if tag not in VOID_TAGS:
+                self._skip = 1
+            return
+        while self._open and (
+            self._open[-1] in IMPLIED_END.get(tag, ()) or (tag in CLOSES_PARAGRAPH and self._open[-1] == "p")
+        ):
+            self.end(self._open[-1])
+        if tag in BLOCK_TAGS:
+            self.text.append("\n")
+        if tag not in ALLOWED_TAGS:
+            return
+        self.html.append(f"<{tag}{_render_attributes(tag, attrs)}>")
+        if tag not in VOID_TAGS:
+            self._open.append(tag)
+
+    def end(self, tag: str) -> None:
+        if self._skip:
+            if tag in DROP_TAGS:
+                self._skip -= 1
+            return
+        if tag in BLOCK_TAGS:
+            self.text.append("\n")
+        if tag in ALLOWED_TAGS and tag in self._open:
+            # 안쪽에 닫히지 않은 태그가 있으면 함께 닫음 (html.parser 경로의 잘못된 마크업)
+            while self._open:
+                open_tag = self._open.pop()
+                self.html.append(f"</{open_tag}>")
+                if open_tag == tag:
+                    break
+
+    def data(self, text: str) -> None:
+        if self._skip or not text:
+            return
+        self.text.append(text)
+        self.html.append(escape(text, quote=False))
+
+    def result(self) -> Tuple[str, str]:
+        while self._open:
+            self.html.append(f"</{self._open.pop()}>")
+        return normalize_text("".join(self.text)), "".join(self.html).strip()
+
+
+def _render_attributes(tag: str, attrs: Iterable[Tuple[str, Optional[str]]]) -> str:
+    allowed = ALLOWED_ATTRIBUTES.get(tag)
+    if not allowed:
+        return ""
+    parts = []
+    for name, value in attrs:
+        name = name.lower()
+        if name not in allowed or value is None:
+            continue
+        value = value.strip()
+        if name in URL_ATTRIBUTES and not _is_safe_url(value):
+            continue
+        parts.append(f' {name}="{escape(value, quote=True)}"')
+    return "".join(parts)
+
+
+def _is_safe_url(value: str) -> bool:
+    """javascript:/data: 등 스크립트 실행 가능한 URL 차단"""
+    try:
+        scheme = urlparse("".join(value.split())).scheme.lower()
+    except ValueError:
+        return False
+    return scheme in SAFE_URL_SCHEMES
+
+
+def normalize_text(text: str) -> str:
+    """줄마다 공백을 하나로 모으고 빈 줄 제거"""
+    lines = (" ".join(line.split()) for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+class _StdlibParser(HTMLParser):
+    """lxml이 없을 때 쓰는 표준 라이브러리 파서 (같은 _Builder 규칙)"""
+
+    def __init__(self, builder: _Builder):
+        super().__init__(convert_charrefs=True)
+        self.builder = builder
+
+    def handle_starttag(self, tag, attrs):
+        self.builder.start(tag, attrs)
+        if tag in VOID_TAGS:
+            self.builder.end(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.builder.start(tag, attrs)
+        self.builder.end(tag)
+
+    def handle_endtag(self, tag):
+        if tag not in VOID_TAGS:
+            self.builder.end(tag)
+
+    def handle_data(self, data):
+        self.builder.data(data)
+
+
+# lxml 파서 객체는 스레드 간 공유할 수 없으므로 스레드마다 하나씩 생성해 재사용
+_lxml_local = threading.local()
+
+
+def _lxml_parser():
+    parser = getattr(_lxml_local, "parser", None)
+    if parser is None:
+        parser = _lxml_local.parser = etree.HTMLParser(
+            remove_comments=True, remove_pis=True, no_network=True, recover=True
+        )
+    return parser
+
+
+def _feed_lxml(raw: str, builder: _Builder) -> None:
+    """lxml 트리를 이벤트로 순회 (재귀 없이 iterwalk, body만)"""
+    root = etree.fromstring(XML_DECLARATION.sub("", raw, count=1), _lxml_parser())
+    if root is None:
+        return
+    body = root.find("body")
+    if body is None:
+        return
+    for event, element in etree.iterwalk(body, events=("start", "end")):
+        tag = element.tag if isinstance(element.tag, str) else None
+        if event == "start":
+            if tag is not None and element is not body:
+                builder.start(tag.lower(), element.attrib.items())
+            if tag is not None:
+                builder.data(element.text)
+        else:
+            if element is body:
+                continue
+            if tag is not None:
+                builder.end(tag.lower())
+            builder.data(element.tail)
+
+
+def _feed_stdlib(raw: str, builder: _Builder) -> None:
+    parser = _StdlibParser(builder)
+    parser.feed(raw)
+    parser.close()
+
+
+def _parse(raw: str) -> Tuple[str, str]:
+    builder = _Builder()
+    if etree is not None:
+        try:
+            _feed_lxml(raw, builder)
+        except (etree.Error, ValueError) as e:
+            logger.debug(f"lxml 파싱 실패, html.parser로 재시도: {e}")
+            builder = _Builder()
+            _feed_stdlib(raw, builder)
+    else:
+        _feed_stdlib(raw, builder)
+    return builder.result()
+
+
+def _paragraphs(text: str) -> str:
+    """평문을 문단 HTML로 (잘린 본문 표시용)"""
+    return "".join(f"<p>{escape(line, quote=False)}</p>" for line in text.split("\n") if line)
+
+
+def _fit_paragraphs(text: str, limit: int) -> Tuple[str, str]:
+    """
+    문단 HTML이 limit자 이내가 되도록 앞 문단부터 채움 (<p></p> 태그와 이스케이프 길이 포함)
+    반환값: (남긴 평문, 문단 HTML)
+    """
+    lines: List[str] = []
+    paragraphs: List[str] = []
+    remaining = limit
+    for line in text.split("\n"):
+        if not line:
+            continue
+        room = remaining - PARAGRAPH_OVERHEAD
+        if room <= 0:
+            break
+        paragraph = escape(line, quote=False)
+        if len(paragraph) > room:
+            line = _truncate_text(line, room)
+            paragraph = escape(line, quote=False)
+            if len(paragraph) > room:
+                # 이스케이프(&amp; 등)로 길어진 경우: 이스케이프 후 길이 기준으로 다시 자름
+                size = 0
+                for end, char in enumerate(line):
+                    size += len(escape(char, quote=False))
+                    if size > room:
+                        line = line[:end].rstrip()
+                        break
+                paragraph = escape(line, quote=False)
+            if line:
+                lines.append(line)
+                paragraphs.append(f"<p>{paragraph}</p>")
+            break
+        lines.append(line)
+        paragraphs.append(f"<p>{paragraph}</p>")
+        remaining -= len(paragraph) + PARAGRAPH_OVERHEAD
+    return "\n".join(lines), "".join(paragraphs)
+
+
+def _truncate_text(text: str, limit: int) -> str:
+    """limit자 이내로 자르고 가능하면 단어 경계에서 끊음"""
+    cut = text[:limit]
+    boundary = max(cut.rfind(" "), cut.rfind("\n"))
+    if boundary >= limit * 0.9:
+        cut = cut[:boundary]
+    return cut.rstrip()
+
+
+def clean_html(raw: Optional[str], max_length: Optional[int] = None) -> CleanedContent:
+    """
+    HTML(또는 평문) 본문 → (평문, 정제 HTML)
+    max_length를 넘으면 평문을 자르고, 표시용 HTML은 잘린 평문의 문단으로 대체 (태그가 중간에 끊기지 않게)
+    """
+    if not raw:
+        return CleanedContent("", "", False)
+
+    if "<" not in raw:
+        # 마크업 없는 평문 (웹 목록 추출 결과 등)은 파싱 생략
+        text = normalize_text(unescape(raw))
+        html = _paragraphs(text)
+    else:
+        text, html = _parse(raw)
+
+    truncated = False
+    if max_length and len(text) > max_length:
+        text = _truncate_text(text, max_length)
+        html = _paragraphs(text)
+        truncated = True
+    if max_length and len(html) > max_length:
+        # 평문은 한도 안이지만 마크업 때문에 넘는 경우: 태그를 버리고 한도 안에 들어가는 문단만
+        text, html = _fit_paragraphs(text, max_length)
+        truncated = True
+    return CleanedContent(text, html, truncated)
+
+
+def html_to_text(raw: Optional[str], max_length: Optional[int] = None) -> str:
+    """평문만 필요할 때 (요약, 백필)"""
+    return clean_html(raw, max_length).text
+
+
+def parser_name() -> str:
+    return "lxml" if etree is not None else "html.parser"
+
+
+def compute_content_hash(title: str, text: str) -> str:
+    """중복 검사용 해시 (제목 + 정규화 평문 - 마크업만 다른 재게시도 같은 해시)"""
+    return hashlib.sha256(f"{title}{text}".encode("utf-8")).hexdigest()
+
+
+def backfill_content_text(db: Session, chunk_size: int = 500) -> int:
+    """
+    content_text가 비어 있는 기존 뉴스레터의 평문 채우기
+    스키마 업그레이드로 컬럼이 새로 추가된 경우 호출 (기존 content는 그대로 둠)
+    content_hash도 새 규칙(제목 + 정규화 평문)으로 다시 계산 - 기존 행이 새 수집분의 중복 검사에 걸리도록
+    다른 행이 이미 같은 해시를 쓰면 (마크업만 다른 기존 중복) unique 제약 때문에 기존 해시 유지
+    """
+    from sqlalchemy import update
+    from app.core.config import settings
+    from app.models.newsletter import Newsletter
+
+    updated = 0
+    last_id = None
+    while True:
+        query = db.query(
+            Newsletter.id, Newsletter.title, Newsletter.content, Newsletter.content_hash
+        ).filter(Newsletter.content_text.is_(None))
+        if last_id is not None:
+            query = query.filter(Newsletter.id > last_id)
+        rows = query.order_by(Newsletter.id).limit(chunk_size).all()
+        if not rows:
+            break
+
+        texts = {row.id: html_to_text(row.content, settings.MAX_CONTENT_LENGTH) for row in rows}
+        hashes = {row.id: compute_content_hash(row.title, texts[row.id]) for row in rows}
+        owners = dict(
+            db.query(Newsletter.content_hash, Newsletter.id).filter(
+                Newsletter.content_hash.in_(set(hashes.values()))
+            ).all()
+        )
+        mappings = []
+        for row in rows:
+            content_hash = hashes[row.id]
+            if owners.get(content_hash, row.id) != row.id:
+                content_hash = row.content_hash
+            owners[content_hash] = row.id
+            mappings.append({"id": row.id, "content_text": texts[row.id], "content_hash": content_hash})
+
+        db.execute(update(Newsletter), mappings)
+        db.commit()
+
+        last_id = rows[-1].id
+        updated += len(rows)
+
+    return updated
@@ -0,0 +1,231 @@
+"""
+웹 목록 페이지 항목 추출 (collect_from_web)
+셀렉터 후보(article, .post, ... h2/h3)를 우선순위대로 보고 2개 이상 일치하는 첫 셀렉터의
+앞 MAX_ITEMS개 요소에서 제목/링크/본문을 뽑는다
+- lxml이 있으면 C 파서로 트리를 만들고 후보 요소를 한 번의 순회로 모든 셀렉터에 분류
+  (셀렉터별 재검색 없음), 요소 텍스트도 요소당 한 번만 계산
+- lxml이 없으면 기존 BeautifulSoup(html.parser) 경로
+- libxml2가 항목/제목/링크 요소를 작성자와 다르게 닫은 페이지(예: <h2> 안의 <p>)는
+  html.parser와 트리가 달라지므로 BeautifulSoup 경로로 처리
+결과는 scripts/bench_web_extraction.py --verify 로 기존 구현의 저장된 결과(golden)와 비교
+"""
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urljoin
+
+try:
+    from lxml import etree  # 선택 의존성 (backend[fast-html]): 없으면 BeautifulSoup(html.parser) 사용
+except ImportError:
+    etree = None
+
+logger = logging.getLogger(__name__)
+
+MAX_ITEMS = 10  # 페이지당 최대 항목 수
+MIN_TITLE_LENGTH = 10  # 제목이 이보다 길어야 유효한 항목
+SUMMARY_LENGTH = 300
+
+# 일반적인 뉴스레터/블로그 포스트 셀렉터 (우선순위 순): (CSS 셀렉터, 태그, 클래스)
+ITEM_SELECTORS = (
+    ("article", frozenset({"article"}), None),
+    (".post", None, "post"),
+    (".blog-post", None, "blog-post"),
+    (".news-item", None, "news-item"),
+    (".entry", None, "entry"),
+    (".story", None, "story"),
+    (".content-item", None, "content-item"),
+    ("h2, h3", frozenset({"h2", "h3"}), None),  # 제목만 있는 경우
+)
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+# 이 태그들의 끝 태그가 어긋나면 (libxml2가 먼저 닫음) 두 파서의 항목/제목/링크가 달라질 수 있음
+STRUCTURAL_TAGS = frozenset(HEADING_TAGS) | frozenset({"a"}) | frozenset(
+    tag for _, tags, _ in ITEM_SELECTORS if tags for tag in tags
+)
+
+if etree is not None:
+    # 셀렉터 후보 요소 (문서 순서, 한 번의 순회)
+    _CANDIDATES = etree.XPath(" | ".join(
+        [f"//{tag}" for _, tags, _ in ITEM_SELECTORS if tags for tag in sorted(tags)] + ["//*[@class]"]
+    ))
+    # BeautifulSoup get_text와 같은 문자열: script/style/template 안쪽 텍스트 제외
+    _TEXT_NODES = etree.XPath(
+        "descendant::text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+        smart_strings=False,
+    )
+    _FIRST_HEADING = etree.XPath(
+        "descendant::*[" + " or ".join(f"self::{tag}" for tag in HEADING_TAGS) + "][1]"
+    )
+    _FIRST_LINK = etree.XPath("descendant::a[@href][1]")
+
+
+def parser_name() -> str:
+    return "lxml" if etree is not None else "html.parser"
+
+
+def extract_items(markup: Union[bytes, str], base_url: str, parser: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    웹 페이지에서 뉴스레터 항목 추출
+    parser: "lxml" / "html.parser" (None이면 lxml이 있을 때 lxml)
+    """
+    parser = parser or parser_name()
+    if parser == "lxml":
+        if etree is None:
+            raise RuntimeError("lxml이 설치되어 있지 않습니다")
+        return _extract_lxml(markup, base_url)
+    return _extract_soup(markup, base_url)
+
+
+def _make_item(title: str, content: str, href: Optional[str], base_url: str) -> Dict[str, Any]:
+    url = ''
+    if href is not None:
+        url = urljoin(base_url, href) if not href.startswith('http') else href
+
+    # 요약 생성 (첫 300자)
+    summary = content[:SUMMARY_LENGTH - 3] + '...' if len(content) > SUMMARY_LENGTH else content
+
+    return {
+        'title': title,
+        'content': content,
+        'summary': summary,
+        'url': url,
+        'published_date': None  # 추후 개선 가능
+    }
+
+
+# lxml 경로
+
+def _decode(markup: Union[bytes, str]) -> str:
+    """BeautifulSoup과 같은 인코딩 판별 (BOM/선언된 charset → UTF-8 → windows-1252)"""
+    if isinstance(markup, str):
+        return markup
+    from bs4.dammit import UnicodeDammit
+    return UnicodeDammit(markup, is_html=True).unicode_markup or ""
+
+
+def _text(element) -> str:
+    """get_text(strip=True)와 같은 결과: 문자열마다 공백 제거 후 이어 붙임"""
+    return "".join(text.strip() for text in _TEXT_NODES(element))
+
+
+def _select_lxml(root) -> List[Any]:
+    """후보 요소를 한 번 순회하며 셀렉터별로 분류 → 2개 이상 일치한 첫 셀렉터의 요소"""
+    matches: List[List[Any]] = [[] for _ in ITEM_SELECTORS]
+    for element in _CANDIDATES(root):
+        tag = element.tag
+        classes = element.get("class")
+        class_names = classes.split() if classes else ()
+        for position, (_, tags, class_name) in enumerate(ITEM_SELECTORS):
+            if (tags is not None and tag in tags) or (class_name is not None and class_name in class_names):
+                matches[position].append(element)
+
+    for elements in matches:
+        if len(elements) > 1:
+            return elements[:MAX_ITEMS]
+    return []
+
+
+# lxml 파서 객체(와 error_log)는 스레드 간 공유할 수 없으므로 스레드마다 하나씩 생성해 재사용
+_lxml_local = threading.local()
+
+
+def _lxml_parser():
+    parser = getattr(_lxml_local, "parser", None)
+    if parser is None:
+        # 인코딩은 UnicodeDammit으로 미리 정하고(BeautifulSoup과 같은 규칙) UTF-8 바이트로 전달
+        parser = _lxml_local.parser = etree.HTMLParser(
+            encoding="utf-8", remove_comments=True, remove_pis=True, no_network=True, recover=True
+        )
+    return parser
+
+
+def _misnested(error_log, elements: List[Any]) -> bool:
+    """
+    libxml2가 항목 요소나 제목/링크를 끝 태그보다 먼저 닫았는지 ("Unexpected end tag : h2")
+    html.parser는 태그를 암묵적으로 닫지 않으므로 이 경우 두 트리의 항목 내용이 다를 수 있다
+    """
+    relevant = STRUCTURAL_TAGS | {element.tag for element in elements}
+    for entry in error_log:
+        if entry.type != etree.ErrorTypes.ERR_TAG_NAME_MISMATCH:
+            continue
+        _, _, tag = entry.message.rpartition(":")
+        tag = tag.strip().lower()
+        if not tag or tag in relevant:
+            return True
+    return False
+
+
+def _extract_lxml(markup: Union[bytes, str], base_url: str) -> List[Dict[str, Any]]:
+    parser = _lxml_parser()
+    try:
+        root = etree.fromstring(_decode(markup).encode("utf-8", "replace"), parser)
+    except etree.ParserError:
+        return []  # 빈 문서
+    if root is None:
+        return []
+    # 방금 이 스레드에서 파싱한 문서의 오류 기록 (다음 파싱 전에 복사본을 받아 둠)
+    error_log = parser.error_log
+
+    elements = _select_lxml(root)
+    if _misnested(error_log, elements):
+        logger.debug("끝 태그가 어긋난 목록 페이지 - BeautifulSoup 경로로 추출")
+        return _extract_soup(markup, base_url)
+
+    items = []
+    for element in elements:
+        try:
+            content = _text(element)
+            headings = _FIRST_HEADING(element)
+            title = _text(headings[0]) if headings else content[:100]
+            if not title:
+                continue
+
+            links = _FIRST_LINK(element)
+            item = _make_item(title, content, links[0].get("href") if links else None, base_url)
+            if len(item['title']) > MIN_TITLE_LENGTH:  # 유효한 제목이 있는 경우만
+                items.append(item)
+        except Exception as e:
+            logger.error(f"항목 추출 오류: {e}")
+    return items
+
+
+# BeautifulSoup(html.parser) 경로 - lxml이 없을 때, 결과 비교 기준
+
+def _extract_soup(markup: Union[bytes, str], base_url: str) -> List[Dict[str, Any]]:
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(markup, 'html.parser')
+
+    items = []
+    for selector, _, _ in ITEM_SELECTORS:
+        elements = soup.select(selector)
+        if elements and len(elements) > 1:  # 충분한 항목이 있는 셀렉터 선택
+            for element in elements[:MAX_ITEMS]:
+                item = _extract_item_from_element(element, base_url)
+                if item and len(item['title']) > MIN_TITLE_LENGTH:  # 유효한 제목이 있는 경우만
+                    items.append(item)
+            break
+
+    return items
+
+
+def _extract_item_from_element(element, base_url: str) -> Optional[Dict[str, Any]]:
+    """HTML 요소에서 뉴스레터 정보 추출"""
+    try:
+        # 제목 추출
+        title_elem = element.find(list(HEADING_TAGS))
+        title = title_elem.get_text(strip=True) if title_elem else element.get_text(strip=True)[:100]
+
+        if not title:
+            return None
+
+        # 링크 추출
+        link_elem = element.find('a', href=True)
+        href = link_elem['href'] if link_elem else None
+
+        # 내용 추출
+        content = element.get_text(strip=True)
+
+        return _make_item(title, content, href, base_url)
+
+    except Exception as e:
+        logger.error(f"항목 추출 오류: {e}")
+        return None
@@ -3,23 +3,35 @@
 RSS 피드 및 웹 크롤링을 통한 웰니스 리트리트 뉴스레터 수집
 """
 import asyncio
-import hashlib
 import logging
 import time
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-from urllib.parse import urljoin, urlparse
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
+from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
-import aiofiles
-import feedparser
-import httpx
-from bs4 import BeautifulSoup
 from sqlalchemy.orm import Session
 
+from app.core import metrics
 from app.core.config import settings
-from app.models.newsletter import Newsletter, NewsletterSource, ContentQuality
+from app.core.data_version import bump_data_version
+from app.core.events import event_broker
+from app.core.http_client import outbound_http
+from app.core.leader import LeaderElector, try_file_lock
+from app.models.newsletter import Newsletter, NewsletterSource, ContentQuality, CollectionRun, CollectionSourceRun
 from app.schemas.newsletter import NewsletterCreate, PrimaryCategoryEnum
+from app.services.collection_trace import MemoryProfiler, SourceTrace, memory_summary
+from app.services.html_cleaner import clean_html, compute_content_hash, html_to_text
+from app.services.item_extractor import extract_items
+from app.services.near_duplicate import NearDuplicateIndex
+from app.services.quality_scorer import compute_quality_features
+from app.services.tag_index import sync_tags
+from app.services.url_frontier import seen_url_frontier
+
+# feedparser/bs4/httpx는 수집할 때만 필요하므로 지연 import (API 전용 워커의 시작 시간 단축)
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -27,242 +39,242 @@ logger = logging.getLogger(__name__)
 class NewsletterCollector:
     """뉴스레터 수집 메인 클래스"""
     
-    def __init__(self):
-        self.session = None
-        self.client = None
+    def __init__(self, client: Optional["httpx.AsyncClient"] = None):
+        """
+        client: 재사용할 외부 요청 클라이언트 (없으면 공유 클라이언트 outbound_http 사용)
+        전달받은 클라이언트는 수집기가 닫지 않는다 (연결 풀이 수집 실행 간에 유지됨)
+        """
+        self.client = client
         self.collected_count = 0
         self.error_count = 0
+        self.near_duplicates = NearDuplicateIndex()
     
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
-        self.client = httpx.AsyncClient(
-            timeout=settings.REQUEST_TIMEOUT,
-            headers={
-                "User-Agent": settings.USER_AGENT,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-                "Accept-Encoding": "gzip, deflate",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
-        )
+        if self.client is None:
+            self.client = outbound_http.get_client()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """비동기 컨텍스트 매니저 종료"""
-        if self.client:
-            await self.client.aclose()
+        """비동기 컨텍스트 매니저 종료 (공유 클라이언트는 lifespan에서 닫음)"""
+        pass
+    
+    def _record_error(self, trace: SourceTrace, error: Any = None) -> None:
+        self.error_count += 1
+        trace.record_error(error)
+        metrics.collector_errors_total.inc((trace.source_name,))
     
-    def check_robots_txt(self, base_url: str) -> bool:
+    async def check_robots_txt(self, base_url: str) -> bool:
         """
         robots.txt 확인
-        윤리적 크롤링을 위한 robots.txt 준수
+        윤리적 크롤링을 위한 robots.txt 준수 (공유 클라이언트로 가져와 연결 재사용)
         """
         try:
+            response = await self.client.get(f"{base_url}/robots.txt")
+            if response.status_code in (401, 403):
+                return False  # urllib.robotparser와 같은 규칙: 접근 거부면 전부 금지
+            if response.status_code >= 400:
+                return True
             rp = RobotFileParser()
-            rp.set_url(f"{base_url}/robots.txt")
-            rp.read()
+            rp.parse(response.text.splitlines())
             return rp.can_fetch(settings.USER_AGENT, base_url)
         except Exception as e:
             logger.warning(f"robots.txt 확인 실패: {base_url} - {e}")
             return True  # 확인 실패 시 허용으로 처리
     
-    async def collect_from_rss(self, source: NewsletterSource, db: Session) -> List[Newsletter]:
+    async def collect_from_rss(self, source: NewsletterSource, db: Session,
+                               trace: Optional[SourceTrace] = None) -> List[Newsletter]:
         """
         RSS 피드에서 뉴스레터 수집
+        trace: 단계별 시간/항목 수 기록 (없으면 새로 만들어 메트릭에만 반영)
         """
         collected_newsletters = []
+        trace = trace or SourceTrace(source.name, source.type)
         
         try:
             logger.info(f"RSS 수집 시작: {source.name} ({source.url})")
             
-            # RSS 피드 파싱
-            feed = feedparser.parse(source.url)
+            # RSS 피드 다운로드 (공유 연결 풀) 후 파싱
+            import feedparser
+            with trace.stage("fetch"):
+                response = await self.client.get(
+                    source.url,
+                    headers={"User-Agent": settings.RSS_USER_AGENT},
+                    timeout=settings.RSS_TIMEOUT
+                )
+                trace.record_response(response.status_code, len(response.content))
+                response.raise_for_status()
+            with trace.stage("parse"):
+                feed = feedparser.parse(response.content, response_headers=dict(response.headers))
             
             if feed.bozo:
                 logger.warning(f"RSS 피드 파싱 오류: {source.name} - {feed.bozo_exception}")
             
+            trace.count("parsed", len(feed.entries))
             for entry in feed.entries:
                 try:
-                    # 기본 정보 추출
-                    title = entry.get('title', '').strip()
-                    summary = entry.get('summary', entry.get('description', '')).strip()
-                    content = entry.get('content', [{'value': summary}])[0].get('value', summary)
-                    link = entry.get('link', '')
-                    
-                    # 발행일 처리
-                    published_date = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        published_date = datetime(*entry.published_parsed[:6])
-                    elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                        published_date = datetime(*entry.updated_parsed[:6])
+                    with trace.stage("parse"):
+                        # 기본 정보 추출
+                        title = entry.get('title', '').strip()
+                        summary = entry.get('summary', entry.get('description', '')).strip()
+                        content = entry.get('content', [{'value': summary}])[0].get('value', summary)
+                        link = entry.get('link', '')
+                        
+                        # 마크업 정리 (평문은 분석/검색용, 정제 HTML은 표시용)
+                        cleaned = clean_html(content, settings.MAX_CONTENT_LENGTH)
+                        summary = html_to_text(summary)
+                        
+                        # 발행일 처리
+                        published_date = None
+                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                            published_date = datetime(*entry.published_parsed[:6])
+                        elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+                            published_date = datetime(*entry.updated_parsed[:6])
                     
                     # 웰니스 리트리트 관련성 검사
-                    if not self._is_wellness_retreat_related(title, content):
+                    with trace.stage("filter"):
+                        related = self._is_wellness_retreat_related(title, cleaned.text)
+                    if not related:
+                        trace.count("filtered")
                         continue
                     
                     # 뉴스레터 객체 생성
-                    newsletter_data = NewsletterCreate(
-                        title=title,
-                        summary=summary[:300] if summary else None,
-                        content=content,
-                        source=source.name,
-                        source_url=link,
-                        primary_category=source.default_category,
-                        published_date=published_date
-                    )
+                    with trace.stage("parse"):
+                        newsletter_data = NewsletterCreate(
+                            title=title,
+                            summary=summary[:300] if summary else None,
+                            content=cleaned.html,
+                            content_text=cleaned.text,
+                            source=source.name,
+                            source_url=link,
+                            primary_category=source.default_category,
+                            published_date=published_date
+                        )
                     
-                    newsletter = await self._create_newsletter(newsletter_data, db)
+                    newsletter = await self._create_newsletter(newsletter_data, db, trace)
                     if newsletter:
                         collected_newsletters.append(newsletter)
                         self.collected_count += 1
                     
                     # 요청 간격 준수
-                    await asyncio.sleep(settings.REQUEST_DELAY)
+                    with trace.stage("wait"):
+                        await asyncio.sleep(settings.REQUEST_DELAY)
                     
                 except Exception as e:
                     logger.error(f"RSS 항목 처리 오류: {source.name} - {e}")
-                    self.error_count += 1
+                    self._record_error(trace, e)
                     continue
             
             # 마지막 수집 시간 업데이트
-            source.last_collected = datetime.now()
-            db.commit()
+            with trace.stage("persist"):
+                source.last_collected = datetime.now()
+                db.commit()
             
         except Exception as e:
             logger.error(f"RSS 수집 실패: {source.name} - {e}")
-            self.error_count += 1
+            self._record_error(trace, e)
+            trace.fail(e)
         
         logger.info(f"RSS 수집 완료: {source.name} - {len(collected_newsletters)}개 수집")
         return collected_newsletters
     
-    async def collect_from_web(self, source: NewsletterSource, db: Session) -> List[Newsletter]:
+    async def collect_from_web(self, source: NewsletterSource, db: Session,
+                               trace: Optional[SourceTrace] = None) -> List[Newsletter]:
         """
         웹 크롤링을 통한 뉴스레터 수집
+        trace: 단계별 시간/항목 수 기록 (없으면 새로 만들어 메트릭에만 반영)
         """
         collected_newsletters = []
+        trace = trace or SourceTrace(source.name, source.type)
         
         try:
             # robots.txt 확인
             base_url = f"{urlparse(source.url).scheme}://{urlparse(source.url).netloc}"
-            if not self.check_robots_txt(base_url):
+            with trace.stage("fetch"):
+                allowed = await self.check_robots_txt(base_url)
+            if not allowed:
                 logger.warning(f"robots.txt 거부: {source.name}")
+                trace.skip("robots.txt 거부")
                 return collected_newsletters
             
             logger.info(f"웹 크롤링 시작: {source.name} ({source.url})")
             
             # 웹 페이지 요청
-            response = await self.client.get(source.url)
-            response.raise_for_status()
+            with trace.stage("fetch"):
+                response = await self.client.get(source.url)
+                trace.record_response(response.status_code, len(response.content))
+                response.raise_for_status()
             
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(response.content, 'html.parser')
+            with trace.stage("parse"):
+                # 뉴스레터 항목 추출 (일반적인 패턴들, lxml이 있으면 한 번의 순회로)
+                newsletter_items = extract_items(response.content, source.url)
+            trace.count("parsed", len(newsletter_items))
             
-            # 뉴스레터 항목 추출 (일반적인 패턴들)
-            newsletter_items = self._extract_newsletter_items(soup, source.url)
+            # 이전 실행에서 이미 처리한 기사는 분석/중복 검사 전에 제외 (블룸 필터 → 필요할 때만 IN 조회 한 번)
+            known_urls = set()
+            if settings.SEEN_URL_ENABLED:
+                with trace.stage("dedup"):
+                    known_urls = seen_url_frontier.known(db, source.name, [item['url'] for item in newsletter_items])
+            processed_urls = []
             
             for item in newsletter_items:
+                if item['url'] in known_urls:
+                    trace.count("deduped")
+                    continue
                 try:
                     # 웰니스 리트리트 관련성 검사
-                    if not self._is_wellness_retreat_related(item['title'], item['content']):
+                    with trace.stage("filter"):
+                        related = self._is_wellness_retreat_related(item['title'], item['content'])
+                    if not related:
+                        trace.count("filtered")
+                        processed_urls.append(item['url'])
                         continue
                     
-                    newsletter_data = NewsletterCreate(
-                        title=item['title'],
-                        summary=item['summary'],
-                        content=item['content'],
-                        source=source.name,
-                        source_url=item['url'],
-                        primary_category=source.default_category,
-                        published_date=item.get('published_date')
-                    )
+                    with trace.stage("parse"):
+                        cleaned = clean_html(item['content'], settings.MAX_CONTENT_LENGTH)
+                        newsletter_data = NewsletterCreate(
+                            title=item['title'],
+                            summary=item['summary'],
+                            content=cleaned.html,
+                            content_text=cleaned.text,
+                            source=source.name,
+                            source_url=item['url'],
+                            primary_category=source.default_category,
+                            published_date=item.get('published_date')
+                        )
                     
-                    newsletter = await self._create_newsletter(newsletter_data, db)
+                    errors_before = trace.errors
+                    newsletter = await self._create_newsletter(newsletter_data, db, trace)
                     if newsletter:
                         collected_newsletters.append(newsletter)
                         self.collected_count += 1
+                    if trace.errors == errors_before:
+                        processed_urls.append(item['url'])  # 저장 또는 중복 (저장 오류는 다음 실행에서 재시도)
                     
                     # 요청 간격 준수
-                    await asyncio.sleep(settings.REQUEST_DELAY)
+                    with trace.stage("wait"):
+                        await asyncio.sleep(settings.REQUEST_DELAY)
                     
                 except Exception as e:
                     logger.error(f"웹 크롤링 항목 처리 오류: {source.name} - {e}")
-                    self.error_count += 1
+                    self._record_error(trace, e)
                     continue
             
-            # 마지막 수집 시간 업데이트
-            source.last_collected = datetime.now()
-            db.commit()
+            # 수집 이력 기록, 마지막 수집 시간 업데이트
+            with trace.stage("persist"):
+                if settings.SEEN_URL_ENABLED:
+                    seen_url_frontier.add(db, source.name, processed_urls)
+                source.last_collected = datetime.now()
+                db.commit()
             
         except Exception as e:
             logger.error(f"웹 크롤링 실패: {source.name} - {e}")
-            self.error_count += 1
+            self._record_error(trace, e)
+            trace.fail(e)
         
         logger.info(f"웹 크롤링 완료: {source.name} - {len(collected_newsletters)}개 수집")
         return collected_newsletters
     
-    def _extract_newsletter_items(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, Any]]:
-        """
-        웹 페이지에서 뉴스레터 항목 추출
-        다양한 사이트 구조에 대응하는 일반적인 추출 로직
-        """
-        items = []
-        
-        # 일반적인 뉴스레터/블로그 포스트 셀렉터들
-        selectors = [
-            'article',
-            '.post', '.blog-post', '.news-item',
-            '.entry', '.story', '.content-item',
-            'h2, h3'  # 제목만 있는 경우
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            if elements and len(elements) > 1:  # 충분한 항목이 있는 셀렉터 선택
-                for element in elements[:10]:  # 최대 10개까지만
-                    item = self._extract_item_from_element(element, base_url)
-                    if item and len(item['title']) > 10:  # 유효한 제목이 있는 경우만
-                        items.append(item)
-                break
-        
-        return items
-    
-    def _extract_item_from_element(self, element, base_url: str) -> Optional[Dict[str, Any]]:
-        """HTML 요소에서 뉴스레터 정보 추출"""
-        try:
-            # 제목 추출
-            title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-            title = title_elem.get_text(strip=True) if title_elem else element.get_text(strip=True)[:100]
-            
-            if not title:
-                return None
-            
-            # 링크 추출
-            link_elem = element.find('a', href=True)
-            url = ''
-            if link_elem:
-                href = link_elem['href']
-                url = urljoin(base_url, href) if not href.startswith('http') else href
-            
-            # 내용 추출
-            content = element.get_text(strip=True)
-            
-            # 요약 생성 (첫 300자)
-            summary = content[:300] + '...' if len(content) > 300 else content
-            
-            return {
-                'title': title,
-                'content': content,
-                'summary': summary,
-                'url': url,
-                'published_date': None  # 추후 개선 가능
-            }
-            
-        except Exception as e:
-            logger.error(f"항목 추출 오류: {e}")
-            return None
-    
     def _is_wellness_retreat_related(self, title: str, content: str) -> bool:
         """
         웰니스 리트리트 관련성 검사
@@ -289,37 +301,59 @@ class NewsletterCollector:
         # 최소 1개 이상의 키워드가 있어야 함
         return keyword_count > 0
     
-    async def _create_newsletter(self, newsletter_data: NewsletterCreate, db: Session) -> Optional[Newsletter]:
+    async def _create_newsletter(self, newsletter_data: NewsletterCreate, db: Session,
+                                 trace: Optional[SourceTrace] = None) -> Optional[Newsletter]:
         """
         뉴스레터 생성 및 중복 검사
         """
+        trace = trace or SourceTrace(newsletter_data.source)
         try:
-            # 컨텐츠 해시 생성 (중복 검사용)
-            content_hash = hashlib.sha256(
-                f"{newsletter_data.title}{newsletter_data.content}".encode('utf-8')
-            ).hexdigest()
+            # 분석/중복 검사는 정규화 평문 기준 (마크업만 다른 재게시도 같은 해시)
+            text = newsletter_data.content_text
+            if text is None:
+                text = html_to_text(newsletter_data.content, settings.MAX_CONTENT_LENGTH)
             
-            # 중복 검사 (최근 30일 내에서만 체크)
-            cutoff_date = datetime.now() - timedelta(days=30)
-            existing = db.query(Newsletter).filter(
-                Newsletter.content_hash == content_hash,
-                Newsletter.collected_date >= cutoff_date
-            ).first()
+            with trace.stage("dedup"):
+                # 컨텐츠 해시 생성 (중복 검사용)
+                content_hash = compute_content_hash(newsletter_data.title, text)
+                
+                # 중복 검사 (최근 30일 내에서만 체크)
+                cutoff_date = datetime.now() - timedelta(days=30)
+                existing = db.query(Newsletter).filter(
+                    Newsletter.content_hash == content_hash,
+                    Newsletter.collected_date >= cutoff_date
+                ).first()
             if existing:
                 logger.debug(f"중복 뉴스레터 스킵 (30일 내): {newsletter_data.title[:50]}")
+                trace.count("deduped")
                 return None
             
+            # 근사 중복 검사 (제목/마크업만 바뀐 재게시 기사)
+            signature = None
+            if settings.NEAR_DUPLICATE_ENABLED:
+                with trace.stage("dedup"):
+                    signature = self.near_duplicates.signature(newsletter_data.title, text)
+                    match = self.near_duplicates.find_duplicate(db, signature)
+                if match:
+                    logger.debug(
+                        f"근사 중복 뉴스레터 스킵: {newsletter_data.title[:50]} "
+                        f"(유사: {match[0]}, {match[1]:.2f})"
+                    )
+                    trace.count("deduped")
+                    return None
+            
             # 고유 ID 생성
             newsletter_id = f"nl_{int(time.time())}_{hash(newsletter_data.title) % 10000}"
             
-            # 카테고리 자동 분류
-            category = self._classify_category(newsletter_data.title, newsletter_data.content)
-            
-            # 위치 정보 추출
-            location = self._extract_location(newsletter_data.title, newsletter_data.content)
-            
-            # 프로그램 정보 추출
-            program_info = self._extract_program_info(newsletter_data.title, newsletter_data.content)
+            with trace.stage("enrich"):
+                # 카테고리 자동 분류
+                category = self._classify_category(newsletter_data.title, text)
+                
+                # 위치 정보 추출
+                location = self._extract_location(newsletter_data.title, text)
+                
+                # 프로그램 정보 추출
+                program_info = self._extract_program_info(newsletter_data.title, text)
             
             # Newsletter 객체 생성
             newsletter = Newsletter(
@@ -327,6 +361,7 @@ class NewsletterCollector:
                 title=newsletter_data.title,
                 summary=newsletter_data.summary,
                 content=newsletter_data.content,
+                content_text=text,
                 source=newsletter_data.source,
                 source_url=newsletter_data.source_url,
                 primary_category=category or newsletter_data.primary_category,
@@ -338,19 +373,38 @@ class NewsletterCollector:
                 quality_score=0.0  # 추후 품질 평가에서 설정
             )
             
-            db.add(newsletter)
+            with trace.stage("persist"):
+                db.add(newsletter)
+                sync_tags(db, newsletter)
+                if signature is not None:
+                    self.near_duplicates.add(db, newsletter_id, signature)
             
             # 품질 평가 실행
-            quality_score = await self._evaluate_quality(newsletter)
-            newsletter.quality_score = quality_score
+            with trace.stage("enrich"):
+                quality_score = await self._evaluate_quality(newsletter)
+                newsletter.quality_score = quality_score
             
-            db.commit()
+            with trace.stage("persist"):
+                db.commit()
             
             logger.info(f"뉴스레터 생성: {newsletter.title[:50]} (품질: {quality_score:.2f})")
+            trace.count("inserted")
+            event_broker.publish("newsletter", {
+                "id": newsletter.id,
+                "title": newsletter.title,
+                "summary": newsletter.summary,
+                "source": newsletter.source,
+                "source_url": newsletter.source_url,
+                "primary_category": newsletter.primary_category,
+                "quality_score": newsletter.quality_score,
+                "collected_date": newsletter.collected_date,
+            })
             return newsletter
             
         except Exception as e:
             logger.error(f"뉴스레터 생성 오류: {e}")
+            trace.record_error(e)
+            metrics.collector_errors_total.inc((newsletter_data.source,))
             db.rollback()
             return None
     
@@ -445,36 +499,20 @@ class NewsletterCollector:
     async def _evaluate_quality(self, newsletter: Newsletter) -> float:
         """
         뉴스레터 품질 평가
-        Writer가 정의한 품질 기준 적용
+        Writer가 정의한 품질 기준 적용 (규칙은 quality_scorer와 공유)
         """
-        score = 0.0
-        max_score = 5.0
-        
-        # 1. 위치 정보 존재 (1점)
-        if newsletter.location:
-            score += 1.0
-        
-        # 2. 프로그램 정보 존재 (1점)
-        if newsletter.program_info:
-            score += 1.0
-        
-        # 3. 컨텐츠 길이 (1점)
-        content_length = len(newsletter.content)
-        if content_length > 1000:
-            score += 1.0
-        elif content_length > 500:
-            score += 0.5
-        
-        # 4. 제목 품질 (1점)
-        if len(newsletter.title) > 10 and any(keyword in newsletter.title.lower() 
-                                             for keyword in ['웰니스', 'wellness', '리트리트', 'retreat']):
-            score += 1.0
-        
-        # 5. 요약 존재 (1점)
-        if newsletter.summary and len(newsletter.summary) > 50:
-            score += 1.0
-        
-        return min(score / max_score, 1.0)  # 0.0 ~ 1.0 범위로 정규화
+        features = compute_quality_features(
+            newsletter.title,
+            newsletter.summary,
+            newsletter.content_text or newsletter.content,
+            newsletter.location,
+            newsletter.program_info,
+        )
+        return features["total_score"]
+
+
+class CollectionInProgressError(Exception):
+    """다른 워커/프로세스에서 이미 수집이 진행 중"""
 
 
 class CollectionScheduler:
@@ -483,45 +521,149 @@ class CollectionScheduler:
     def __init__(self, db: Session):
         self.db = db
     
-    async def run_collection(self) -> Dict[str, Any]:
+    async def run_collection(self, trigger: str = "manual", memory_profile: Optional[bool] = None) -> Dict[str, Any]:
         """
         전체 뉴스레터 수집 실행
+        워커 간 수집 잠금을 잡지 못하면 CollectionInProgressError
+        trigger: 실행 기록에 남길 실행 주체 ('manual', 'scheduled')
+        memory_profile: 소스별 메모리 측정 (None이면 COLLECTION_MEMORY_PROFILING 설정)
         """
+        if memory_profile is None:
+            memory_profile = settings.COLLECTION_MEMORY_PROFILING
+        with try_file_lock(settings.COLLECTION_LOCK_FILE) as acquired:
+            if not acquired:
+                raise CollectionInProgressError("이미 다른 프로세스에서 수집이 진행 중입니다")
+            profiler = None
+            if memory_profile:
+                profiler = MemoryProfiler(
+                    top=settings.COLLECTION_MEMORY_TOP,
+                    warn_bytes=int(settings.COLLECTION_MEMORY_WARN_MB * 1048576)
+                )
+                profiler.start()
+            try:
+                return await self._run_collection(trigger, profiler)
+            finally:
+                if profiler is not None:
+                    profiler.stop()
+    
+    def last_collected_at(self) -> Optional[datetime]:
+        """활성 소스 중 가장 최근 수집 시각"""
+        from sqlalchemy import func
+        return self.db.query(func.max(NewsletterSource.last_collected)).filter(
+            NewsletterSource.is_active == True
+        ).scalar()
+    
+    def _save_source_run(self, run: CollectionRun, trace: SourceTrace) -> None:
+        """소스별 기록 저장 (기록 실패가 수집을 멈추지 않도록 오류는 로그만)"""
+        try:
+            self.db.add(trace.to_record(run.id))
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"소스 실행 기록 저장 오류: {trace.source_name} - {e}")
+            self.db.rollback()
+    
+    def _prune_runs(self) -> None:
+        """COLLECTION_RUN_HISTORY개보다 오래된 실행 기록 삭제"""
+        keep = settings.COLLECTION_RUN_HISTORY
+        if keep <= 0:
+            return
+        cutoff = self.db.query(CollectionRun.id).order_by(CollectionRun.id.desc()).offset(keep).limit(1).scalar()
+        if cutoff is None:
+            return
+        self.db.query(CollectionSourceRun).filter(CollectionSourceRun.run_id <= cutoff).delete(synchronize_session=False)
+        self.db.query(CollectionRun).filter(CollectionRun.id <= cutoff).delete(synchronize_session=False)
+        self.db.commit()
+    
+    async def _run_collection(self, trigger: str, profiler: Optional[MemoryProfiler] = None) -> Dict[str, Any]:
         start_time = datetime.now()
         total_collected = 0
         total_errors = 0
+        traces: List[SourceTrace] = []
         
         # 활성화된 소스들 가져오기
         sources = self.db.query(NewsletterSource).filter(
             NewsletterSource.is_active == True
         ).all()
         
-        logger.info(f"뉴스레터 수집 시작: {len(sources)}개 소스")
+        # 실행 기록 (소스가 끝날 때마다 소스별 기록 추가)
+        run = CollectionRun(trigger=trigger, status="running", started_at=start_time, sources_total=len(sources))
+        self.db.add(run)
+        self.db.commit()
         
-        async with NewsletterCollector() as collector:
-            for source in sources:
-                try:
-                    if source.type == 'rss':
-                        newsletters = await collector.collect_from_rss(source, self.db)
-                    elif source.type == 'web':
-                        newsletters = await collector.collect_from_web(source, self.db)
-                    else:
-                        logger.warning(f"지원하지 않는 소스 타입: {source.type}")
-                        continue
-                    
-                    total_collected += len(newsletters)
-                    
-                except Exception as e:
-                    logger.error(f"소스 수집 오류: {source.name} - {e}")
-                    total_errors += 1
-            
-            total_collected = collector.collected_count
-            total_errors = collector.error_count
+        logger.info(f"뉴스레터 수집 시작: {len(sources)}개 소스 (실행 #{run.id})")
+        metrics.collector_runs_total.inc()
+        event_broker.publish("collection_started", {"sources": len(sources), "run_id": run.id})
+        
+        try:
+            async with NewsletterCollector() as collector:
+                for index, source in enumerate(sources, 1):
+                    trace = SourceTrace(source.name, source.type)
+                    traces.append(trace)
+                    try:
+                        if source.type == 'rss':
+                            with _measure_memory(profiler, trace):
+                                newsletters = await collector.collect_from_rss(source, self.db, trace)
+                        elif source.type == 'web':
+                            with _measure_memory(profiler, trace):
+                                newsletters = await collector.collect_from_web(source, self.db, trace)
+                        else:
+                            logger.warning(f"지원하지 않는 소스 타입: {source.type}")
+                            trace.skip(f"지원하지 않는 소스 타입: {source.type}")
+                            continue
+                        
+                        total_collected += len(newsletters)
+                        event_broker.publish("collection_progress", {
+                            "source": source.name,
+                            "collected": len(newsletters),
+                            "sources_done": index,
+                            "sources_total": len(sources),
+                        })
+                        
+                    except Exception as e:
+                        logger.error(f"소스 수집 오류: {source.name} - {e}")
+                        total_errors += 1
+                        trace.fail(e)
+                    finally:
+                        metrics.collector_source_duration_seconds.observe(trace.finish(), (source.name, source.type))
+                        self._save_source_run(run, trace)
+                
+                total_collected = collector.collected_count
+                total_errors = collector.error_count
+        except Exception as e:
+            run.status = "failed"
+            run.error_message = str(e)[:1000]
+            run.finished_at = datetime.now()
+            run.duration_seconds = (run.finished_at - start_time).total_seconds()
+            self.db.commit()
+            raise
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         
+        run.status = "completed"
+        run.finished_at = end_time
+        run.duration_seconds = duration
+        run.newsletters_collected = total_collected
+        run.errors = total_errors
+        self.db.commit()
+        try:
+            self._prune_runs()
+        except Exception as e:
+            logger.error(f"수집 실행 기록 정리 오류: {e}")
+            self.db.rollback()
+        if settings.SEEN_URL_ENABLED:
+            try:
+                seen_url_frontier.compact_if_due(self.db)
+            except Exception as e:
+                logger.error(f"수집 이력 압축 오류: {e}")
+                self.db.rollback()
+        
+        # 새 뉴스레터가 있으면 페이지/응답 캐시 무효화
+        if total_collected > 0:
+            bump_data_version()
+        
         result = {
+            'run_id': run.id,
             'start_time': start_time,
             'end_time': end_time,
             'duration_seconds': duration,
@@ -530,6 +672,51 @@ class CollectionScheduler:
             'errors': total_errors,
             'success_rate': (len(sources) - total_errors) / len(sources) if sources else 0
         }
+        if profiler is not None:
+            result['memory'] = memory_summary(traces)
         
         logger.info(f"수집 완료: {total_collected}개 수집, {total_errors}개 오류, {duration:.1f}초 소요")
-        return result
\ No newline at end of file
+        event_broker.publish("collection_completed", result)
+        return result
+
+
+def _measure_memory(profiler: Optional[MemoryProfiler], trace: SourceTrace):
+    """메모리 프로파일링 중이면 소스 측정 컨텍스트, 아니면 아무것도 하지 않는 컨텍스트"""
+    return profiler.measure(trace) if profiler is not None else nullcontext()
+
+
+async def run_scheduled_collection(elector: LeaderElector) -> None:
+    """
+    예약 수집 루프 (워커마다 실행되지만 리더 잠금을 가진 워커만 수집)
+    리더가 종료되면 잠금이 풀리고 다음 확인 주기에 다른 워커가 리더가 된다
+    마지막 수집 시각은 DB에서 읽으므로 리더가 바뀌어도 수집 간격이 유지된다
+    """
+    from app.core.database import SessionLocal
+    
+    interval = timedelta(hours=settings.COLLECTION_INTERVAL_HOURS)
+    last_attempt: Optional[datetime] = None
+    
+    try:
+        while True:
+            await asyncio.sleep(settings.LEADER_POLL_SECONDS)
+            if not elector.try_acquire():
+                continue
+            
+            db = SessionLocal()
+            try:
+                scheduler = CollectionScheduler(db)
+                last_run = max(filter(None, [scheduler.last_collected_at(), last_attempt]), default=None)
+                if last_run is not None and datetime.now() - last_run < interval:
+                    continue
+                
+                last_attempt = datetime.now()
+                logger.info("예약 수집 시작")
+                await scheduler.run_collection(trigger="scheduled")
+            except CollectionInProgressError:
+                logger.info("수동 수집이 진행 중이라 예약 수집을 건너뜁니다")
+            except Exception as e:
+                logger.error(f"예약 수집 오류: {e}")
+            finally:
+                db.close()
+    finally:
+        elector.release()
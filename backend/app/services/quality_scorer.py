@@ -0,0 +1,209 @@
+"""
+뉴스레터 품질 평가 서비스
+Writer가 정의한 품질 기준과 전체 코퍼스 재평가 배치 작업
+"""
+import argparse
+import logging
+import re
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.orm import Session
+
+from app.core.data_version import bump_data_version
+from app.models.newsletter import Newsletter, ContentQuality, JobCheckpoint
+
+logger = logging.getLogger(__name__)
+
+MAX_QUALITY_SCORE = 5.0
+CHECKPOINT_NAME = "quality_rescore"  # job_checkpoints 행 이름
+_TITLE_KEYWORD_RE = re.compile(r"웰니스|wellness|리트리트|retreat")
+
+
+def compute_quality_features(
+    title: str,
+    summary: Optional[str],
+    content: Optional[str],
+    location: Optional[Dict[str, Any]],
+    program_info: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    품질 지표 계산
+    위치/프로그램 정보, 컨텐츠 길이, 제목 품질, 요약 존재 (각 1점, 5점 만점)
+    """
+    content_length = len(content or "")
+    if content_length > 1000:
+        content_length_score = 1.0
+    elif content_length > 500:
+        content_length_score = 0.5
+    else:
+        content_length_score = 0.0
+
+    title = title or ""
+    keyword_relevance_score = 1.0 if (
+        len(title) > 10 and _TITLE_KEYWORD_RE.search(title.lower())
+    ) else 0.0
+
+    summary_score = 1.0 if summary and len(summary) > 50 else 0.0
+    has_location = bool(location)
+    has_program_details = bool(program_info)
+
+    score = (
+        float(has_location)
+        + float(has_program_details)
+        + content_length_score
+        + keyword_relevance_score
+        + summary_score
+    )
+
+    return {
+        "has_location": has_location,
+        "has_duration": bool(program_info and program_info.get("duration")),
+        "has_price": bool(program_info and program_info.get("price_range")),
+        "has_program_details": has_program_details,
+        "content_length_score": content_length_score,
+        "keyword_relevance_score": keyword_relevance_score,
+        "total_score": min(score / MAX_QUALITY_SCORE, 1.0),  # 0.0 ~ 1.0 범위로 정규화
+    }
+
+
+def score_batch(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    """행 묶음 일괄 평가 (id, title, summary, content, content_text, location, program_info 필요)"""
+    return [
+        dict(
+            compute_quality_features(
+                row.title, row.summary, row.content_text or row.content, row.location, row.program_info
+            ),
+            newsletter_id=row.id,
+        )
+        for row in rows
+    ]
+
+
+class QualityRescorer:
+    """
+    전체 뉴스레터 품질 재평가 작업
+    id 순 키셋 페이지네이션으로 청크를 스트리밍하고 ContentQuality/quality_score를 일괄 기록
+    ContentQuality는 뉴스레터당 최신 평가 한 행 (청크마다 기존 행 삭제 후 삽입)
+    진행 위치(job_checkpoints)는 청크 결과와 같은 트랜잭션에서 커밋 → 중단 후 재개해도 중복 삽입 없음
+    """
+
+    def __init__(self, db: Session, chunk_size: int = 1000, checkpoint_name: Optional[str] = CHECKPOINT_NAME):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.checkpoint_name = checkpoint_name
+
+    def _load_checkpoint(self) -> Optional[str]:
+        """마지막으로 처리한 뉴스레터 id 로드"""
+        if not self.checkpoint_name:
+            return None
+        checkpoint = self.db.get(JobCheckpoint, self.checkpoint_name)
+        return checkpoint.last_id if checkpoint else None
+
+    def _save_checkpoint(self, last_id: str, processed: int) -> None:
+        """진행 위치 기록 (커밋은 청크 결과와 함께)"""
+        if not self.checkpoint_name:
+            return
+        self.db.merge(JobCheckpoint(
+            name=self.checkpoint_name, last_id=last_id, processed=processed, updated_at=datetime.now()
+        ))
+
+    def _clear_checkpoint(self) -> None:
+        if not self.checkpoint_name:
+            return
+        self.db.query(JobCheckpoint).filter(JobCheckpoint.name == self.checkpoint_name).delete()
+        self.db.commit()
+
+    def _fetch_chunk(self, after_id: Optional[str]) -> List[Any]:
+        query = self.db.query(
+            Newsletter.id, Newsletter.title, Newsletter.summary, Newsletter.content, Newsletter.content_text,
+            Newsletter.location, Newsletter.program_info, Newsletter.quality_score
+        )
+        if after_id is not None:
+            query = query.filter(Newsletter.id > after_id)
+        return query.order_by(Newsletter.id).limit(self.chunk_size).all()
+
+    def run(self, resume: bool = False) -> Dict[str, Any]:
+        """재평가 실행"""
+        start = time.perf_counter()
+        last_id = self._load_checkpoint() if resume else None
+        total = self.db.query(Newsletter.id).count()
+        if last_id is not None:
+            remaining = self.db.query(Newsletter.id).filter(Newsletter.id > last_id).count()
+            logger.info(f"품질 재평가 재개: {last_id} 이후 {remaining}개 남음")
+        else:
+            remaining = total
+
+        processed = 0
+        changed = 0
+        while True:
+            rows = self._fetch_chunk(last_id)
+            if not rows:
+                break
+
+            features = score_batch(rows)
+            chunk_ids = [row.id for row in rows]
+            self.db.execute(delete(ContentQuality).where(ContentQuality.newsletter_id.in_(chunk_ids)))
+            self.db.execute(insert(ContentQuality), features)
+
+            previous = {row.id: row.quality_score for row in rows}
+            updates = [
+                {"id": item["newsletter_id"], "quality_score": item["total_score"]}
+                for item in features
+                if previous[item["newsletter_id"]] != item["total_score"]
+            ]
+            if updates:
+                self.db.execute(update(Newsletter), updates)
+
+            last_id = rows[-1].id
+            processed += len(rows)
+            changed += len(updates)
+            self._save_checkpoint(last_id, processed)
+            self.db.commit()
+
+            elapsed = time.perf_counter() - start
+            rate = processed / elapsed if elapsed > 0 else 0.0
+            eta = (remaining - processed) / rate if rate > 0 else 0.0
+            logger.info(
+                f"품질 재평가 진행: {processed}/{remaining} "
+                f"({rate:.0f}건/초, 점수 변경 {changed}건, 남은 시간 약 {eta:.0f}초)"
+            )
+
+        self._clear_checkpoint()
+        if changed:
+            bump_data_version()
+
+        duration = time.perf_counter() - start
+        return {
+            "total_newsletters": total,
+            "processed": processed,
+            "scores_changed": changed,
+            "duration_seconds": duration,
+            "rows_per_second": processed / duration if duration > 0 else 0.0,
+        }
+
+
+def main():
+    """품질 재평가 배치 작업"""
+    parser = argparse.ArgumentParser(description="전체 뉴스레터 품질 재평가")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="청크 크기 (기본값: 1000)")
+    parser.add_argument("--resume", action="store_true", help="마지막 체크포인트부터 이어서 실행")
+    args = parser.parse_args()
+
+    from app.core.database import SessionLocal, create_tables
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+    create_tables()
+    db = SessionLocal()
+    try:
+        result = QualityRescorer(db, chunk_size=args.chunk_size).run(resume=args.resume)
+        print(f"✅ {result['processed']}개 재평가 완료 (점수 변경 {result['scores_changed']}개, "
+              f"{result['duration_seconds']:.1f}초, {result['rows_per_second']:.0f}건/초)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
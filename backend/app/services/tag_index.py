@@ -0,0 +1,101 @@
+"""
+태그 역색인 서비스
+Newsletter.tags(JSON)를 newsletter_tags 테이블과 동기화하고 태그 기반 조회 제공
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
+
+from app.models.newsletter import Newsletter, NewsletterTag
+
+logger = logging.getLogger(__name__)
+
+MAX_TAG_LENGTH = 50
+
+
+def _normalize_tags(tags: Any) -> List[str]:
+    """공백 제거, 빈 값/중복 제거 (입력 순서 유지)"""
+    normalized = []
+    for tag in tags or []:
+        tag = str(tag).strip()[:MAX_TAG_LENGTH]
+        if tag and tag not in normalized:
+            normalized.append(tag)
+    return normalized
+
+
+def sync_tags(db: Session, newsletter: Newsletter) -> None:
+    """
+    뉴스레터의 태그 색인 갱신 (커밋은 호출자 책임)
+    수집 시와 관리자 태그 수정 시 호출
+    """
+    db.query(NewsletterTag).filter(
+        NewsletterTag.newsletter_id == newsletter.id
+    ).delete(synchronize_session=False)
+
+    collected_date = newsletter.collected_date or datetime.now()
+    db.add_all([
+        NewsletterTag(newsletter_id=newsletter.id, tag=tag, collected_date=collected_date)
+        for tag in _normalize_tags(newsletter.tags)
+    ])
+
+
+def filter_by_tags(query: Query, tags: List[str], match_all: bool = True) -> Query:
+    """
+    태그 조건으로 뉴스레터 쿼리 필터링
+    match_all=True: 모든 태그 포함(AND), False: 하나 이상 포함(OR)
+    """
+    tags = _normalize_tags(tags)
+    if not tags:
+        return query
+
+    tagged = query.session.query(NewsletterTag.newsletter_id).filter(NewsletterTag.tag.in_(tags))
+    if match_all and len(tags) > 1:
+        tagged = tagged.group_by(NewsletterTag.newsletter_id).having(
+            func.count(func.distinct(NewsletterTag.tag)) == len(tags)
+        )
+    return query.filter(Newsletter.id.in_(tagged.subquery().select()))
+
+
+def tag_counts(db: Session, limit: int = 50) -> List[Dict[str, Any]]:
+    """활성 뉴스레터 기준 태그별 개수 (태그 클라우드)"""
+    rows = db.query(
+        NewsletterTag.tag,
+        func.count(NewsletterTag.id).label('count')
+    ).join(
+        Newsletter, Newsletter.id == NewsletterTag.newsletter_id
+    ).filter(
+        Newsletter.is_active == True
+    ).group_by(NewsletterTag.tag).order_by(
+        func.count(NewsletterTag.id).desc(), NewsletterTag.tag
+    ).limit(limit).all()
+
+    return [{"tag": row.tag, "count": row.count} for row in rows]
+
+
+def backfill_tags(db: Session, chunk_size: int = 1000) -> int:
+    """기존 뉴스레터의 JSON 태그로 색인 테이블 채우기"""
+    indexed = 0
+    last_id = None
+    while True:
+        query = db.query(Newsletter.id, Newsletter.tags, Newsletter.collected_date)
+        if last_id is not None:
+            query = query.filter(Newsletter.id > last_id)
+        rows = query.order_by(Newsletter.id).limit(chunk_size).all()
+        if not rows:
+            break
+
+        db.bulk_insert_mappings(NewsletterTag, [
+            {"newsletter_id": row.id, "tag": tag, "collected_date": row.collected_date}
+            for row in rows
+            for tag in _normalize_tags(row.tags)
+        ])
+        db.commit()
+
+        last_id = rows[-1].id
+        indexed += len(rows)
+
+    logger.info(f"태그 색인 백필 완료: {indexed}개 뉴스레터")
+    return indexed
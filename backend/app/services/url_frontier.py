@@ -0,0 +1,195 @@
+"""
+웹 소스 수집 이력 (본 URL 프런티어)
+type='web' 소스는 실행마다 같은 목록 페이지를 다시 받으므로 이미 처리한 기사 URL을
+소스별로 seen_urls 테이블에 기록하고, 메모리 블룸 필터로 관련성 검사/DB 조회 전에 거른다
+- 블룸 필터에 없으면 확실히 새 URL → DB 조회 없이 통과
+- 블룸 필터에 있으면 (오탐 가능) 페이지 단위 IN 조회 한 번으로 확인
+- 압축(compact): SEEN_URL_RETENTION_DAYS 동안 목록에서 보이지 않은 URL과 삭제된 소스의 URL을 지우고 필터 재구성
+"""
+import hashlib
+import logging
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Set, Tuple
+from urllib.parse import urldefrag
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.newsletter import NewsletterSource, SeenUrl
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 블룸 필터 (삭제 불가 - 압축 때 통째로 재구성)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(1, capacity)
+        self.size = max(64, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> List[int]:
+        """128비트 해시 하나를 두 개로 나눠 k개 위치 생성 (double hashing)"""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def saturated(self) -> bool:
+        """용량을 넘겨 오탐률이 설정값보다 높아진 상태"""
+        return self.count > self.capacity
+
+
+def url_hash(url: str) -> str:
+    """정규화 URL(앞뒤 공백, #fragment 제거)의 해시"""
+    normalized = urldefrag(url.strip())[0]
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _bloom_key(source: str, hashed: str) -> str:
+    return f"{source}\n{hashed}"
+
+
+class SeenUrlFrontier:
+    """소스별 본 URL 집합 (워커마다 하나, 수집 실행 간에 유지)"""
+
+    def __init__(self):
+        self._bloom: Optional[BloomFilter] = None
+        self._compacted_at: Optional[float] = None  # time.monotonic()
+
+    @property
+    def loaded(self) -> bool:
+        return self._bloom is not None
+
+    def load(self, db: Optional[Session] = None, chunk_size: int = 10000) -> int:
+        """
+        seen_urls 전체로 블룸 필터 구성 (시작 시, 압축 후, 필터 포화 시)
+        반환값: 적재한 URL 수
+        """
+        own_session = db is None
+        if own_session:
+            from app.core.database import SessionLocal
+            db = SessionLocal()
+        try:
+            total = db.query(func.count(SeenUrl.id)).scalar() or 0
+            bloom = BloomFilter(max(settings.SEEN_URL_BLOOM_CAPACITY, total * 2), settings.SEEN_URL_BLOOM_ERROR_RATE)
+
+            last_id = 0
+            while True:
+                rows = db.query(SeenUrl.id, SeenUrl.source, SeenUrl.url_hash).filter(
+                    SeenUrl.id > last_id
+                ).order_by(SeenUrl.id).limit(chunk_size).all()
+                if not rows:
+                    break
+                for row in rows:
+                    bloom.add(_bloom_key(row.source, row.url_hash))
+                last_id = rows[-1].id
+        finally:
+            if own_session:
+                db.close()
+
+        self._bloom = bloom
+        logger.info(f"수집 이력 블룸 필터 적재: {bloom.count}개 URL ({len(bloom.bits) / 1024:.0f}KB, 해시 {bloom.hashes}개)")
+        return bloom.count
+
+    def _hashed(self, urls: Iterable[str]) -> List[Tuple[str, str]]:
+        return [(url, url_hash(url)) for url in urls if url]
+
+    def known(self, db: Session, source: str, urls: Iterable[str]) -> Set[str]:
+        """
+        이미 처리한 URL (목록 페이지 하나 분량)
+        블룸 필터를 통과한 URL만 DB에서 확인하고, 확인된 URL은 last_seen 갱신 (커밋은 호출자)
+        """
+        if self._bloom is None:
+            self.load(db)
+
+        maybe = [(url, hashed) for url, hashed in self._hashed(urls) if _bloom_key(source, hashed) in self._bloom]
+        if not maybe:
+            return set()
+
+        candidates = {hashed for _, hashed in maybe}
+        found = {
+            row.url_hash for row in db.query(SeenUrl.url_hash).filter(
+                SeenUrl.source == source,
+                SeenUrl.url_hash.in_(candidates)
+            ).all()
+        }
+        if found:
+            db.query(SeenUrl).filter(
+                SeenUrl.source == source,
+                SeenUrl.url_hash.in_(found)
+            ).update({"last_seen": datetime.now()}, synchronize_session=False)
+        return {url for url, hashed in maybe if hashed in found}
+
+    def add(self, db: Session, source: str, urls: Iterable[str]) -> int:
+        """
+        처리한 URL 기록 (커밋은 호출자)
+        다른 워커가 먼저 기록했을 수 있으므로 (필터 적재 이후 추가분) 한 번 더 확인하고 삽입
+        반환값: 새로 기록한 URL 수
+        """
+        pending = {hashed: url for url, hashed in self._hashed(urls)}
+        if not pending:
+            return 0
+
+        existing = {
+            row.url_hash for row in db.query(SeenUrl.url_hash).filter(
+                SeenUrl.source == source,
+                SeenUrl.url_hash.in_(list(pending))
+            ).all()
+        }
+        now = datetime.now()
+        db.add_all([
+            SeenUrl(source=source, url_hash=hashed, url=url[:500], first_seen=now, last_seen=now)
+            for hashed, url in pending.items() if hashed not in existing
+        ])
+        db.flush()
+
+        if self._bloom is not None:
+            for hashed in pending:
+                self._bloom.add(_bloom_key(source, hashed))
+            if self._bloom.saturated:
+                logger.info("수집 이력 블룸 필터 용량 초과 - 다음 조회 때 재구성")
+                self._bloom = None
+        return len(pending) - len(existing)
+
+    def compact(self, db: Session, retention_days: Optional[int] = None) -> int:
+        """오래된 URL/삭제된 소스의 URL 삭제 후 블룸 필터 재구성 (반환값: 삭제한 행 수)"""
+        if retention_days is None:
+            retention_days = settings.SEEN_URL_RETENTION_DAYS
+        cutoff = datetime.now() - timedelta(days=retention_days)
+
+        deleted = db.query(SeenUrl).filter(SeenUrl.last_seen < cutoff).delete(synchronize_session=False)
+        deleted += db.query(SeenUrl).filter(
+            SeenUrl.source.not_in(select(NewsletterSource.name))
+        ).delete(synchronize_session=False)
+        db.commit()
+
+        self.load(db)
+        self._compacted_at = time.monotonic()
+        if deleted:
+            logger.info(f"수집 이력 압축: {deleted}개 URL 삭제")
+        return deleted
+
+    def compact_if_due(self, db: Session) -> Optional[int]:
+        """마지막 압축 후 SEEN_URL_COMPACT_INTERVAL_HOURS가 지났으면 압축 (워커 시작 후 첫 수집 때 한 번)"""
+        interval = settings.SEEN_URL_COMPACT_INTERVAL_HOURS * 3600
+        if self._compacted_at is not None and time.monotonic() - self._compacted_at < interval:
+            return None
+        return self.compact(db)
+
+
+seen_url_frontier = SeenUrlFrontier()
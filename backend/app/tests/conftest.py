@@ -2,15 +2,24 @@
 테스트 설정 및 공통 픽스처
 pytest 설정 및 테스트용 데이터베이스 설정
 """
+import os
 import pytest
 import asyncio
 from typing import Generator
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
+# 테스트 간 요청 제한 카운터가 남지 않도록 프로세스 메모리 저장소 사용 (app import 전에 설정)
+os.environ.setdefault("RATE_LIMIT_STORAGE_URI", "memory://")
+# 앱 시작(lifespan)이 개발 DB 대신 테스트 DB를 쓰고, 예약 수집 루프는 띄우지 않음
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+os.environ.setdefault("COLLECTION_ENABLED", "false")
+
 from app.main import app
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
 from app.models.newsletter import Newsletter, NewsletterSource, Base
 
 
@@ -51,15 +60,57 @@ def db_session(test_db):
         db.close()
 
 
+@pytest.fixture
+def memory_db():
+    """테스트마다 새로 만드는 메모리 SQLite 세션 (서비스 단위 테스트용, 테스트 간 데이터 공유 없음)"""
+    memory_engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=memory_engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=memory_engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        memory_engine.dispose()
+
+
 @pytest.fixture
 def client(test_db):
     """테스트용 FastAPI 클라이언트"""
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def memory_client(memory_db):
+    """memory_db 세션을 쓰는 FastAPI 클라이언트 (테스트 간 데이터 공유 없이 API 검증)"""
+    def override_memory_db():
+        yield memory_db
+    
+    app.dependency_overrides[get_db] = override_memory_db
+    app.dependency_overrides[get_read_db] = override_memory_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def fresh_page_cache(tmp_path, monkeypatch):
+    """테스트마다 비운 페이지 캐시와 임시 데이터 버전 파일"""
+    from app.core.page_cache import page_cache
+    
+    monkeypatch.setattr(settings, "DATA_VERSION_FILE", str(tmp_path / "data_version"))
+    page_cache.clear()
+    yield page_cache
+    page_cache.clear()
+
+
 @pytest.fixture
 def sample_newsletter_data():
     """테스트용 뉴스레터 데이터"""
@@ -0,0 +1,89 @@
+"""
+시작 시 데이터베이스 준비 (create_tables 스키마 지문, 기본 소스 upsert) 테스트
+"""
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from app import main
+from app.core import database
+from app.models import newsletter as newsletter_models
+from app.models.newsletter import Newsletter, NewsletterSource
+
+
+@pytest.fixture
+def bootstrap_engine(tmp_path, monkeypatch):
+    """create_tables/setup_default_sources가 쓰는 전역 엔진을 임시 SQLite 파일로 교체"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'bootstrap.db'}", connect_args={"check_same_thread": False})
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    yield engine
+    engine.dispose()
+
+
+def _record_statements(engine) -> list:
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    return statements
+
+
+def test_matching_fingerprint_skips_ddl_and_backfills(bootstrap_engine, monkeypatch):
+    assert database.create_tables() is True
+
+    def fail(*args, **kwargs):
+        raise AssertionError("스키마 지문이 같으면 호출되면 안 됨")
+
+    monkeypatch.setattr(database, "upgrade_schema", fail)
+    monkeypatch.setattr(newsletter_models, "backfill_derived_columns", fail)
+    statements = _record_statements(bootstrap_engine)
+
+    assert database.create_tables() is False
+    assert len(statements) == 1
+    assert statements[0].startswith(f"SELECT value FROM {database.SCHEMA_META_TABLE}")
+
+
+def test_changed_fingerprint_upgrades_and_backfills(bootstrap_engine):
+    assert database.create_tables() is True
+    db = database.SessionLocal()
+    db.add(Newsletter(id="nl_old", title="Old", content="content", source="test", content_hash="nl_old",
+                      location={"country": "인도네시아"}))
+    db.commit()
+    db.close()
+
+    # 컬럼이 추가되기 전의 구 버전 스키마를 흉내냄
+    with bootstrap_engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_newsletters_country_active_collected"))
+        conn.execute(text("ALTER TABLE newsletters DROP COLUMN country"))
+        conn.execute(text(f"UPDATE {database.SCHEMA_META_TABLE} SET value = 'old' WHERE key = 'fingerprint'"))
+
+    assert database.create_tables() is True
+
+    with bootstrap_engine.connect() as conn:
+        assert conn.execute(text("SELECT country FROM newsletters WHERE id = 'nl_old'")).scalar() == "인도네시아"
+        indexes = {row[1] for row in conn.execute(text("PRAGMA index_list(newsletters)"))}
+    assert "ix_newsletters_country_active_collected" in indexes
+    assert database.create_tables() is False
+
+
+def test_setup_default_sources_is_idempotent(bootstrap_engine):
+    database.create_tables()
+
+    main.setup_default_sources()
+    db = database.SessionLocal()
+    try:
+        names = sorted(name for (name,) in db.query(NewsletterSource.name))
+        # 운영자가 바꾼 설정은 다시 실행해도 덮어쓰지 않음
+        db.query(NewsletterSource).filter_by(name="Yoga Journal").update({"is_active": False})
+        db.commit()
+    finally:
+        db.close()
+
+    main.setup_default_sources()
+    db = database.SessionLocal()
+    try:
+        assert sorted(name for (name,) in db.query(NewsletterSource.name)) == names
+        assert len(names) == 4
+        assert db.query(NewsletterSource).filter_by(name="Yoga Journal").one().is_active is False
+    finally:
+        db.close()
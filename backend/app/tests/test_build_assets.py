@@ -0,0 +1,34 @@
+"""
+정적 자산 빌드 스크립트 (scripts/build_assets.py) 테스트
+"""
+import importlib.util
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).resolve().parents[3] / "scripts" / "build_assets.py"
+spec = importlib.util.spec_from_file_location("build_assets", SCRIPT_PATH)
+build_assets = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(build_assets)
+
+
+def test_minify_js_strips_header_comments_and_trailing_whitespace():
+    source = "/* 헤더\n * 설명\n */\n// 한 줄 주석\n\nconst a = 1;   \n    return a;\n"
+
+    assert build_assets.minify_js(source) == "const a = 1;\n    return a;\n"
+
+
+def test_minify_js_keeps_comment_markers_inside_literals():
+    source = (
+        "const url = 'https://example.com/*path';\n"
+        "const glob = \"/* not a comment */\";\n"
+        "const pattern = /\\/\\/+/g;\n"
+        "const html = `\n"
+        "    // template text\n"
+        "`;\n"
+        "// 본문 주석은 그대로 둠\n"
+    )
+
+    assert build_assets.minify_js(source) == source
+
+
+def test_minify_js_keeps_code_after_header_block():
+    assert build_assets.minify_js("/* 헤더 */ const a = '/*';\n") == "const a = '/*';\n"
@@ -0,0 +1,210 @@
+"""
+수집 실행 추적 (collection_trace, 실행 기록 저장/정리, /collect/runs, 메모리 프로파일링) 테스트
+"""
+import logging
+import tracemalloc
+from datetime import datetime
+
+import pytest
+
+from app.core.config import settings
+from app.models.newsletter import CollectionRun, CollectionSourceRun
+from app.services import collection_trace
+from app.services.collection_trace import STAGES, MemoryProfiler, SourceTrace, memory_summary
+from app.services.newsletter_collector import CollectionScheduler
+
+
+class _FakeClock:
+    """perf_counter 대체 (호출할 때마다 step초씩 증가)"""
+
+    def __init__(self, step: float = 0.5):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(collection_trace.time, "perf_counter", fake)
+    return fake
+
+
+def test_stage_times_accumulate_per_stage(clock):
+    trace = SourceTrace("Feed", "rss")
+
+    for _ in range(3):
+        with trace.stage("parse"):
+            pass
+    with trace.stage("fetch"):
+        clock.now += 1.0
+    with pytest.raises(ValueError):
+        with trace.stage("persist"):
+            raise ValueError("저장 실패")
+
+    assert trace.timings["parse"] == pytest.approx(1.5)
+    assert trace.timings["fetch"] == pytest.approx(1.5)
+    assert trace.timings["persist"] == pytest.approx(0.5)  # 예외가 나도 구간 시간은 기록
+    assert trace.timings["wait"] == 0.0
+
+
+def test_to_record_fills_columns(clock):
+    trace = SourceTrace("Feed", "rss")
+    with trace.stage("fetch"):
+        pass
+    trace.record_response(200, 2048)
+    trace.count("parsed", 10)
+    trace.count("filtered", 3)
+    trace.count("deduped", 2)
+    trace.count("inserted", 5)
+    trace.record_error(ValueError("첫 번째 오류"))
+    trace.record_error(ValueError("두 번째 오류"))
+
+    record = trace.to_record(run_id=7)
+
+    assert (record.run_id, record.source, record.source_type, record.status) == (7, "Feed", "rss", "success")
+    assert (record.http_status, record.bytes_fetched) == (200, 2048)
+    assert (record.entries_parsed, record.entries_filtered, record.entries_deduped, record.entries_inserted) == (
+        10, 3, 2, 5
+    )
+    assert record.errors == 2
+    assert record.error_message == "첫 번째 오류"
+    assert record.fetch_ms == 500.0
+    assert all(getattr(record, f"{stage}_ms") == 0.0 for stage in STAGES if stage != "fetch")
+    assert record.duration_ms == 1500.0  # 시작 ~ 종료 (fetch 구간 포함)
+    assert record.peak_memory_bytes is None and record.memory_top is None
+
+
+def test_fail_and_skip_set_status():
+    failed, skipped = SourceTrace("Broken"), SourceTrace("Paused")
+    failed.fail(RuntimeError("x" * 2000))
+    skipped.skip("robots.txt 차단")
+
+    assert failed.to_record(1).status == "failed"
+    assert len(failed.error_message) == 1000
+    assert (skipped.to_record(1).status, skipped.error_message) == ("skipped", "robots.txt 차단")
+
+
+def _add_run(db, sources=("Feed A",)) -> CollectionRun:
+    run = CollectionRun(trigger="manual", status="completed", started_at=datetime.now(), sources_total=len(sources))
+    db.add(run)
+    db.commit()
+    scheduler = CollectionScheduler(db)
+    for source in sources:
+        scheduler._save_source_run(run, SourceTrace(source, "rss"))
+    return run
+
+
+def test_save_source_run_and_prune_keep_latest_runs(memory_db, monkeypatch):
+    monkeypatch.setattr(settings, "COLLECTION_RUN_HISTORY", 3)
+    runs = [_add_run(memory_db, ("Feed A", "Feed B")) for _ in range(5)]
+
+    assert memory_db.query(CollectionSourceRun).count() == 10
+    CollectionScheduler(memory_db)._prune_runs()
+
+    kept = [run_id for (run_id,) in memory_db.query(CollectionRun.id).order_by(CollectionRun.id)]
+    assert kept == [run.id for run in runs[-3:]]
+    assert {run_id for (run_id,) in memory_db.query(CollectionSourceRun.run_id)} == set(kept)
+    assert memory_db.query(CollectionSourceRun).count() == 6
+
+
+def test_prune_is_disabled_with_zero_history(memory_db, monkeypatch):
+    monkeypatch.setattr(settings, "COLLECTION_RUN_HISTORY", 0)
+    for _ in range(3):
+        _add_run(memory_db)
+
+    CollectionScheduler(memory_db)._prune_runs()
+    assert memory_db.query(CollectionRun).count() == 3
+
+
+def test_runs_endpoint_filters_by_source(memory_client, memory_db):
+    first = _add_run(memory_db, ("Feed A", "Feed B"))
+    second = _add_run(memory_db, ("Feed B",))
+
+    runs = memory_client.get("/api/v1/newsletters/collect/runs", params={"source": "Feed A"}).json()
+    assert [run["id"] for run in runs] == [second.id, first.id]
+    assert {run["id"]: [source["source"] for source in run["sources"]] for run in runs} == {
+        first.id: ["Feed A"], second.id: []
+    }
+
+    runs = memory_client.get("/api/v1/newsletters/collect/runs").json()
+    assert [source["source"] for source in runs[1]["sources"]] == ["Feed A", "Feed B"]
+
+    runs = memory_client.get("/api/v1/newsletters/collect/runs", params={"include_sources": False}).json()
+    assert all(run["sources"] == [] for run in runs)
+
+
+@pytest.fixture
+def no_tracing():
+    """다른 도구가 tracemalloc을 켜 둔 환경에서도 테스트가 독립적이도록 시작 전 상태 보장"""
+    was_tracing = tracemalloc.is_tracing()
+    tracemalloc.stop()
+    yield
+    tracemalloc.stop()
+    if was_tracing:
+        tracemalloc.start()
+
+
+def _allocate_while_parsing(trace: SourceTrace, size: int = 2_000_000) -> list:
+    with trace.stage("parse"):
+        kept = [bytearray(1000) for _ in range(size // 1000)]
+    return kept
+
+
+def test_measure_fills_peak_delta_and_top_sites(no_tracing):
+    profiler = MemoryProfiler(top=3)
+    profiler.start()
+    trace = SourceTrace("Big Feed")
+    try:
+        with profiler.measure(trace):
+            kept = _allocate_while_parsing(trace)
+            transient = bytearray(4_000_000)
+            del transient
+    finally:
+        profiler.stop()
+
+    assert trace.memory is None
+    assert trace.peak_memory_bytes >= 6_000_000
+    assert 2_000_000 <= trace.memory_delta_bytes < trace.peak_memory_bytes
+    assert 1 <= len(trace.memory_top) <= 3
+    top = trace.memory_top[0]
+    assert top["site"].startswith("app/tests/test_collection_trace.py:")
+    assert top["size_bytes"] >= 2_000_000 and top["count"] >= 2000
+    assert len(kept) == 2000
+
+    record = trace.to_record(run_id=1)
+    assert record.peak_memory_bytes == trace.peak_memory_bytes
+    assert record.memory_top == trace.memory_top
+    assert memory_summary([trace, SourceTrace("Unmeasured")])[0]["source"] == "Big Feed"
+
+
+def test_stop_only_ends_tracing_it_started(no_tracing):
+    profiler = MemoryProfiler()
+    profiler.start()
+    assert tracemalloc.is_tracing()
+    profiler.stop()
+    assert not tracemalloc.is_tracing()
+
+    tracemalloc.start()
+    profiler.start()
+    with profiler.measure(SourceTrace("Feed")):
+        pass
+    profiler.stop()
+    assert tracemalloc.is_tracing()  # 외부에서 켠 추적은 그대로 둠
+
+
+def test_measure_warns_on_large_peak(no_tracing, caplog):
+    profiler = MemoryProfiler(warn_bytes=1_000_000)
+    profiler.start()
+    trace = SourceTrace("Huge Feed")
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.services.collection_trace"):
+            with profiler.measure(trace):
+                _allocate_while_parsing(trace)
+    finally:
+        profiler.stop()
+
+    assert any("Huge Feed" in record.message for record in caplog.records)
@@ -0,0 +1,155 @@
+"""
+응답 압축 미들웨어 (CompressionMiddleware) 테스트
+"""
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, CompressionStats, accepted_encodings, choose_encoding
+
+BODY = b'{"message": "' + b"wellness " * 200 + b'"}'
+GZIP = {"Accept-Encoding": "gzip"}
+
+
+@pytest.fixture
+def stats():
+    return CompressionStats()
+
+
+@pytest.fixture
+def compression_client(stats):
+    app = FastAPI()
+
+    @app.get("/json")
+    def json_body():
+        return Response(BODY, media_type="application/json", headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    def small_body():
+        return Response(b'{"ok": true}', media_type="application/json")
+
+    @app.get("/encoded")
+    def encoded_body():
+        return Response(gzip.compress(BODY), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/status/{status_code}")
+    def status_body(status_code: int):
+        body = b"" if status_code in (204, 304) else BODY
+        return Response(body, status_code=status_code, media_type="application/json")
+
+    @app.get("/events")
+    def events():
+        return StreamingResponse(iter([b"data: " + BODY + b"\n\n"]), media_type="text/event-stream")
+
+    @app.get("/image")
+    def image():
+        return Response(BODY, media_type="image/png")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=500, stats=stats)
+    return TestClient(app)
+
+
+def test_compresses_large_allowed_response(compression_client, stats):
+    response = compression_client.get("/json", headers=GZIP)
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(BODY)
+    assert response.content == BODY  # httpx가 gzip 해제
+    assert stats.snapshot()["encodings"]["gzip"]["responses"] == 1
+
+
+def test_strong_etag_becomes_weak(compression_client):
+    assert compression_client.get("/json", headers=GZIP).headers["etag"] == 'W/"abc"'
+    assert compression_client.get("/json", headers={"Accept-Encoding": "identity"}).headers["etag"] == '"abc"'
+
+
+def test_skips_when_client_refuses_gzip(compression_client):
+    response = compression_client.get("/json", headers={"Accept-Encoding": "gzip;q=0"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_skips_already_encoded_response(compression_client):
+    response = compression_client.get("/encoded", headers=GZIP)
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == BODY  # 한 번만 압축되어 있어야 한 번의 해제로 원본이 나옴
+
+
+@pytest.mark.parametrize("status_code", [204, 206, 304])
+def test_skips_status_codes(compression_client, status_code):
+    response = compression_client.get(f"/status/{status_code}", headers=GZIP)
+
+    assert response.status_code == status_code
+    assert "content-encoding" not in response.headers
+
+
+def test_skips_event_stream(compression_client):
+    response = compression_client.get("/events", headers=GZIP)
+
+    assert "content-encoding" not in response.headers
+    assert response.content.startswith(b"data: ")
+
+
+def test_skips_responses_below_minimum_size(compression_client, stats):
+    response = compression_client.get("/small", headers=GZIP)
+
+    assert "content-encoding" not in response.headers
+    assert stats.snapshot()["skipped"] == 1
+
+
+def test_skips_content_types_outside_allowlist(compression_client):
+    response = compression_client.get("/image", headers=GZIP)
+
+    assert "content-encoding" not in response.headers
+    assert response.content == BODY
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_flushes_each_chunk(stats):
+    chunks = [b"first chunk\n", b"second chunk\n", b"third chunk\n"]
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"text/plain"), (b"content-length", b"999")]})
+        for chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+    await CompressionMiddleware(app, minimum_size=500, stats=stats)(scope, None, send)
+
+    start, *bodies = messages
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+
+    # 각 청크가 도착하는 즉시 해제 가능한 만큼 전송되어야 함 (Z_SYNC_FLUSH)
+    decoder = zlib.decompressobj(31)
+    for chunk, message in zip(chunks, bodies):
+        assert message["more_body"] is True
+        assert decoder.decompress(message["body"]) == chunk
+    assert bodies[-1].get("more_body", False) is False
+    decoder.decompress(bodies[-1]["body"])
+    assert decoder.eof
+
+    snapshot = stats.snapshot()["encodings"]["gzip"]
+    assert snapshot["streamed"] == 1
+    assert snapshot["bytes_in"] == sum(len(chunk) for chunk in chunks)
+
+
+def test_accept_encoding_parsing():
+    assert accepted_encodings("gzip;q=0, br ; q=0.5, identity") == {"br", "identity"}
+    assert accepted_encodings("GZIP;q=0.000") == set()
+    assert choose_encoding("deflate, gzip;q=1.0") == "gzip"
+    assert choose_encoding("gzip;q=0") is None
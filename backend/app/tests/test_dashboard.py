@@ -0,0 +1,71 @@
+"""
+메인 페이지 대시보드 (/newsletters/dashboard) 테스트
+"""
+from datetime import datetime, timedelta
+
+from app.models.newsletter import Newsletter, NewsletterSource
+
+DASHBOARD_URL = "/api/v1/newsletters/dashboard"
+
+
+def _add_newsletter(db, newsletter_id: str, category, hours_ago: int, is_active: bool = True,
+                    quality_score: float = 0.5) -> None:
+    db.add(Newsletter(
+        id=newsletter_id, title=f"Newsletter {newsletter_id}", content="content", source="test",
+        content_hash=newsletter_id, primary_category=category, is_active=is_active, quality_score=quality_score,
+        collected_date=datetime.now() - timedelta(hours=hours_ago)
+    ))
+
+
+def _seed(db):
+    for number in range(5):
+        _add_newsletter(db, f"nl_mind_{number}", "mind_wellness", hours_ago=number * 10, quality_score=0.1 * number)
+    _add_newsletter(db, "nl_mind_deleted", "mind_wellness", hours_ago=0, is_active=False)
+    _add_newsletter(db, "nl_body_0", "body_wellness", hours_ago=5)
+    _add_newsletter(db, "nl_uncategorized", None, hours_ago=1)
+    db.add_all([
+        NewsletterSource(name="Active Feed", url="https://example.com/feed", type="rss", is_active=True),
+        NewsletterSource(name="Paused Feed", url="https://example.com/paused", type="rss", is_active=False),
+    ])
+    db.commit()
+
+
+def _ids(dashboard, category) -> list:
+    return [item["id"] for item in dashboard["categories"][category]]
+
+
+def test_dashboard_returns_newest_active_rows_per_category(memory_client, memory_db, fresh_page_cache):
+    _seed(memory_db)
+
+    dashboard = memory_client.get(DASHBOARD_URL, params={"per_category": 3}).json()
+
+    assert set(dashboard["categories"]) == {"mind_wellness", "body_wellness", "spa_therapy"}
+    assert _ids(dashboard, "mind_wellness") == ["nl_mind_0", "nl_mind_1", "nl_mind_2"]
+    assert _ids(dashboard, "body_wellness") == ["nl_body_0"]
+    assert _ids(dashboard, "spa_therapy") == []
+
+
+def test_dashboard_per_category_limit(memory_client, memory_db, fresh_page_cache):
+    _seed(memory_db)
+
+    dashboard = memory_client.get(DASHBOARD_URL, params={"per_category": 1}).json()
+    assert _ids(dashboard, "mind_wellness") == ["nl_mind_0"]
+
+    dashboard = memory_client.get(DASHBOARD_URL, params={"per_category": 20}).json()
+    assert len(_ids(dashboard, "mind_wellness")) == 5
+    assert "nl_mind_deleted" not in _ids(dashboard, "mind_wellness")
+
+    assert memory_client.get(DASHBOARD_URL, params={"per_category": 0}).status_code == 422
+
+
+def test_dashboard_stats_match_stats_endpoint(memory_client, memory_db, fresh_page_cache):
+    _seed(memory_db)
+
+    dashboard = memory_client.get(DASHBOARD_URL).json()
+    stats = memory_client.get("/api/v1/newsletters/stats/").json()
+
+    assert dashboard["stats"] == stats
+    assert stats["total_newsletters"] == 8
+    assert stats["active_newsletters"] == 7
+    assert stats["active_sources"] == 1
+    assert stats["categories_distribution"] == {"mind_wellness": 5, "body_wellness": 1}
@@ -0,0 +1,118 @@
+"""
+SSE 이벤트 브로커 (events) 테스트
+"""
+import json
+import threading
+import time
+
+import pytest
+
+from app.api import newsletters as newsletters_api
+from app.core.config import settings
+from app.core.events import EventBroker
+
+
+class _FakeRequest:
+    """is_disconnected()만 흉내내는 요청 객체"""
+
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_without_blocking():
+    broker = EventBroker(queue_size=2)
+    subscription = broker.subscribe()
+
+    started = time.perf_counter()
+    for number in range(5):
+        assert broker.publish("newsletter", {"number": number}) == 1
+    assert time.perf_counter() - started < 1
+
+    received = [subscription.queue.get_nowait().data["number"] for _ in range(subscription.queue.qsize())]
+    assert received == [3, 4]
+    assert subscription.dropped == 3
+    assert broker.stats() == {"subscribers": 1, "published": 5, "dropped": 3}
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_affect_others():
+    broker = EventBroker(queue_size=1)
+    slow, fast = broker.subscribe(), broker.subscribe()
+
+    broker.publish("newsletter", {"number": 1})
+    assert (await fast.get(timeout=1)).data["number"] == 1
+    broker.publish("newsletter", {"number": 2})
+
+    assert (await fast.get(timeout=1)).data["number"] == 2
+    assert (await slow.get(timeout=1)).data["number"] == 2
+    assert (slow.dropped, fast.dropped) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_publish_from_other_thread_reaches_subscriber_loop():
+    broker = EventBroker()
+    subscription = broker.subscribe()
+
+    thread = threading.Thread(target=broker.publish, args=("collection_progress", {"source": "test"}))
+    thread.start()
+    thread.join()
+
+    event = await subscription.get(timeout=1)
+    assert event.type == "collection_progress"
+    assert event.data["source"] == "test"
+
+
+@pytest.mark.asyncio
+async def test_publish_without_subscribers_is_noop():
+    broker = EventBroker()
+    subscription = broker.subscribe()
+    broker.unsubscribe(subscription)
+
+    assert broker.publish("newsletter", {"id": "nl_1"}) == 0
+    assert broker.stats() == {"subscribers": 0, "published": 0, "dropped": 0}
+
+
+@pytest.mark.asyncio
+async def test_stream_endpoint_frames_events_and_unsubscribes_on_disconnect(monkeypatch):
+    broker = EventBroker()
+    monkeypatch.setattr(newsletters_api, "event_broker", broker)
+    monkeypatch.setattr(settings, "SSE_HEARTBEAT_SECONDS", 0.05)
+    request = _FakeRequest()
+
+    response = await newsletters_api.stream_newsletters(request)
+    stream = response.body_iterator
+    assert response.media_type == "text/event-stream"
+    assert await stream.__anext__() == "retry: 5000\n\n"
+    assert broker.stats()["subscribers"] == 1
+
+    broker.publish("newsletter", {"id": "nl_1", "title": "발리 리트리트"})
+    chunk = await stream.__anext__()
+    event_id, event_type, data, blank, end = chunk.split("\n")
+    assert event_id == "id: 1"
+    assert event_type == "event: newsletter"
+    assert json.loads(data.removeprefix("data: "))["title"] == "발리 리트리트"
+    assert (blank, end) == ("", "")
+
+    # 이벤트가 없으면 하트비트 주석
+    assert await stream.__anext__() == ": ping\n\n"
+
+    request.disconnected = True
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+    assert broker.stats()["subscribers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_endpoint_unsubscribes_when_closed_early(monkeypatch):
+    broker = EventBroker()
+    monkeypatch.setattr(newsletters_api, "event_broker", broker)
+
+    response = await newsletters_api.stream_newsletters(_FakeRequest())
+    await response.body_iterator.__anext__()
+    await response.body_iterator.aclose()  # 클라이언트가 연결을 끊어 응답 전송이 취소된 경우
+
+    assert broker.stats()["subscribers"] == 0
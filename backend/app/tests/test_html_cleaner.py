@@ -0,0 +1,130 @@
+"""
+수집 시점 HTML 정리 (html_cleaner) 테스트
+"""
+import threading
+
+import pytest
+
+from app.models.newsletter import Newsletter
+from app.services import html_cleaner
+from app.services.html_cleaner import backfill_content_text, clean_html, compute_content_hash
+
+ARTICLE = (
+    '<div class="post"><h2>Ubud retreat</h2>'
+    '<script>alert("x")</script><style>p{}</style>'
+    '<p onclick="steal()">Daily <b>yoga</b> &amp; meditation</p>'
+    '<a href="javascript:alert(1)">bad</a> <a href=" JaVa\tScript:alert(1)">tricky</a>'
+    '<a href="https://example.com/a" target="_blank">good</a>'
+    '<img src="data:text/html;base64,xx" alt="inline"><img src="/img.png" alt="ok">'
+    '</div>'
+)
+
+
+@pytest.fixture(params=["lxml", "html.parser"])
+def parser(request, monkeypatch):
+    """lxml 경로와 표준 라이브러리 경로 모두 같은 규칙"""
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    else:
+        monkeypatch.setattr(html_cleaner, "etree", None)
+    return request.param
+
+
+def test_sanitizes_scripts_and_unsafe_urls(parser):
+    result = clean_html(ARTICLE)
+
+    assert result.html == (
+        '<h2>Ubud retreat</h2><p>Daily <b>yoga</b> &amp; meditation</p>'
+        '<a>bad</a> <a>tricky</a><a href="https://example.com/a">good</a>'
+        '<img alt="inline"><img src="/img.png" alt="ok">'
+    )
+    assert result.text == "Ubud retreat\nDaily yoga & meditation\nbad trickygood"
+    assert "alert" not in result.html and "onclick" not in result.html
+    assert not result.truncated
+
+
+def test_plain_text_skips_parsing():
+    result = clean_html("first line\n\n  second   line &amp; more")
+
+    assert result.text == "first line\nsecond line & more"
+    assert result.html == "<p>first line</p><p>second line &amp; more</p>"
+
+
+def test_xml_declaration_is_accepted(parser):
+    raw = '<?xml version="1.0" encoding="utf-8"?><html><body><p>XHTML body</p></body></html>'
+
+    assert clean_html(raw).html == "<p>XHTML body</p>"
+
+
+def test_falls_back_to_stdlib_parser_on_lxml_error(monkeypatch):
+    etree = pytest.importorskip("lxml.etree")
+
+    def broken(raw, builder):
+        raise etree.ParserError("broken")
+
+    monkeypatch.setattr(html_cleaner, "_feed_lxml", broken)
+    assert clean_html("<p>still <b>parsed</b></p>").html == "<p>still <b>parsed</b></p>"
+
+
+@pytest.mark.parametrize("raw, max_length", [
+    ("<p>" + "a\n" * 5000 + "</p>", 100),
+    ("<p>" + "&" * 300 + "</p>", 50),
+    ("<ul>" + "<li><b>item</b> text</li>" * 200 + "</ul>", 300),
+    ("<p>" + "word " * 400 + "</p>", 120),
+    ("plain " * 100, 64),
+])
+def test_truncation_stays_within_limit_and_keeps_content(parser, raw, max_length):
+    result = clean_html(raw, max_length)
+
+    assert result.truncated
+    assert 0 < len(result.text) <= max_length
+    assert 0 < len(result.html) <= max_length
+    assert result.html.startswith("<")
+
+
+def test_truncation_cuts_at_word_boundary(parser):
+    result = clean_html("<p>" + "wellness " * 50 + "</p>", 100)
+
+    assert result.text.split() == ["wellness"] * len(result.text.split())
+
+
+def test_backfill_fills_text_and_recomputes_hash(memory_db):
+    content = "<p>Sunrise <b>yoga</b></p>"
+    memory_db.add_all([
+        Newsletter(id="nl_1", title="Yoga", content=content, source="test", content_hash="old_1"),
+        # 마크업만 다른 기존 중복: 새 해시가 nl_1과 겹치므로 기존 해시 유지
+        Newsletter(id="nl_2", title="Yoga", content="<div>Sunrise yoga</div>", source="test", content_hash="old_2"),
+    ])
+    memory_db.flush()
+    memory_db.query(Newsletter).update({"content_text": None})
+    memory_db.commit()
+
+    assert backfill_content_text(memory_db, chunk_size=1) == 2
+
+    first, second = memory_db.query(Newsletter).order_by(Newsletter.id).all()
+    assert first.content_text == "Sunrise yoga"
+    assert first.content_hash == compute_content_hash("Yoga", "Sunrise yoga")
+    assert second.content_text == "Sunrise yoga"
+    assert second.content_hash == "old_2"
+
+
+def test_lxml_parser_is_per_thread():
+    pytest.importorskip("lxml")
+    documents = [f"<div><h2>Title {number}</h2><p>{'body ' * number}</p></div>" for number in range(200)]
+    expected = [clean_html(document) for document in documents]
+
+    parsers = set()
+
+    def work(results):
+        parsers.add(id(html_cleaner._lxml_parser()))
+        results.extend(clean_html(document) for document in documents)
+
+    outputs = [[] for _ in range(4)]
+    threads = [threading.Thread(target=work, args=(output,)) for output in outputs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(output == expected for output in outputs)
+    assert len(parsers) == 4
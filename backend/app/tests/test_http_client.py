@@ -0,0 +1,63 @@
+"""
+공유 외부 요청 클라이언트 테스트
+"""
+import httpx
+import pytest
+
+from app.core import http_client
+from app.core.http_client import OutboundHTTPClient, _CachingNetworkBackend
+
+
+@pytest.fixture
+def outbound():
+    return OutboundHTTPClient(http2=False, dns_cache_ttl=60)
+
+
+def test_installs_caching_backend(outbound):
+    client = outbound.get_client()
+
+    assert isinstance(client._transport._pool._network_backend, _CachingNetworkBackend)
+    assert outbound.snapshot()["dns_cache"] is True
+    assert client.follow_redirects is True
+
+
+def test_falls_back_when_transport_layout_differs(outbound, monkeypatch):
+    """httpx/httpcore 내부 구조가 다르면 기본 백엔드로 동작"""
+    monkeypatch.setattr(http_client, "_install_network_backend", lambda *args: False)
+
+    client = outbound.get_client()
+
+    assert isinstance(client, httpx.AsyncClient)
+    assert outbound.snapshot()["dns_cache"] is False
+
+
+def test_install_skips_unknown_transport():
+    class OtherTransport:
+        pass
+
+    stats = http_client.OutboundHTTPStats()
+    assert not http_client._install_network_backend(OtherTransport(), http_client.DNSCache(60, stats), stats)
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_reuses_lookups(monkeypatch):
+    stats = http_client.OutboundHTTPStats()
+    cache = http_client.DNSCache(60, stats)
+    lookups = []
+
+    class Loop:
+        async def getaddrinfo(self, host, port, type):
+            lookups.append(host)
+            return [(None, None, None, None, ("10.0.0.1", port)), (None, None, None, None, ("10.0.0.1", port))]
+
+    monkeypatch.setattr(http_client.asyncio, "get_running_loop", lambda: Loop())
+
+    assert await cache.resolve("feeds.example.com", 443) == ["10.0.0.1"]
+    assert await cache.resolve("feeds.example.com", 443) == ["10.0.0.1"]
+    assert await cache.resolve("127.0.0.1", 443) == ["127.0.0.1"]
+    assert lookups == ["feeds.example.com"]
+    assert stats.snapshot()["dns_cache_hits"] == 1
+
+    cache.invalidate("feeds.example.com", 443)
+    await cache.resolve("feeds.example.com", 443)
+    assert len(lookups) == 2
@@ -0,0 +1,105 @@
+"""
+웹 목록 항목 추출 (item_extractor) 테스트
+픽스처 페이지 결과를 기존 구현의 기준 결과(scripts/baselines/web_extraction.json)와 비교
+"""
+import json
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from app.schemas.newsletter import NewsletterCreate
+from app.services import item_extractor
+from app.services.item_extractor import extract_items
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import bench_web_extraction as bench  # noqa: E402
+
+GOLDEN = json.loads(bench.DEFAULT_GOLDEN.read_text(encoding="utf-8"))["pages"]
+PARSERS = [
+    "html.parser",
+    pytest.param("lxml", marks=pytest.mark.skipif(item_extractor.etree is None, reason="lxml 미설치")),
+]
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+@pytest.mark.parametrize("name, build", bench.FIXTURES, ids=[name for name, _ in bench.FIXTURES])
+def test_fixture_matches_baseline(name, build, parser):
+    markup = build(random.Random(name))
+
+    actual = bench.golden_items(extract_items(markup, bench.BASE_URL, parser=parser))
+
+    assert actual == bench.expected_items(GOLDEN[name])
+
+
+@pytest.mark.skipif(item_extractor.etree is None, reason="lxml 미설치")
+def test_misnested_heading_uses_soup_tree():
+    """<h2> 안의 <p>: libxml2가 h2를 먼저 닫아도 제목은 html.parser 트리 기준"""
+    markup = "".join(
+        f"<article><h2>Yoga retreat {index}<p>with daily breathwork</p></h2><a href='/r/{index}'>more</a></article>"
+        for index in range(3)
+    )
+
+    items = extract_items(markup, "https://example.com/", parser="lxml")
+
+    assert [item["title"] for item in items] == [f"Yoga retreat {index}with daily breathwork" for index in range(3)]
+    assert items == extract_items(markup, "https://example.com/", parser="html.parser")
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_long_summary_fits_schema(parser):
+    body = "meditation " * 100
+    markup = "".join(f"<article><h2>Yoga retreat {index}</h2><p>{body}</p></article>" for index in range(2))
+
+    item = extract_items(markup, "https://example.com/", parser=parser)[0]
+
+    assert len(item["summary"]) == item_extractor.SUMMARY_LENGTH
+    assert item["summary"].endswith("...")
+    NewsletterCreate(
+        title=item["title"], content=item["content"], summary=item["summary"], source="test",
+        source_url=None, primary_category="mind_wellness"
+    )
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_links_resolve_against_base_url(parser):
+    markup = (
+        "<div class='post'><h3>First wellness post</h3><a href='../posts/1'>more</a></div>"
+        "<div class='post'><h3>Second wellness post</h3><a href='https://other.example/2'>more</a></div>"
+    )
+
+    items = extract_items(markup, "https://example.com/blog/", parser=parser)
+
+    assert [item["url"] for item in items] == ["https://example.com/posts/1", "https://other.example/2"]
+
+
+MISNESTED = "".join(
+    f"<article><h2>Yoga retreat {index}<p>with daily breathwork</p></h2></article>" for index in range(3)
+)
+CLEAN = "".join(f"<article><h2>Spa weekend number {index}</h2><p>massage</p></article>" for index in range(3))
+
+
+@pytest.mark.skipif(item_extractor.etree is None, reason="lxml 미설치")
+def test_misnested_check_reads_only_current_document_errors(monkeypatch):
+    extract_items(MISNESTED, "https://example.com/", parser="lxml")
+
+    def fail(*args):
+        raise AssertionError("이전 문서의 파싱 오류로 BeautifulSoup 경로를 타면 안 됨")
+
+    monkeypatch.setattr(item_extractor, "_extract_soup", fail)
+    assert len(extract_items(CLEAN, "https://example.com/", parser="lxml")) == 3
+
+
+@pytest.mark.skipif(item_extractor.etree is None, reason="lxml 미설치")
+def test_concurrent_extraction_matches_sequential():
+    pages = [MISNESTED, CLEAN] * 50
+    expected = [extract_items(page, "https://example.com/", parser="lxml") for page in pages]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda page: extract_items(page, "https://example.com/", parser="lxml"), pages))
+
+    assert results == expected
@@ -0,0 +1,83 @@
+"""
+파일 잠금 기반 리더 선출 (leader) 테스트
+같은 프로세스에서도 open()을 따로 하면 flock이 서로 충돌하므로 워커 두 개를 흉내낼 수 있다
+"""
+import os
+import threading
+
+import pytest
+
+from app.core import leader
+from app.core.leader import LeaderElector, file_lock, try_file_lock
+
+pytestmark = pytest.mark.skipif(leader.fcntl is None, reason="fcntl 미지원 플랫폼")
+
+
+@pytest.fixture
+def lock_path(tmp_path):
+    return str(tmp_path / "locks" / "leader.lock")
+
+
+def test_only_one_elector_becomes_leader(lock_path):
+    first, second = LeaderElector(lock_path), LeaderElector(lock_path)
+    try:
+        assert first.try_acquire()
+        assert not second.try_acquire()
+        assert first.is_leader and not second.is_leader
+        assert first.try_acquire()  # 이미 리더면 그대로 유지
+        assert first.current_leader().endswith(f":{os.getpid()}")
+    finally:
+        first.release()
+        second.release()
+
+
+def test_second_elector_takes_over_after_release(lock_path):
+    first, second = LeaderElector(lock_path), LeaderElector(lock_path)
+    try:
+        assert first.try_acquire()
+        first.release()
+
+        assert not first.is_leader
+        assert second.try_acquire()
+        assert not first.try_acquire()
+    finally:
+        first.release()
+        second.release()
+
+
+def test_try_file_lock_fails_while_held(lock_path):
+    with try_file_lock(lock_path) as acquired:
+        assert acquired
+        with try_file_lock(lock_path) as acquired_again:
+            assert not acquired_again
+
+    with try_file_lock(lock_path) as acquired:
+        assert acquired
+
+
+def test_try_file_lock_fails_while_leader_holds_lock(lock_path):
+    elector = LeaderElector(lock_path)
+    try:
+        assert elector.try_acquire()
+        with try_file_lock(lock_path) as acquired:
+            assert not acquired
+    finally:
+        elector.release()
+
+
+def test_file_lock_blocks_until_released(lock_path):
+    entered = threading.Event()
+
+    def wait_for_lock():
+        with file_lock(lock_path):
+            entered.set()
+
+    with file_lock(lock_path):
+        waiter = threading.Thread(target=wait_for_lock)
+        waiter.start()
+        assert not entered.wait(0.2)
+        with try_file_lock(lock_path) as acquired:
+            assert not acquired
+
+    waiter.join(timeout=5)
+    assert entered.is_set()
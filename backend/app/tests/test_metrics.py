@@ -0,0 +1,114 @@
+"""
+Prometheus 메트릭 (metrics) 테스트
+"""
+import threading
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import metrics
+from app.core.metrics import Counter, Histogram, MetricsMiddleware, MetricsRegistry
+
+
+def test_label_values_are_escaped():
+    counter = Counter("test_total", "test", ("route",))
+    counter.inc(('a"b\\c\nd',))
+
+    assert counter.render() == ['test_total{route="a\\"b\\\\c\\nd"} 1']
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    histogram = Histogram("test_seconds", "test", ("method",), buckets=(1.0, 0.1))
+    for value in (0.05, 0.1, 0.5, 5):
+        histogram.observe(value, ("GET",))
+
+    assert histogram.render() == [
+        'test_seconds_bucket{method="GET",le="0.1"} 2',
+        'test_seconds_bucket{method="GET",le="1"} 3',
+        'test_seconds_bucket{method="GET",le="+Inf"} 4',
+        'test_seconds_sum{method="GET"} 5.65',
+        'test_seconds_count{method="GET"} 4',
+    ]
+
+
+def test_registry_renders_help_and_type_lines():
+    registry = MetricsRegistry()
+    registry.counter("jobs_total", "처리한 작업 수").inc()
+    registry.gauge("jobs_in_flight", "진행 중 작업 수").dec()
+
+    assert registry.render() == (
+        "# HELP jobs_total 처리한 작업 수\n"
+        "# TYPE jobs_total counter\n"
+        "jobs_total 1\n"
+        "# HELP jobs_in_flight 진행 중 작업 수\n"
+        "# TYPE jobs_in_flight gauge\n"
+        "jobs_in_flight -1\n"
+    )
+
+
+def test_thread_shards_are_summed():
+    counter = Counter("test_total", "test", ("kind",))
+    histogram = Histogram("test_seconds", "test", buckets=(0.5,))
+    barrier = threading.Barrier(8)
+
+    def work():
+        barrier.wait()
+        for _ in range(1000):
+            counter.inc(("a",))
+            histogram.observe(0.1)
+        counter.inc(("b",), amount=2)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(counter._shards) == 8
+    assert counter.values() == {("a",): 8000, ("b",): 16}
+    counts, total, count = histogram.values()[()]
+    assert counts == [8000, 0]
+    assert count == 8000
+    assert abs(total - 800) < 1e-6
+
+    counter.reset()
+    assert counter.values() == {}
+
+
+def test_route_label_uses_path_template():
+    app = FastAPI()
+
+    @app.get("/metrics-test/items/{item_id}")
+    def read_item(item_id: int):
+        return {"id": item_id}
+
+    app.add_middleware(MetricsMiddleware)
+    client = TestClient(app)
+    before = metrics.http_requests_total.values()
+
+    for item_id in (1, 2, 3):
+        assert client.get(f"/metrics-test/items/{item_id}").status_code == 200
+    client.get("/metrics-test/missing")
+
+    after = metrics.http_requests_total.values()
+    template_key = ("GET", "/metrics-test/items/{item_id}", "200")
+    assert after[template_key] - before.get(template_key, 0) == 3
+    assert after[("GET", "<unmatched>", "404")] - before.get(("GET", "<unmatched>", "404"), 0) == 1
+    assert not any("/metrics-test/items/1" in labels[1] for labels in after)
+
+
+def test_recording_overhead_is_small():
+    counter = Counter("test_total", "test", ("method", "route", "status"))
+    histogram = Histogram("test_seconds", "test", ("method", "route"))
+    labels = ("GET", "/api/v1/newsletters/", "200")
+
+    iterations = 50_000
+    started = time.perf_counter()
+    for index in range(iterations):
+        counter.inc(labels)
+        histogram.observe(index / iterations, labels[:2])
+    per_call_us = (time.perf_counter() - started) / iterations * 1e6
+
+    # 실제 비용은 1µs 안팎, CI 편차를 고려한 넉넉한 상한
+    assert per_call_us < 50
@@ -0,0 +1,121 @@
+"""
+근사 중복 검출 (MinHash LSH) 테스트
+"""
+import random
+
+import pytest
+
+from app.models.newsletter import Newsletter, NewsletterLSHBucket, NewsletterSignature
+from app.services import near_duplicate
+from app.services.near_duplicate import NearDuplicateIndex, band_keys, compute_signature, estimate_similarity
+
+TITLE = "Bali Ubud yoga and meditation retreat guide"
+CONTENT = (
+    "A week in Ubud with daily vinyasa yoga, guided meditation at sunrise, organic vegetarian meals "
+    "and traditional Balinese massage. The program includes accommodation and airport pickup. "
+) * 5
+OTHER_CONTENT = (
+    "Quarterly earnings grew across all segments while the new smartphone lineup is expected "
+    "to lift sales in the next fiscal year according to analysts. "
+) * 5
+
+
+def _add_newsletter(db, index: NearDuplicateIndex, newsletter_id: str, title: str, content: str,
+                    is_active: bool = True):
+    db.add(Newsletter(
+        id=newsletter_id, title=title, content=content, source="test",
+        content_hash=newsletter_id, is_active=is_active
+    ))
+    index.add(db, newsletter_id, index.signature(title, content))
+    db.commit()
+
+
+def test_signature_is_deterministic():
+    assert compute_signature(TITLE, CONTENT) == compute_signature(TITLE, CONTENT)
+    assert len(band_keys(compute_signature(TITLE, CONTENT))) == near_duplicate.NUM_BANDS
+
+
+def test_similarity_separates_reposts_from_unrelated_articles():
+    original = compute_signature(TITLE, CONTENT)
+    repost = compute_signature(TITLE + " (updated)", CONTENT.replace("sunrise", "dawn"))
+    unrelated = compute_signature("Quarterly earnings call", OTHER_CONTENT)
+
+    assert estimate_similarity(original, repost) >= 0.85
+    assert estimate_similarity(original, unrelated) < 0.3
+
+
+def test_find_duplicate_matches_repost(memory_db):
+    index = NearDuplicateIndex()
+    _add_newsletter(memory_db, index, "nl_original", TITLE, CONTENT)
+    _add_newsletter(memory_db, index, "nl_other", "Quarterly earnings call", OTHER_CONTENT)
+
+    match = index.find_duplicate(memory_db, index.signature(TITLE + "!", CONTENT))
+    assert match is not None
+    assert match[0] == "nl_original"
+
+    assert index.find_duplicate(memory_db, index.signature("Smartphone launch recap", OTHER_CONTENT[::-1])) is None
+
+
+def test_inactive_newsletters_are_not_candidates(memory_db):
+    index = NearDuplicateIndex()
+    _add_newsletter(memory_db, index, "nl_deleted", TITLE, CONTENT, is_active=False)
+
+    assert index.find_duplicate(memory_db, index.signature(TITLE, CONTENT)) is None
+
+
+def test_remove_drops_index_rows(memory_db):
+    index = NearDuplicateIndex()
+    _add_newsletter(memory_db, index, "nl_original", TITLE, CONTENT)
+
+    index.remove(memory_db, ["nl_original"])
+    memory_db.commit()
+
+    assert memory_db.query(NewsletterSignature).count() == 0
+    assert memory_db.query(NewsletterLSHBucket).count() == 0
+    assert index.find_duplicate(memory_db, index.signature(TITLE, CONTENT)) is None
+
+
+def test_crowded_bucket_keeps_best_candidates(memory_db, monkeypatch):
+    """후보 수 제한보다 붐비는 버킷이어도 밴드가 가장 많이 겹치는 진짜 중복을 찾는다"""
+    monkeypatch.setattr(near_duplicate, "MAX_CANDIDATES", 3)
+    index = NearDuplicateIndex()
+    signature = index.signature(TITLE, CONTENT)
+    shared_key = band_keys(signature)[0]
+
+    # 첫 밴드만 겹치는 잡음 후보 (id 순으로 먼저 나오도록)
+    for number in range(10):
+        newsletter_id = f"nl_a_noise_{number:02d}"
+        memory_db.add(Newsletter(id=newsletter_id, title=f"noise {number}", content="noise", source="test",
+                                 content_hash=newsletter_id))
+        memory_db.add(NewsletterSignature(newsletter_id=newsletter_id, signature=[0] * len(signature)))
+        memory_db.add(NewsletterLSHBucket(bucket_key=shared_key, newsletter_id=newsletter_id))
+    memory_db.commit()
+    _add_newsletter(memory_db, index, "nl_z_original", TITLE, CONTENT)
+
+    match = index.find_duplicate(memory_db, signature)
+    assert match is not None
+    assert match[0] == "nl_z_original"
+
+
+def test_delete_endpoint_removes_newsletter_from_index(client, db_session):
+    index = NearDuplicateIndex()
+    _add_newsletter(db_session, index, "nl_delete_me", TITLE, CONTENT)
+    try:
+        response = client.delete("/api/v1/newsletters/nl_delete_me")
+        assert response.status_code == 200
+
+        db_session.expire_all()
+        assert db_session.query(NewsletterSignature).filter_by(newsletter_id="nl_delete_me").count() == 0
+        assert index.find_duplicate(db_session, index.signature(TITLE, CONTENT)) is None
+    finally:
+        db_session.query(Newsletter).filter_by(id="nl_delete_me").delete()
+        db_session.commit()
+
+
+@pytest.mark.skipif(near_duplicate.np is None, reason="numpy 미설치")
+def test_vectorized_signature_matches_python():
+    rng = random.Random(7)
+    cases = [{rng.getrandbits(32) for _ in range(rng.randrange(1, 2000))} for _ in range(20)]
+    cases += [{0}, {(1 << 32) - 1}, {0, (1 << 32) - 1}]
+    for hashes in cases:
+        assert near_duplicate._signature_numpy(hashes) == near_duplicate._signature_python(hashes)
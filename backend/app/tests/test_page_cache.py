@@ -0,0 +1,80 @@
+"""
+렌더링 페이지 캐시 (page_cache) 테스트
+"""
+import json
+
+import pytest
+
+from app.core.data_version import bump_data_version
+from app.models.newsletter import Newsletter
+
+DASHBOARD_URL = "/api/v1/newsletters/dashboard"
+
+
+def _add_newsletter(db, newsletter_id: str) -> None:
+    db.add(Newsletter(id=newsletter_id, title=f"Newsletter {newsletter_id}", content="content", source="test",
+                      content_hash=newsletter_id, primary_category="mind_wellness"))
+    db.commit()
+
+
+def _dashboard_ids(response) -> set:
+    return {item["id"] for item in response.json()["categories"]["mind_wellness"]}
+
+
+def test_bump_data_version_invalidates_cached_page(memory_client, memory_db, fresh_page_cache):
+    _add_newsletter(memory_db, "nl_first")
+    assert _dashboard_ids(memory_client.get(DASHBOARD_URL)) == {"nl_first"}
+
+    # 버전이 그대로면 새 데이터가 있어도 캐시된 페이지를 그대로 반환
+    _add_newsletter(memory_db, "nl_second")
+    assert _dashboard_ids(memory_client.get(DASHBOARD_URL)) == {"nl_first"}
+
+    bump_data_version()
+    assert _dashboard_ids(memory_client.get(DASHBOARD_URL)) == {"nl_first", "nl_second"}
+
+
+def test_gzip_and_identity_use_separate_etags(memory_client, fresh_page_cache):
+    identity = memory_client.get(DASHBOARD_URL, headers={"Accept-Encoding": "identity"})
+    compressed = memory_client.get(DASHBOARD_URL, headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in identity.headers
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert identity.headers["etag"] != compressed.headers["etag"]
+    assert identity.headers["vary"] == compressed.headers["vary"] == "Accept-Encoding"
+    assert identity.json() == compressed.json()
+
+
+def test_gzip_q0_is_honoured(memory_client, fresh_page_cache):
+    response = memory_client.get(DASHBOARD_URL, headers={"Accept-Encoding": "gzip;q=0, identity"})
+
+    assert "content-encoding" not in response.headers
+    assert json.loads(response.content)["categories"] is not None
+
+
+@pytest.mark.parametrize("accept_encoding", ["gzip", "identity"])
+def test_matching_if_none_match_returns_304(memory_client, fresh_page_cache, accept_encoding):
+    headers = {"Accept-Encoding": accept_encoding}
+    etag = memory_client.get(DASHBOARD_URL, headers=headers).headers["etag"]
+
+    for if_none_match in (etag, f"W/{etag}", f'"stale", {etag}', "*"):
+        response = memory_client.get(DASHBOARD_URL, headers={**headers, "If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+
+def test_etag_of_other_representation_does_not_match(memory_client, fresh_page_cache):
+    gzip_etag = memory_client.get(DASHBOARD_URL, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+
+    response = memory_client.get(DASHBOARD_URL, headers={"Accept-Encoding": "identity", "If-None-Match": gzip_etag})
+    assert response.status_code == 200
+
+
+def test_stale_etag_after_bump_returns_full_page(memory_client, fresh_page_cache):
+    etag = memory_client.get(DASHBOARD_URL, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+    bump_data_version()
+
+    response = memory_client.get(DASHBOARD_URL, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["data_version"] != "0"
@@ -0,0 +1,57 @@
+"""
+품질 재평가 배치 (QualityRescorer) 테스트
+"""
+from app.models.newsletter import ContentQuality, JobCheckpoint, Newsletter
+from app.services.quality_scorer import CHECKPOINT_NAME, QualityRescorer
+
+
+def _add_newsletters(db, count: int):
+    for i in range(count):
+        db.add(Newsletter(
+            id=f"nl_{i:03d}", title=f"Yoga retreat program {i}", source="test", content_hash=f"hash_{i}",
+            content="Daily yoga and meditation sessions with organic meals. " * 10,
+            location={"country": "Indonesia", "city": "Bali"}, program_info={"duration": "1주일", "price_range": "중가"}
+        ))
+    db.commit()
+
+
+def test_rerun_keeps_one_quality_row_per_newsletter(memory_db):
+    _add_newsletters(memory_db, 5)
+
+    QualityRescorer(memory_db, chunk_size=2).run()
+    QualityRescorer(memory_db, chunk_size=2).run()
+
+    assert memory_db.query(ContentQuality).count() == 5
+    assert memory_db.get(JobCheckpoint, CHECKPOINT_NAME) is None
+    assert all(newsletter.quality_score > 0 for newsletter in memory_db.query(Newsletter).all())
+    assert all(row.has_duration and row.has_price for row in memory_db.query(ContentQuality).all())
+
+
+def test_resume_continues_after_committed_checkpoint(memory_db):
+    _add_newsletters(memory_db, 5)
+    memory_db.add(JobCheckpoint(name=CHECKPOINT_NAME, last_id="nl_002", processed=3))
+    memory_db.commit()
+
+    result = QualityRescorer(memory_db, chunk_size=2).run(resume=True)
+
+    assert result["processed"] == 2
+    assert {row.newsletter_id for row in memory_db.query(ContentQuality).all()} == {"nl_003", "nl_004"}
+    assert memory_db.get(JobCheckpoint, CHECKPOINT_NAME) is None
+
+
+def test_chunk_and_checkpoint_commit_together(memory_db):
+    """청크 커밋 시점에 진행 위치도 함께 기록된다 (중단 후 재개 시 같은 청크를 다시 넣지 않음)"""
+    _add_newsletters(memory_db, 3)
+    rescorer = QualityRescorer(memory_db, chunk_size=2)
+    commits = []
+    original_commit = memory_db.commit
+
+    def recording_commit():
+        original_commit()
+        checkpoint = memory_db.get(JobCheckpoint, CHECKPOINT_NAME)
+        commits.append((memory_db.query(ContentQuality).count(), checkpoint.last_id if checkpoint else None))
+
+    memory_db.commit = recording_commit
+    rescorer.run()
+
+    assert commits[:2] == [(2, "nl_001"), (3, "nl_002")]
@@ -0,0 +1,102 @@
+"""
+요청 제한 SQLite 카운터 저장소 테스트
+"""
+import threading
+
+import pytest
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, SlidingWindowCounterRateLimiter
+
+from app.core import rate_limit_storage
+from app.core.rate_limit_storage import SQLiteStorage
+
+
+@pytest.fixture
+def storage_uri(tmp_path):
+    return f"sqlite:///{tmp_path}/rate_limits.db"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """rate_limit_storage 모듈의 time.time 고정"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(rate_limit_storage.time, "time", lambda: now[0])
+    return now
+
+
+def test_scheme_is_registered(storage_uri, tmp_path):
+    storage = storage_from_string(storage_uri)
+
+    assert isinstance(storage, SQLiteStorage)
+    assert storage.path == f"{tmp_path}/rate_limits.db"
+    assert storage.check()
+
+
+def test_counter_lifecycle_and_expiry(storage_uri, clock):
+    storage = SQLiteStorage(storage_uri)
+
+    assert storage.incr("k", 60) == 1
+    assert storage.incr("k", 60, amount=2) == 3
+    assert storage.decr("k") == 2
+    assert storage.get("k") == 2
+    assert storage.get_expiry("k") == clock[0] + 60
+
+    clock[0] += 61
+    assert storage.get("k") == 0
+    assert storage.incr("k", 60) == 1  # 만료된 창은 새로 시작
+
+    storage.clear("k")
+    assert storage.get("k") == 0
+
+
+def test_counters_are_shared_between_workers(storage_uri):
+    """같은 파일을 여는 저장소(워커)끼리 카운터 공유, 동시 증가도 유실 없음"""
+    workers = [SQLiteStorage(storage_uri), SQLiteStorage(storage_uri)]
+
+    def hit(storage):
+        for _ in range(50):
+            storage.incr("shared", 60)
+
+    threads = [threading.Thread(target=hit, args=(workers[i % 2],)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert workers[0].get("shared") == 200
+    assert SQLiteStorage(storage_uri).get("shared") == 200  # 재시작 후에도 유지
+
+
+def test_fixed_window_limit(storage_uri):
+    limiter = FixedWindowRateLimiter(SQLiteStorage(storage_uri))
+    limit = parse("3/minute")
+
+    assert [limiter.hit(limit, "client") for _ in range(4)] == [True, True, True, False]
+    assert limiter.get_window_stats(limit, "client").remaining == 0
+
+
+def test_sliding_window_counter_limit(storage_uri, clock):
+    storage = SQLiteStorage(storage_uri)
+    limiter = SlidingWindowCounterRateLimiter(storage)
+    limit = parse("2/minute")
+    clock[0] = 60 * 1000  # 창 시작 시점
+
+    assert [limiter.hit(limit, "client") for _ in range(3)] == [True, True, False]
+
+    # 다음 창 중간: 이전 창 2회의 절반 가중치(1) + 현재 0 → 1회 더 허용
+    clock[0] += 90
+    assert limiter.hit(limit, "client")
+    assert not limiter.hit(limit, "client")
+
+
+def test_expired_counters_are_purged(storage_uri, clock, monkeypatch):
+    monkeypatch.setattr(rate_limit_storage, "PURGE_EVERY", 2)
+    storage = SQLiteStorage(storage_uri)
+    storage.incr("old", 10)
+
+    clock[0] += 11
+    storage.incr("new", 10)
+
+    rows = storage._connection().execute("SELECT key FROM rate_limit_counters").fetchall()
+    assert rows == [("new",)]
@@ -0,0 +1,34 @@
+"""
+GET 엔드포인트 읽기 세션 라우팅 테스트
+"""
+from fastapi.routing import APIRoute
+
+from app.core.database import get_db, get_read_db
+from app.main import app
+
+# 조회수 증가처럼 쓰기가 있는 GET
+WRITING_GET_ENDPOINTS = {"get_newsletter_detail"}
+
+
+def _dependencies(dependant):
+    for dependency in dependant.dependencies:
+        yield dependency.call
+        yield from _dependencies(dependency)
+
+
+def test_get_endpoints_use_read_session():
+    """쓰기가 없는 GET 엔드포인트는 읽기 전용 세션(get_read_db)만 사용"""
+    offenders = []
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or "GET" not in route.methods or route.name in WRITING_GET_ENDPOINTS:
+            continue
+        calls = set(_dependencies(route.dependant))
+        if get_db in calls:
+            offenders.append(route.path)
+
+    assert offenders == []
+
+
+def test_collection_runs_uses_read_session():
+    route = next(route for route in app.routes if isinstance(route, APIRoute) and route.path.endswith("/collect/runs"))
+    assert get_read_db in set(_dependencies(route.dependant))
@@ -0,0 +1,115 @@
+"""
+요청별 SQL 프로파일링 (sql_profiler) 테스트
+"""
+import logging
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.core.sql_profiler import (
+    RequestProfile,
+    SQLProfiler,
+    SQLProfilerMiddleware,
+    normalize_statement,
+    server_timing_header,
+)
+
+SELECT_BY_ID = "SELECT id FROM newsletters WHERE id = ?"
+
+
+def test_normalize_statement_collapses_whitespace_and_in_lists():
+    assert normalize_statement("SELECT id\n    FROM newsletters\tWHERE id = ?  ") == SELECT_BY_ID
+    assert (normalize_statement("SELECT id FROM t WHERE id IN (?, ?,?)")
+            == normalize_statement("SELECT id FROM t WHERE id IN ( ?, ? )")
+            == "SELECT id FROM t WHERE id IN (?)")
+    assert normalize_statement("SELECT id FROM t WHERE id IN (?)") == "SELECT id FROM t WHERE id IN (?)"
+
+
+def test_repeated_statements_uses_threshold_and_only_selects():
+    profile = RequestProfile()
+    for _ in range(5):
+        profile.record(SELECT_BY_ID, 0.001)
+        profile.record("INSERT INTO logs VALUES (?)", 0.001)
+    for _ in range(4):
+        profile.record("SELECT 1", 0.001)
+
+    assert profile.repeated_statements(5) == [(SELECT_BY_ID, 5)]
+    assert profile.repeated_statements(6) == []
+    assert sorted(profile.repeated_statements(4)) == [("SELECT 1", 4), (SELECT_BY_ID, 5)]
+    assert profile.statement_count == 14
+
+
+def _profile() -> RequestProfile:
+    profile = RequestProfile()
+    profile.record(SELECT_BY_ID, 0.002)
+    profile.record(SELECT_BY_ID, 0.003)
+    profile.record('SELECT "title" FROM newsletters WHERE content LIKE \'%\\\\%\'' + " AND x = ?" * 20, 0.001)
+    return profile
+
+
+def test_server_timing_header_omits_statements_by_default():
+    header = server_timing_header(_profile())
+
+    assert header == 'db;dur=6.00;desc="3 queries", sql-1;dur=5.00;desc="2x", sql-2;dur=1.00;desc="1x"'
+    assert "newsletters" not in header
+
+
+def test_server_timing_header_with_statements_is_quoted_and_truncated():
+    header = server_timing_header(_profile(), top=2, include_statements=True)
+    entries = header.split(", ")
+
+    assert entries[1] == f'sql-1;dur=5.00;desc="2x {SELECT_BY_ID}"'
+    desc = re.fullmatch(r'sql-2;dur=1\.00;desc="(.*)"', entries[2]).group(1)
+    assert len(desc) == 80
+    assert '"' not in desc and "\\" not in desc
+
+
+@pytest.fixture
+def profiled_app():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    profiler = SQLProfiler(slow_query_ms=0, n_plus_one_threshold=3)
+    profiler.instrument(engine)
+    profiler.instrument(engine)  # 중복 등록해도 한 번만 기록
+
+    def build(**middleware_options):
+        app = FastAPI()
+
+        @app.get("/items")
+        def items(count: int = 1):
+            with engine.connect() as conn:
+                for item_id in range(count):
+                    conn.execute(text("SELECT :id"), {"id": item_id})
+            return {"count": count}
+
+        @app.get("/static")
+        def static():
+            return {}
+
+        app.add_middleware(SQLProfilerMiddleware, profiler=profiler, **middleware_options)
+        return TestClient(app)
+
+    yield build
+    engine.dispose()
+
+
+def test_middleware_adds_header_and_warns_on_n_plus_one(profiled_app, caplog):
+    client = profiled_app()
+
+    with caplog.at_level(logging.WARNING, logger="app.core.sql_profiler"):
+        response = client.get("/items", params={"count": 3})
+
+    assert re.fullmatch(r'db;dur=[\d.]+;desc="3 queries", sql-1;dur=[\d.]+;desc="3x"',
+                        response.headers["server-timing"])
+    assert any("N+1 의심" in record.message and "3회" in record.message for record in caplog.records)
+
+    assert "server-timing" not in client.get("/static").headers
+
+
+def test_middleware_statement_text_needs_debug_flag(profiled_app):
+    assert "SELECT" not in profiled_app().get("/items").headers["server-timing"]
+    assert 'desc="1x SELECT ?"' in profiled_app(server_timing_statements=True).get("/items").headers["server-timing"]
+    assert "server-timing" not in profiled_app(server_timing=False).get("/items").headers
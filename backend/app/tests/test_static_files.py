@@ -0,0 +1,87 @@
+"""
+정적 자산 제공 (사전 압축본, 매니페스트) 테스트
+"""
+import gzip
+import json
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.static_files import IMMUTABLE_CACHE_CONTROL, AssetManifest, PrecompressedStaticFiles
+
+CSS = b"body{color:#333}" * 100
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    dist = tmp_path / "dist" / "css"
+    dist.mkdir(parents=True)
+    (dist / "site.abc123.css").write_bytes(CSS)
+    (dist / "site.abc123.css.gz").write_bytes(gzip.compress(CSS, mtime=0))
+    (tmp_path / "dist" / "manifest.json").write_text(json.dumps({"css/site.css": "dist/css/site.abc123.css"}))
+    return tmp_path
+
+
+@pytest.fixture
+def static_client(static_dir):
+    app = FastAPI()
+    app.mount("/static", PrecompressedStaticFiles(directory=str(static_dir)), name="static")
+    return TestClient(app)
+
+
+def test_serves_precompressed_variant(static_client):
+    response = static_client.get("/static/dist/css/site.abc123.css", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.content == CSS  # httpx가 gzip 해제
+
+
+def test_precompressed_variant_honors_conditional_requests(static_client):
+    path = "/static/dist/css/site.abc123.css"
+    first = static_client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    by_etag = static_client.get(path, headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+    assert by_etag.status_code == 304
+    assert by_etag.content == b""
+
+    by_date = static_client.get(
+        path, headers={"Accept-Encoding": "gzip", "If-Modified-Since": first.headers["last-modified"]}
+    )
+    assert by_date.status_code == 304
+
+
+def test_falls_back_to_original_without_accepted_encoding(static_client):
+    response = static_client.get("/static/dist/css/site.abc123.css", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    cached = static_client.get(
+        "/static/dist/css/site.abc123.css",
+        headers={"Accept-Encoding": "identity", "If-None-Match": response.headers["etag"]}
+    )
+    assert cached.status_code == 304
+
+
+def test_manifest_resolves_urls_and_tracks_rebuilds(static_dir):
+    manifest = AssetManifest(str(static_dir))
+    assert manifest.url("css/site.css") == "/static/dist/css/site.abc123.css"
+    assert manifest.url("js/app.js") == "/static/js/app.js"
+
+    before = manifest.version
+    manifest_path = static_dir / "dist" / "manifest.json"
+    manifest_path.write_text(json.dumps({"css/site.css": "dist/css/site.def456.css"}))
+    stat = os.stat(manifest_path)
+    os.utime(manifest_path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert manifest.version != before
+    assert manifest.url("css/site.css") == "/static/dist/css/site.def456.css"
+
+
+def test_manifest_version_before_build(tmp_path):
+    assert AssetManifest(str(tmp_path)).version == "0"
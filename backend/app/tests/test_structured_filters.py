@@ -0,0 +1,86 @@
+"""
+구조화 필터 컬럼 (country/duration/price_range) 테스트
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from app.models.newsletter import Newsletter, backfill_derived_columns
+
+
+def _add_newsletter(db, newsletter_id: str, country=None, duration=None, price_range=None,
+                    is_active: bool = True, days_ago: int = 0) -> Newsletter:
+    newsletter = Newsletter(
+        id=newsletter_id, title=f"Newsletter {newsletter_id}", content="content", source="test",
+        content_hash=newsletter_id, is_active=is_active,
+        location={"country": country, "city": "어딘가"},
+        program_info={"duration": duration, "price_range": price_range},
+        collected_date=datetime(2026, 1, 1) - timedelta(days=days_ago)
+    )
+    db.add(newsletter)
+    db.commit()
+    return newsletter
+
+
+def _ids(response) -> list:
+    return [item["id"] for item in response.json()["newsletters"]]
+
+
+def test_listener_fills_columns_on_insert_and_update(memory_db):
+    newsletter = _add_newsletter(memory_db, "nl_bali", "인도네시아", "1주일", "중가")
+    assert (newsletter.country, newsletter.duration, newsletter.price_range) == ("인도네시아", "1주일", "중가")
+
+    newsletter.location = {"country": "태국"}
+    newsletter.program_info = {"duration": "당일", "price_range": "고가"}
+    memory_db.commit()
+    memory_db.refresh(newsletter)
+
+    assert (newsletter.country, newsletter.duration, newsletter.price_range) == ("태국", "당일", "고가")
+
+
+def test_backfill_restores_cleared_columns(memory_db):
+    _add_newsletter(memory_db, "nl_1", "인도네시아", "1주일", "중가")
+    _add_newsletter(memory_db, "nl_2", "태국", "당일", None)
+    # 대량 UPDATE는 ORM 리스너를 거치지 않으므로 컬럼 추가 직후 상태를 흉내낼 수 있음
+    memory_db.query(Newsletter).update({"country": None, "duration": None, "price_range": None})
+    memory_db.commit()
+
+    assert backfill_derived_columns(memory_db, chunk_size=1) == 2
+
+    memory_db.expire_all()
+    rows = {row.id: (row.country, row.duration, row.price_range) for row in memory_db.query(Newsletter).all()}
+    assert rows == {"nl_1": ("인도네시아", "1주일", "중가"), "nl_2": ("태국", "당일", None)}
+
+
+def test_list_endpoint_structured_filters(memory_client, memory_db):
+    _add_newsletter(memory_db, "nl_match_new", "인도네시아", "1주일", "중가")
+    _add_newsletter(memory_db, "nl_match_old", "인도네시아", "1주일", "중가", days_ago=3)
+    _add_newsletter(memory_db, "nl_other_duration", "인도네시아", "당일", "중가")
+    _add_newsletter(memory_db, "nl_other_price", "인도네시아", "1주일", "럭셔리")
+    _add_newsletter(memory_db, "nl_other_country", "태국", "1주일", "중가")
+    _add_newsletter(memory_db, "nl_inactive", "인도네시아", "1주일", "중가", is_active=False)
+
+    response = memory_client.get("/api/v1/newsletters/", params={
+        "country": "인도네시아", "duration": "1주일", "price_range": "중가"
+    })
+    assert response.status_code == 200
+    assert _ids(response) == ["nl_match_new", "nl_match_old"]
+
+    response = memory_client.get("/api/v1/newsletters/", params={"country": "태국"})
+    assert _ids(response) == ["nl_other_country"]
+
+    response = memory_client.get("/api/v1/newsletters/", params={"price_range": "럭셔리"})
+    assert _ids(response) == ["nl_other_price"]
+
+    assert memory_client.get("/api/v1/newsletters/", params={"duration": "10일"}).status_code == 422
+
+
+def test_country_filter_uses_composite_index(memory_db):
+    plan = memory_db.execute(text(
+        "EXPLAIN QUERY PLAN SELECT id FROM newsletters "
+        "WHERE country = :country AND is_active = 1 ORDER BY collected_date DESC"
+    ), {"country": "인도네시아"}).all()
+    details = " ".join(row[-1] for row in plan)
+
+    assert "ix_newsletters_country_active_collected" in details
+    assert "TEMP B-TREE" not in details
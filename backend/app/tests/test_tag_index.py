@@ -0,0 +1,89 @@
+"""
+태그 역색인 (newsletter_tags) 테스트
+"""
+from app.models.newsletter import Newsletter, NewsletterTag
+from app.services.tag_index import backfill_tags, filter_by_tags, sync_tags, tag_counts
+
+
+def _add_newsletter(db, newsletter_id: str, tags, is_active: bool = True) -> Newsletter:
+    newsletter = Newsletter(
+        id=newsletter_id, title=f"Newsletter {newsletter_id}", content="content", source="test",
+        content_hash=newsletter_id, tags=tags, is_active=is_active
+    )
+    db.add(newsletter)
+    sync_tags(db, newsletter)
+    db.commit()
+    return newsletter
+
+
+def _ids(query) -> set:
+    return {newsletter.id for newsletter in query.all()}
+
+
+def _seed(db):
+    _add_newsletter(db, "nl_yoga_bali", ["yoga", "bali"])
+    _add_newsletter(db, "nl_yoga", ["yoga", "retreat"])
+    _add_newsletter(db, "nl_bali", ["bali", "spa"])
+
+
+def test_filter_all_tags_requires_every_tag(memory_db):
+    _seed(memory_db)
+
+    query = filter_by_tags(memory_db.query(Newsletter), ["yoga", "bali"], match_all=True)
+    assert _ids(query) == {"nl_yoga_bali"}
+
+
+def test_filter_any_tag_matches_either_tag(memory_db):
+    _seed(memory_db)
+
+    query = filter_by_tags(memory_db.query(Newsletter), ["yoga", "bali"], match_all=False)
+    assert _ids(query) == {"nl_yoga_bali", "nl_yoga", "nl_bali"}
+
+
+def test_filter_normalizes_and_ignores_empty_tags(memory_db):
+    _seed(memory_db)
+
+    assert _ids(filter_by_tags(memory_db.query(Newsletter), [" yoga ", "yoga", ""])) == {"nl_yoga_bali", "nl_yoga"}
+    assert _ids(filter_by_tags(memory_db.query(Newsletter), ["", "  "])) == {"nl_yoga_bali", "nl_yoga", "nl_bali"}
+
+
+def test_sync_tags_replaces_index_rows(memory_db):
+    newsletter = _add_newsletter(memory_db, "nl_1", ["yoga", "bali"])
+
+    newsletter.tags = ["spa"]
+    sync_tags(memory_db, newsletter)
+    memory_db.commit()
+
+    assert [row.tag for row in memory_db.query(NewsletterTag).all()] == ["spa"]
+    assert _ids(filter_by_tags(memory_db.query(Newsletter), ["yoga"])) == set()
+
+
+def test_tag_counts_skip_inactive_newsletters(memory_db):
+    _seed(memory_db)
+    _add_newsletter(memory_db, "nl_deleted", ["spa"], is_active=False)
+
+    assert tag_counts(memory_db) == [
+        {"tag": "bali", "count": 2},
+        {"tag": "yoga", "count": 2},
+        {"tag": "retreat", "count": 1},
+        {"tag": "spa", "count": 1},
+    ]
+
+
+def test_backfill_indexes_existing_tags(memory_db):
+    memory_db.add(Newsletter(id="nl_old", title="Old", content="content", source="test",
+                             content_hash="nl_old", tags=["yoga", "yoga", "meditation"]))
+    memory_db.commit()
+
+    assert backfill_tags(memory_db) == 1
+    assert sorted(row.tag for row in memory_db.query(NewsletterTag).all()) == ["meditation", "yoga"]
+
+
+def test_list_endpoint_tag_mode(client, db_session):
+    _seed(db_session)
+
+    response = client.get("/api/v1/newsletters/", params=[("tag", "yoga"), ("tag", "bali")])
+    assert {item["id"] for item in response.json()["newsletters"]} == {"nl_yoga_bali"}
+
+    response = client.get("/api/v1/newsletters/", params=[("tag", "yoga"), ("tag", "bali"), ("tag_mode", "any")])
+    assert {item["id"] for item in response.json()["newsletters"]} == {"nl_yoga_bali", "nl_yoga", "nl_bali"}
@@ -0,0 +1,114 @@
+"""
+웹 소스 수집 이력 (블룸 필터, 본 URL 프런티어) 테스트
+"""
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.models.newsletter import Newsletter, NewsletterSource, SeenUrl
+from app.services import newsletter_collector
+from app.services.newsletter_collector import NewsletterCollector
+from app.services.url_frontier import BloomFilter, SeenUrlFrontier, url_hash
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"https://example.com/a/{i}")
+
+    assert all(f"https://example.com/a/{i}" in bloom for i in range(1000))
+    false_positives = sum(f"https://example.com/b/{i}" in bloom for i in range(10000))
+    assert false_positives < 300  # 설정 오탐률 1%의 3배 이내
+    assert not bloom.saturated
+
+    bloom.add("one more")
+    assert bloom.saturated
+
+
+def test_url_hash_ignores_fragment_and_whitespace():
+    assert url_hash(" https://example.com/post/1#comments ") == url_hash("https://example.com/post/1")
+    assert url_hash("https://example.com/post/1") != url_hash("https://example.com/post/2")
+    assert url_hash("https://example.com/post/1?page=2") != url_hash("https://example.com/post/1")
+
+
+def test_known_and_add_are_per_source(memory_db):
+    frontier = SeenUrlFrontier()
+    urls = ["https://example.com/1", "https://example.com/2"]
+
+    assert frontier.known(memory_db, "blog", urls) == set()
+    assert frontier.add(memory_db, "blog", urls + ["", "https://example.com/1#top"]) == 2
+    memory_db.commit()
+
+    assert frontier.known(memory_db, "blog", urls + ["https://example.com/3"]) == set(urls)
+    assert frontier.known(memory_db, "other", urls) == set()
+    assert frontier.add(memory_db, "blog", urls) == 0  # 이미 기록된 URL은 다시 넣지 않음
+
+
+def test_add_from_another_worker_is_found_after_reload(memory_db):
+    """다른 워커가 기록한 URL: 필터에 없으면 새 URL로 보고, 재구성 후에는 알려진 URL"""
+    worker_a, worker_b = SeenUrlFrontier(), SeenUrlFrontier()
+    worker_b.load(memory_db)
+    worker_a.add(memory_db, "blog", ["https://example.com/1"])
+    memory_db.commit()
+
+    assert worker_b.known(memory_db, "blog", ["https://example.com/1"]) == set()
+    worker_b.load(memory_db)
+    assert worker_b.known(memory_db, "blog", ["https://example.com/1"]) == {"https://example.com/1"}
+
+
+def test_compact_removes_stale_and_orphaned_urls(memory_db):
+    memory_db.add(NewsletterSource(name="blog", url="https://example.com/", type="web"))
+    old = datetime.now() - timedelta(days=settings.SEEN_URL_RETENTION_DAYS + 1)
+    memory_db.add_all([
+        SeenUrl(source="blog", url_hash=url_hash("https://example.com/fresh"), url="https://example.com/fresh"),
+        SeenUrl(source="blog", url_hash=url_hash("https://example.com/stale"), url="https://example.com/stale",
+                first_seen=old, last_seen=old),
+        SeenUrl(source="deleted", url_hash=url_hash("https://example.com/x"), url="https://example.com/x"),
+    ])
+    memory_db.commit()
+    frontier = SeenUrlFrontier()
+
+    assert frontier.compact(memory_db) == 2
+    assert [row.url for row in memory_db.query(SeenUrl).all()] == ["https://example.com/fresh"]
+    assert frontier.known(memory_db, "blog", ["https://example.com/fresh", "https://example.com/stale"]) == {
+        "https://example.com/fresh"
+    }
+    assert frontier.compact_if_due(memory_db) is None  # 간격 내 재압축 안 함
+
+
+LISTING = "".join(
+    f"<article><h2>Bali yoga retreat week {index}</h2><p>Daily yoga, meditation and spa healing program {index}</p>"
+    f"<a href='/retreats/{index}'>more</a></article>"
+    for index in range(3)
+)
+
+
+@pytest.mark.asyncio
+async def test_collector_skips_already_processed_urls(memory_db, monkeypatch):
+    monkeypatch.setattr(settings, "REQUEST_DELAY", 0)
+    monkeypatch.setattr(newsletter_collector, "seen_url_frontier", SeenUrlFrontier())
+    source = NewsletterSource(name="blog", url="https://example.com/retreats", type="web",
+                              default_category="mind_wellness")
+    memory_db.add(source)
+    memory_db.commit()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/robots.txt":
+            return httpx.Response(404)
+        return httpx.Response(200, html=LISTING)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        collector = NewsletterCollector(client=client)
+        first = await collector.collect_from_web(source, memory_db)
+
+        checked = []
+        monkeypatch.setattr(collector, "_is_wellness_retreat_related", lambda title, content: checked.append(title))
+        second = await collector.collect_from_web(source, memory_db)
+
+    assert len(first) == 3
+    assert second == []
+    assert checked == []  # 관련성 검사/중복 검사 전에 제외
+    assert memory_db.query(Newsletter).count() == 3
+    assert memory_db.query(SeenUrl).count() == 3
@@ -166,6 +166,33 @@ if force_collect:
     print("✅ collection_patch.txt 파일이 생성되었습니다")
     print("이 패치를 적용하여 중복 체크 로직을 개선할 수 있습니다")
 
+def cluster_near_duplicates():
+    """근사 중복 클러스터링 (MinHash LSH)"""
+    print("\n🔁 근사 중복 클러스터링")
+    print("="*50)
+    
+    from app.services.near_duplicate import NearDuplicateIndex
+    
+    db = next(get_db())
+    try:
+        index = NearDuplicateIndex()
+        indexed = index.build_missing(db)
+        clusters = index.cluster(db)
+        print(f"새로 색인된 뉴스레터: {indexed}개")
+        print(f"근사 중복 클러스터: {len(clusters)}개")
+        for members in clusters:
+            print(f"  - {', '.join(members)}")
+        
+        if clusters:
+            response = input("가장 오래된 뉴스레터만 남기고 나머지를 비활성화하시겠습니까? (yes/no): ")
+            if response.lower() == 'yes':
+                deactivated = index.deactivate_duplicates(db, clusters)
+                print(f"✅ {deactivated}개 중복 뉴스레터가 비활성화되었습니다")
+            else:
+                print("❌ 비활성화 취소됨")
+    finally:
+        db.close()
+
 def main():
     """메인 함수"""
     print("🔧 뉴스레터 수집 시스템 수정 도구")
@@ -179,6 +206,7 @@ def main():
         print("4. Well+Good 소스 수정")
         print("5. 중복 체크 개선 제안")
         print("6. 테스트 솔루션 생성")
+        print("7. 근사 중복 클러스터링")
         print("0. 종료")
         
         choice = input("\n번호를 입력하세요: ").strip()
@@ -197,6 +225,8 @@ def main():
             improve_duplicate_check()
         elif choice == '6':
             create_test_solution()
+        elif choice == '7':
+            cluster_near_duplicates()
         elif choice == '0':
             print("👋 프로그램을 종료합니다")
             break
@@ -0,0 +1,46 @@
+/* 공통 JavaScript */
+// 토스트 메시지 표시 함수
+function showToast(message, type = 'success') {
+    const toast = document.getElementById('toast');
+    toast.__x.$data.message = message;
+    toast.__x.$data.type = type;
+    toast.__x.$data.show = true;
+    
+    setTimeout(() => {
+        toast.__x.$data.show = false;
+    }, 3000);
+}
+
+// 로딩 표시 함수
+function showLoading() {
+    document.getElementById('loading').__x.$data.show = true;
+}
+
+function hideLoading() {
+    document.getElementById('loading').__x.$data.show = false;
+}
+
+// API 호출 헬퍼
+async function apiCall(url, options = {}) {
+    showLoading();
+    try {
+        const response = await fetch(url, {
+            headers: {
+                'Content-Type': 'application/json',
+                ...options.headers
+            },
+            ...options
+        });
+        
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        
+        return await response.json();
+    } catch (error) {
+        showToast('요청 처리 중 오류가 발생했습니다.', 'error');
+        throw error;
+    } finally {
+        hideLoading();
+    }
+}
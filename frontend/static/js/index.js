@@ -0,0 +1,118 @@
+/* 메인 페이지 (Wellness Sanctuary) */
+function luxuryWellnessSanctuary() {
+    return {
+        newsletters: {
+            mind_wellness: [],
+            body_wellness: [],
+            spa_therapy: []
+        },
+        stats: {
+            total: 0,
+            active_sources: 0,
+            last_updated: null
+        },
+        collecting: false,
+        collectResult: null,
+        
+        async init() {
+            await this.loadDashboard();
+            this.subscribeStream();
+        },
+        
+        async loadDashboard() {
+            // 카테고리별 최신 5개와 통계를 한 번의 요청으로 로드
+            try {
+                const response = await fetch('/api/v1/newsletters/dashboard?per_category=5');
+                const data = await response.json();
+                
+                for (const category of Object.keys(this.newsletters)) {
+                    this.newsletters[category] = data.categories?.[category] || [];
+                }
+                
+                this.stats.total = data.stats?.total_newsletters || 0;
+                this.stats.active_sources = data.stats?.active_sources || 0;
+                
+                // 마지막 업데이트 시간 (가장 최근 뉴스레터 기준)
+                const allNewsletters = [
+                    ...this.newsletters.mind_wellness,
+                    ...this.newsletters.body_wellness,
+                    ...this.newsletters.spa_therapy
+                ];
+                
+                if (allNewsletters.length > 0) {
+                    const latest = allNewsletters.reduce((latest, newsletter) => {
+                        return new Date(newsletter.collected_date) > new Date(latest.collected_date) ? newsletter : latest;
+                    });
+                    this.stats.last_updated = new Date(latest.collected_date).toLocaleDateString('ko-KR');
+                } else {
+                    this.stats.last_updated = '데이터 없음';
+                }
+                
+            } catch (error) {
+                console.error('대시보드 로딩 실패:', error);
+            }
+        },
+        
+        subscribeStream() {
+            // 새로 수집된 뉴스레터를 실시간으로 카테고리 목록 맨 앞에 추가 (SSE)
+            if (!window.EventSource) return;
+            
+            const source = new EventSource('/api/v1/newsletters/stream');
+            source.addEventListener('newsletter', (event) => {
+                const newsletter = JSON.parse(event.data);
+                const list = this.newsletters[newsletter.primary_category];
+                if (!list || list.some(item => item.id === newsletter.id)) return;
+                
+                this.newsletters[newsletter.primary_category] = [newsletter, ...list].slice(0, 5);
+                this.stats.total += 1;
+                this.stats.last_updated = new Date(newsletter.collected_date).toLocaleDateString('ko-KR');
+            });
+        },
+        
+        async collectNewsletters() {
+            this.collecting = true;
+            this.collectResult = null;
+            
+            try {
+                const response = await fetch('/api/v1/newsletters/collect/', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    }
+                });
+                
+                if (!response.ok) {
+                    throw new Error(`HTTP error! status: ${response.status}`);
+                }
+                
+                const data = await response.json();
+                
+                // 성공 메시지 설정
+                this.collectResult = {
+                    success: true,
+                    message: `✅ ${data.result?.newsletters_collected || 0}개의 새로운 정보를 수집했습니다!`
+                };
+                
+                // 3초 후 데이터 새로고침
+                setTimeout(async () => {
+                    await this.loadDashboard();
+                    this.collectResult = null;
+                }, 3000);
+                
+            } catch (error) {
+                console.error('뉴스레터 수집 실패:', error);
+                this.collectResult = {
+                    success: false,
+                    message: '❌ 수집 중 오류가 발생했습니다'
+                };
+                
+                // 5초 후 에러 메시지 자동 숨김
+                setTimeout(() => {
+                    this.collectResult = null;
+                }, 5000);
+            } finally {
+                this.collecting = false;
+            }
+        }
+    }
+}
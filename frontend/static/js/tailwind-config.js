@@ -0,0 +1,50 @@
+/* 아만 호텔급 디자인 설정 (Tailwind CDN 확장) */
+tailwind.config = {
+    theme: {
+        extend: {
+            colors: {
+                sanctuary: {
+                    cream: '#FAF8F5',
+                    parchment: '#F4F0EA',
+                    linen: '#EDE7DD',
+                    sage: '#8FA68E',
+                    mist: '#B5C4C1',
+                    sand: '#C4B299',
+                    gold: '#D4AF7A',
+                    copper: '#B8956A',
+                    charcoal: '#3A3A3A',
+                    stone: '#6B6B6B',
+                    whisper: '#9B9B9B'
+                }
+            },
+            fontFamily: {
+                'display': ['Optima', 'Avenir Next', 'sans-serif'],
+                'heading': ['Noto Serif KR', 'Playfair Display', 'serif'],
+                'body': ['Noto Sans KR', 'Source Sans Pro', 'sans-serif'],
+                'accent': ['Crimson Text', 'serif']
+            },
+            spacing: {
+                '1.5': '0.375rem',
+                '2.5': '0.625rem',
+                '3.5': '0.875rem',
+                '4.5': '1.125rem',
+                '5.5': '1.375rem',
+                '13': '3.25rem',
+                '15': '3.75rem',
+                '17': '4.25rem',
+                '18': '4.5rem',
+                '19': '4.75rem',
+                '21': '5.25rem',
+                '22': '5.5rem',
+                '23': '5.75rem',
+                '25': '6.25rem',
+                '26': '6.5rem',
+                '27': '6.75rem',
+                '28': '7rem',
+                '29': '7.25rem',
+                '30': '7.5rem',
+                '34': '8.5rem'
+            }
+        }
+    }
+}
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+수집기 처리량 벤치마크
+가짜 피드 서버(scripts/fake_feed_server.py)를 띄우고 임시 DB에서 CollectionScheduler.run_collection을
+반복 실행해 소스/초, 항목/초, 소스별 소요 시간 p95, 최대 RSS를 측정
+결과를 JSON으로 저장해 커밋 간 비교 (--output / --compare)
+
+사용 예:
+  python scripts/bench_collector.py --rss 10 --atom 5 --web 5 --entries 30 --output bench/collector.json
+  python scripts/bench_collector.py --compare bench/collector.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+backend_root = project_root / "backend"
+sys.path.insert(0, str(backend_root))
+
+from fake_feed_server import FakeFeedServer, FeedConfig  # noqa: E402
+
+
+def _configure_environment(tmp_dir: str, request_delay: float) -> None:
+    """app 모듈 import 전에 임시 DB/잠금 파일과 요청 간격 설정"""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+    os.environ["DATA_VERSION_FILE"] = os.path.join(tmp_dir, "data_version")
+    os.environ["COLLECTION_LOCK_FILE"] = os.path.join(tmp_dir, "collection.lock")
+    os.environ["REQUEST_DELAY"] = str(request_delay)
+    os.environ["SQL_SLOW_QUERY_MS"] = "0"
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _seed_sources(server: FakeFeedServer, rss: int, atom: int, web: int) -> int:
+    from app.core.database import SessionLocal
+    from app.models.newsletter import NewsletterSource
+
+    sources = (
+        [NewsletterSource(name=f"bench-rss-{i}", url=server.url(f"/rss/{i}.xml"), type="rss",
+                          default_category="mind_wellness") for i in range(rss)]
+        + [NewsletterSource(name=f"bench-atom-{i}", url=server.url(f"/atom/{i}.xml"), type="rss",
+                            default_category="body_wellness") for i in range(atom)]
+        + [NewsletterSource(name=f"bench-web-{i}", url=server.url(f"/web/{i}/"), type="web",
+                            default_category="spa_therapy") for i in range(web)]
+    )
+    db = SessionLocal()
+    try:
+        db.add_all(sources)
+        db.commit()
+    finally:
+        db.close()
+    return len(sources)
+
+
+def run_once(server: FakeFeedServer, args) -> dict:
+    """빈 DB에서 전체 수집 1회"""
+    from app.core import metrics
+    from app.core.database import SessionLocal, create_tables, drop_tables
+    from app.core.http_client import outbound_http
+    from app.services.newsletter_collector import CollectionScheduler
+
+    drop_tables()
+    create_tables()
+    source_count = _seed_sources(server, args.rss, args.atom, args.web)
+    metrics.registry.reset()
+    outbound_http.stats.reset()
+
+    async def collect():
+        db = SessionLocal()
+        try:
+            return await CollectionScheduler(db).run_collection()
+        finally:
+            db.close()
+            await outbound_http.aclose()  # 실행마다 새 이벤트 루프이므로 연결 풀도 새로
+
+    started = time.perf_counter()
+    result = asyncio.run(collect())
+    elapsed = time.perf_counter() - started
+
+    source_times = [state[1] for state in metrics.collector_source_duration_seconds.values().values()]
+    stages = {}
+    for (_, stage), value in metrics.collector_entries_total.values().items():
+        stages[stage] = stages.get(stage, 0) + int(value)
+    fetched = sum(metrics.collector_bytes_fetched_total.values().values())
+
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "sources": source_count,
+        "sources_per_s": round(source_count / elapsed, 2),
+        "entries_parsed": stages.get("parsed", 0),
+        "entries_inserted": result["newsletters_collected"],
+        "entries_per_s": round(stages.get("parsed", 0) / elapsed, 1),
+        "inserted_per_s": round(result["newsletters_collected"] / elapsed, 1),
+        "stages": stages,
+        "errors": result["errors"],
+        "bytes_fetched": int(fetched),
+        "source_p50_s": round(_percentile(source_times, 0.5), 4),
+        "source_p95_s": round(_percentile(source_times, 0.95), 4),
+    }
+
+
+def summarize(runs: list) -> dict:
+    keys = ["elapsed_s", "sources_per_s", "entries_per_s", "inserted_per_s", "source_p50_s", "source_p95_s"]
+    return {key: round(statistics.median(run[key] for run in runs), 4) for key in keys}
+
+
+def print_comparison(current: dict, previous: dict) -> None:
+    print(f"\n🔁 비교: {previous.get('revision')} → {current.get('revision')}")
+    for key, value in current["summary"].items():
+        before = previous.get("summary", {}).get(key)
+        if not before:
+            continue
+        change = (value - before) / before * 100
+        print(f"  {key:<16} {before:>10} → {value:>10}  ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집기 처리량 벤치마크 (가짜 피드 서버 + 임시 DB)")
+    parser.add_argument("--rss", type=int, default=10, help="RSS 소스 수 (기본값: 10)")
+    parser.add_argument("--atom", type=int, default=5, help="Atom 소스 수 (기본값: 5)")
+    parser.add_argument("--web", type=int, default=5, help="HTML 목록 소스 수 (기본값: 5, 페이지당 최대 10개 추출)")
+    parser.add_argument("--entries", type=int, default=20, help="피드당 항목 수 (기본값: 20)")
+    parser.add_argument("--entry-size", type=int, default=2000, help="항목 본문 크기(문자) (기본값: 2000)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="서버 응답 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="서버 500 응답 비율 (0~1)")
+    parser.add_argument("--request-delay", type=float, default=0.0, help="수집기 항목 간 대기 REQUEST_DELAY (기본값: 0)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본값: 3, 중앙값 보고)")
+    parser.add_argument("--seed", type=int, default=42, help="피드 내용 시드")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="bench_collector_")
+    _configure_environment(tmp_dir, args.request_delay)
+    import logging
+    logging.basicConfig(level=logging.WARNING)
+
+    config = FeedConfig(args.entries, args.entry_size, args.latency_ms, args.error_rate, seed=args.seed)
+    with FakeFeedServer(config) as server:
+        runs = [run_once(server, args) for _ in range(max(1, args.repeat))]
+
+    report = {
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare", "json")},
+        "summary": summarize(runs),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "runs": runs,
+    }
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        summary = report["summary"]
+        last = runs[-1]
+        print(f"📥 수집기 벤치마크 ({report['revision']})")
+        print("=" * 64)
+        print(f"  소스 {last['sources']}개 (rss {args.rss} / atom {args.atom} / web {args.web}), "
+              f"피드당 {args.entries}개, 본문 {args.entry_size}자")
+        print(f"  실행 시간 (중앙값):   {summary['elapsed_s']:>10.3f} s")
+        print(f"  소스/초:              {summary['sources_per_s']:>10.2f}")
+        print(f"  항목/초 (파싱):       {summary['entries_per_s']:>10.1f}")
+        print(f"  항목/초 (저장):       {summary['inserted_per_s']:>10.1f}")
+        print(f"  소스별 시간 p50/p95:  {summary['source_p50_s']:.4f} / {summary['source_p95_s']:.4f} s")
+        print(f"  최대 RSS:             {report['peak_rss_mb']:>10.1f} MB")
+        print(f"  단계별 항목: {last['stages']}, 오류 {last['errors']}개, 수신 {last['bytes_fetched']:,} 바이트")
+        print("=" * 64)
+        if args.output:
+            print(f"💾 저장: {args.output}")
+
+    if args.compare:
+        print_comparison(report, json.loads(Path(args.compare).read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+응답 압축 벤치마크
+실제 API 응답(또는 합성 목록 응답)을 gzip 레벨/brotli 품질별로 압축해
+전송 바이트와 CPU 비용을 비교 (COMPRESSION_GZIP_LEVEL / COMPRESSION_BROTLI_QUALITY 튜닝용)
+"""
+import argparse
+import gzip
+import json
+import random
+import time
+import zlib
+
+try:
+    import brotli  # 선택 의존성
+except ImportError:
+    brotli = None
+
+SAMPLE_TAGS = ["요가", "명상", "발리", "디톡스", "스파", "마인드풀니스", "필라테스", "아유르베다"]
+SAMPLE_COUNTRIES = ["인도네시아", "태국", "인도", "한국", "일본", "코스타리카"]
+
+
+def synthetic_list_payload(per_page: int, seed: int = 42) -> bytes:
+    """per_page개 뉴스레터가 담긴 목록 응답과 비슷한 JSON 생성"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(per_page):
+        items.append({
+            "id": f"{rng.getrandbits(128):032x}",
+            "title": f"{rng.choice(SAMPLE_COUNTRIES)} 웰니스 리트리트 가이드 #{i}",
+            "summary": " ".join(rng.choice(SAMPLE_TAGS) for _ in range(40)),
+            "category": rng.choice(["mind_wellness", "body_wellness", "spa_therapy"]),
+            "source_name": rng.choice(["Well+Good", "Mindful Magazine", "Yoga Journal"]),
+            "source_url": f"https://example.com/articles/{rng.getrandbits(48):x}",
+            "tags": rng.sample(SAMPLE_TAGS, 3),
+            "location": {"country": rng.choice(SAMPLE_COUNTRIES), "city": None},
+            "program_info": {"duration": "1주일", "price_range": "럭셔리"},
+            "quality_score": round(rng.random(), 3),
+            "view_count": rng.randint(0, 5000),
+            "collected_date": f"2024-12-{rng.randint(1, 28):02d}T09:00:00",
+            "published_date": None,
+            "is_active": True,
+        })
+    payload = {"items": items, "total": per_page * 20, "page": 1, "per_page": per_page, "pages": 20}
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def fetch_payload(url: str) -> bytes:
+    """실행 중인 서버에서 압축되지 않은 응답 본문 수집"""
+    import httpx
+
+    response = httpx.get(url, headers={"Accept-Encoding": "identity"}, timeout=30)
+    response.raise_for_status()
+    return response.content
+
+
+def measure(compress, payload: bytes, repeat: int):
+    """압축 결과 크기와 응답 1건당 평균 CPU 시간(ms)"""
+    compressed = compress(payload)
+    started = time.process_time()
+    for _ in range(repeat):
+        compress(payload)
+    cpu_ms = (time.process_time() - started) * 1000 / repeat
+    return len(compressed), cpu_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 압축 레벨별 전송 바이트/CPU 비용 비교")
+    parser.add_argument("--url", action="append", help="측정할 API URL (여러 번 지정 가능, 생략 시 합성 응답 사용)")
+    parser.add_argument("--per-page", type=int, default=100, help="합성 목록 응답 크기 (기본값: 100)")
+    parser.add_argument("--repeat", type=int, default=50, help="레벨별 반복 횟수 (기본값: 50)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    if args.url:
+        payloads = {url: fetch_payload(url) for url in args.url}
+    else:
+        payloads = {f"synthetic list (per_page={args.per_page})": synthetic_list_payload(args.per_page)}
+
+    candidates = [(f"gzip-{level}", lambda data, level=level: gzip.compress(data, compresslevel=level, mtime=0))
+                  for level in (1, 3, 4, 5, 6, 7, 9)]
+    if brotli is not None:
+        candidates += [(f"br-{quality}", lambda data, quality=quality: brotli.compress(data, quality=quality))
+                       for quality in (0, 2, 4, 5, 6, 8, 11)]
+
+    results = []
+    for name, payload in payloads.items():
+        for label, compress in candidates:
+            size, cpu_ms = measure(compress, payload, args.repeat)
+            results.append({
+                "payload": name,
+                "encoding": label,
+                "bytes_in": len(payload),
+                "bytes_out": size,
+                "ratio": round(size / len(payload), 4),
+                "cpu_ms": round(cpu_ms, 3),
+                "mb_per_second": round(len(payload) / 1e6 / (cpu_ms / 1000), 1) if cpu_ms > 0 else None,
+            })
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    print("🗜️ 응답 압축 벤치마크")
+    if brotli is None:
+        print("⚠️ brotli 패키지가 없어 gzip만 측정합니다")
+    print("=" * 72)
+    current = None
+    for row in results:
+        if row["payload"] != current:
+            current = row["payload"]
+            print(f"\n📄 {current}: {row['bytes_in']:,} bytes (zlib {zlib.ZLIB_VERSION})")
+            print(f"  {'인코딩':<10} {'전송 바이트':>12} {'비율':>8} {'CPU ms/응답':>12} {'MB/s':>8}")
+        print(f"  {row['encoding']:<10} {row['bytes_out']:>12,} {row['ratio']:>8.3f} "
+              f"{row['cpu_ms']:>12.3f} {row['mb_per_second'] or 0:>8.1f}")
+    print("\n" + "=" * 72)
+    print("💡 서버 누적 통계는 /health 응답의 compression 항목에서 확인할 수 있습니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+메트릭 기록 오버헤드 벤치마크
+- 카운터/히스토그램 기록 1회당 비용 (스레드별 샤드) vs 잠금 기반 카운터
+- 여러 스레드가 동시에 기록할 때 처리량과 합계 정확성
+- MetricsMiddleware가 요청 1건에 더하는 시간 (ASGI 앱 직접 호출, 네트워크 제외)
+- /metrics 출력(스크레이프) 시간
+--max-middleware-us 를 넘으면 0이 아닌 코드로 종료
+"""
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+backend_root = project_root / "backend"
+sys.path.insert(0, str(backend_root))
+
+from app.core.metrics import Counter, Histogram, MetricsMiddleware, MetricsRegistry  # noqa: E402
+
+
+class LockedCounter:
+    """비교용: 전역 잠금으로 보호하는 단순 카운터"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+def per_op_ns(func, iterations: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter_ns() - started) / iterations
+
+
+def threaded_throughput(func, threads: int, iterations: int) -> float:
+    """스레드 threads개가 각각 iterations번 기록할 때 초당 기록 수"""
+    workers = [
+        threading.Thread(target=lambda: [func() for _ in range(iterations)])
+        for _ in range(threads)
+    ]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * iterations / (time.perf_counter() - started)
+
+
+async def _plain_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b'{"status":"ok"}'})
+
+
+async def _drive(app, requests: int) -> float:
+    """ASGI 앱을 requests번 호출했을 때 요청당 평균 시간 (µs)"""
+    scope = {"type": "http", "method": "GET", "path": "/bench", "root_path": "", "headers": []}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="메트릭 기록 오버헤드 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200_000, help="측정 반복 횟수 (기본값: 200000)")
+    parser.add_argument("--threads", type=int, default=8, help="동시 기록 스레드 수 (기본값: 8)")
+    parser.add_argument("--requests", type=int, default=20_000, help="미들웨어 측정 요청 수 (기본값: 20000)")
+    parser.add_argument("--max-middleware-us", type=float, default=None,
+                        help="미들웨어 요청당 추가 시간 한도(µs), 초과하면 종료 코드 1")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("bench_total", "벤치마크 카운터", ("route",)))
+    histogram = registry.register(Histogram("bench_seconds", "벤치마크 히스토그램", ("route",)))
+    locked = LockedCounter()
+    labels = ("/api/v1/newsletters/",)
+
+    single = {
+        "counter_inc_ns": round(per_op_ns(lambda: counter.inc(labels), args.iterations), 1),
+        "histogram_observe_ns": round(per_op_ns(lambda: histogram.observe(0.0123, labels), args.iterations), 1),
+        "locked_counter_inc_ns": round(per_op_ns(lambda: locked.inc(labels), args.iterations), 1),
+    }
+
+    registry.reset()
+    per_thread = args.iterations // args.threads
+    threaded = {
+        "threads": args.threads,
+        "counter_ops_per_s": round(threaded_throughput(lambda: counter.inc(labels), args.threads, per_thread)),
+        "locked_counter_ops_per_s": round(threaded_throughput(lambda: locked.inc(labels), args.threads, per_thread)),
+    }
+    threaded["counter_total_correct"] = counter.values().get(labels) == args.threads * per_thread
+
+    for route in range(50):  # 라우트 50개 x 상태 코드 규모의 스크레이프
+        histogram.observe(0.01, (f"/route/{route}",))
+        counter.inc((f"/route/{route}",))
+    started = time.perf_counter()
+    rendered = registry.render()
+    render_ms = (time.perf_counter() - started) * 1000
+
+    baseline_us = asyncio.run(_drive(_plain_app, args.requests))
+    instrumented_us = asyncio.run(_drive(MetricsMiddleware(_plain_app), args.requests))
+    middleware = {
+        "baseline_us": round(baseline_us, 2),
+        "instrumented_us": round(instrumented_us, 2),
+        "overhead_us": round(instrumented_us - baseline_us, 2),
+    }
+
+    over_budget = args.max_middleware_us is not None and middleware["overhead_us"] > args.max_middleware_us
+    report = {
+        "single_thread": single,
+        "multi_thread": threaded,
+        "middleware": middleware,
+        "render": {"ms": round(render_ms, 2), "bytes": len(rendered)},
+        "over_budget": over_budget,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("📈 메트릭 기록 오버헤드")
+        print("=" * 60)
+        print(f"  카운터 inc:           {single['counter_inc_ns']:>10.1f} ns/회")
+        print(f"  히스토그램 observe:   {single['histogram_observe_ns']:>10.1f} ns/회")
+        print(f"  (비교) 잠금 카운터:   {single['locked_counter_inc_ns']:>10.1f} ns/회")
+        print("-" * 60)
+        print(f"  스레드 {args.threads}개 동시 기록: {threaded['counter_ops_per_s']:>12,} 회/초 "
+              f"(잠금 카운터 {threaded['locked_counter_ops_per_s']:,} 회/초)")
+        status = "✅" if threaded["counter_total_correct"] else "❌"
+        print(f"  {status} 샤드 합계 정확성")
+        print("-" * 60)
+        print(f"  미들웨어 추가 시간: {middleware['overhead_us']:.2f} µs/요청 "
+              f"({middleware['baseline_us']:.2f} → {middleware['instrumented_us']:.2f} µs)")
+        print(f"  스크레이프 출력: {render_ms:.2f}ms ({len(rendered):,} 바이트)")
+        print("=" * 60)
+        if args.max_middleware_us is not None:
+            status = "❌ 한도 초과" if over_budget else "✅ 한도 이내"
+            print(f"{status}: {middleware['overhead_us']:.2f}µs / {args.max_middleware_us:.2f}µs")
+
+    if over_budget or not threaded["counter_total_correct"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+요청 제한 저장소 벤치마크
+memory:// 와 sqlite:// (워커 간 공유) 저장소의 요청당 제한 확인 오버헤드를
+스레드/프로세스 동시성 수준별로 측정하고, 여러 프로세스에서 제한이 정확히 지켜지는지 검증
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+backend_root = project_root / "backend"
+sys.path.insert(0, str(backend_root))
+
+from limits import parse  # noqa: E402
+from limits.storage import storage_from_string  # noqa: E402
+from limits.strategies import STRATEGIES  # noqa: E402
+
+from app.core import rate_limit_storage  # noqa: E402,F401 - sqlite:// 스킴 등록
+
+
+def _hit_loop(uri: str, strategy: str, limit: str, hits: int, keys: int, key_prefix: str, latencies: list) -> int:
+    """hits번 제한 확인 후 허용된 횟수 반환 (요청별 지연 시간은 latencies에 추가)"""
+    limiter = STRATEGIES[strategy](storage_from_string(uri))
+    item = parse(limit)
+    allowed = 0
+    for i in range(hits):
+        started = time.perf_counter()
+        if limiter.hit(item, key_prefix, str(i % keys)):  # keys개의 클라이언트 IP를 번갈아 사용
+            allowed += 1
+        latencies.append(time.perf_counter() - started)
+    return allowed
+
+
+def _process_worker(args) -> tuple:
+    uri, strategy, limit, hits, keys, key_prefix = args
+    latencies: list = []
+    allowed = _hit_loop(uri, strategy, limit, hits, keys, key_prefix, latencies)
+    return allowed, latencies
+
+
+def run_threads(uri: str, strategy: str, concurrency: int, hits: int, keys: int = 50) -> list:
+    latencies: list = []
+    key_prefix = f"bench-thread-{time.time_ns()}"
+    threads = [
+        threading.Thread(target=_hit_loop, args=(uri, strategy, "1000000/minute", hits, keys, key_prefix, latencies))
+        for _ in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def run_processes(uri: str, strategy: str, concurrency: int, hits: int,
+                  limit: str = "1000000/minute", keys: int = 50) -> tuple:
+    key_prefix = f"bench-proc-{time.time_ns()}"
+    with multiprocessing.Pool(concurrency) as pool:
+        results = pool.map(_process_worker, [(uri, strategy, limit, hits, keys, key_prefix)] * concurrency)
+    allowed = sum(result[0] for result in results)
+    latencies = [latency for result in results for latency in result[1]]
+    return allowed, latencies
+
+
+def summarize(latencies: list) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "hits": len(ordered),
+        "mean_us": round(statistics.fmean(ordered) * 1e6, 1),
+        "p50_us": round(ordered[len(ordered) // 2] * 1e6, 1),
+        "p99_us": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요청 제한 저장소 오버헤드 벤치마크")
+    parser.add_argument("--strategy", default="sliding-window-counter",
+                        choices=["fixed-window", "sliding-window-counter"], help="제한 전략")
+    parser.add_argument("--hits", type=int, default=2000, help="동시 실행 단위당 요청 수 (기본값: 2000)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8], help="동시성 수준")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="bench_rate_limit_")
+    sqlite_uri = f"sqlite:///{os.path.join(tmp_dir, 'rate_limits.db')}"
+    backends = {"memory": "memory://", "sqlite": sqlite_uri}
+
+    results = []
+    for concurrency in args.concurrency:
+        for name, uri in backends.items():
+            latencies = run_threads(uri, args.strategy, concurrency, args.hits)
+            results.append({"backend": name, "mode": "threads", "concurrency": concurrency, **summarize(latencies)})
+        # memory:// 는 프로세스 간 공유되지 않으므로 프로세스 측정은 sqlite만
+        _, latencies = run_processes(sqlite_uri, args.strategy, concurrency, args.hits)
+        results.append({"backend": "sqlite", "mode": "processes", "concurrency": concurrency, **summarize(latencies)})
+
+    # 정확성: 4개 프로세스가 같은 키로 "100/minute" 제한을 공유하면 합계 100건만 허용되어야 함
+    allowed, _ = run_processes(sqlite_uri, args.strategy, 4, 100, limit="100/minute", keys=1)
+    correctness = {"processes": 4, "requests": 400, "limit": 100, "allowed": allowed}
+
+    if args.json:
+        print(json.dumps({"strategy": args.strategy, "results": results, "correctness": correctness}, indent=2))
+        return
+
+    print(f"⏱️ 요청 제한 확인 오버헤드 ({args.strategy})")
+    print("=" * 72)
+    print(f"  {'저장소':<8} {'방식':<10} {'동시성':>6} {'요청 수':>8} {'평균(µs)':>10} {'p50(µs)':>10} {'p99(µs)':>10}")
+    for row in results:
+        print(f"  {row['backend']:<8} {row['mode']:<10} {row['concurrency']:>6} {row['hits']:>8} "
+              f"{row['mean_us']:>10.1f} {row['p50_us']:>10.1f} {row['p99_us']:>10.1f}")
+    print("=" * 72)
+    status = "✅" if allowed == 100 else "❌"
+    print(f"{status} 공유 카운터 검증: 프로세스 4개 x 100건, 제한 100/minute → 허용 {allowed}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+서버 시작 시간 벤치마크
+`python -X importtime`으로 app.main import 비용이 큰 모듈을 보여주고,
+uvicorn 프로세스를 띄워 /health가 처음 200을 돌려줄 때까지 걸린 시간을 측정
+(첫 시작 = 빈 DB에 테이블 생성, 재시작 = 스키마 지문 캐시로 확인 생략)
+--budget을 넘으면 0이 아닌 코드로 종료하므로 CI 회귀 검사에 사용할 수 있다
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# 프로젝트 루트
+project_root = Path(__file__).parent.parent
+backend_root = project_root / "backend"
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _server_env(tmp_dir: str) -> dict:
+    """임시 DB/잠금 파일을 쓰고 예약 수집은 끈 서버 환경"""
+    env = dict(os.environ)
+    env.update({
+        "DATABASE_URL": f"sqlite:///{os.path.join(tmp_dir, 'startup.db')}",
+        "DATA_VERSION_FILE": os.path.join(tmp_dir, "data_version"),
+        "LEADER_LOCK_FILE": os.path.join(tmp_dir, "leader.lock"),
+        "COLLECTION_LOCK_FILE": os.path.join(tmp_dir, "collection.lock"),
+        "BOOTSTRAP_LOCK_FILE": os.path.join(tmp_dir, "bootstrap.lock"),
+        "RATE_LIMIT_STORAGE_URI": "memory://",
+        "COLLECTION_ENABLED": "false",
+        "PYTHONPATH": str(backend_root),
+    })
+    return env
+
+
+def measure_imports(top: int) -> dict:
+    """app.main import 시간 (importtime 출력에서 최상위 import별 누적 시간)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=backend_root, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": str(backend_root)},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"app.main import 실패:\n{result.stderr[-2000:]}")
+
+    total_us = 0
+    direct = []  # app.main이 직접 import한 모듈 (들여쓰기 한 단계)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # 헤더 줄
+        depth = (len(name) - len(name.lstrip())) // 2
+        module = name.strip()
+        if module == "app.main":
+            total_us = int(cumulative)
+        elif depth == 1:
+            direct.append((module, int(cumulative)))
+
+    direct.sort(key=lambda item: item[1], reverse=True)
+    loaded = {module for module, _ in direct}
+    return {
+        "total_ms": round(total_us / 1000, 1),
+        "top_modules": [{"module": module, "cumulative_ms": round(us / 1000, 1)} for module, us in direct[:top]],
+        "collector_deps_loaded": sorted(loaded & {"feedparser", "bs4", "httpx", "aiofiles"}),
+    }
+
+
+def time_to_first_200(tmp_dir: str, timeout: float) -> float:
+    """uvicorn 실행부터 /health 첫 200 응답까지 걸린 시간 (초)"""
+    port = _free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=backend_root, env=_server_env(tmp_dir),
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"서버가 시작 중 종료됨:\n{process.stderr.read().decode()[-2000:]}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                pass
+            time.sleep(0.01)
+        raise RuntimeError(f"{timeout}초 안에 /health 응답 없음")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 시작 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=3, help="재시작 측정 횟수 (기본값: 3, 중앙값 사용)")
+    parser.add_argument("--top", type=int, default=10, help="표시할 import 상위 모듈 수 (기본값: 10)")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="재시작 시 /health 첫 200까지 허용 시간(초), 초과하면 종료 코드 1")
+    parser.add_argument("--timeout", type=float, default=30.0, help="서버 시작 대기 한도(초)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    imports = measure_imports(args.top)
+    with tempfile.TemporaryDirectory(prefix="bench_startup_") as tmp_dir:
+        cold = time_to_first_200(tmp_dir, args.timeout)
+        warm_runs = sorted(time_to_first_200(tmp_dir, args.timeout) for _ in range(max(1, args.repeat)))
+    warm = warm_runs[len(warm_runs) // 2]
+
+    over_budget = args.budget is not None and warm > args.budget
+    report = {
+        "imports": imports,
+        "first_200": {
+            "cold_s": round(cold, 3),
+            "warm_s": round(warm, 3),
+            "warm_runs_s": [round(run, 3) for run in warm_runs],
+        },
+        "budget_s": args.budget,
+        "over_budget": over_budget,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print("🚀 서버 시작 시간")
+        print("=" * 60)
+        print(f"  app.main import: {imports['total_ms']:.1f}ms")
+        for row in imports["top_modules"]:
+            print(f"    {row['module']:<40} {row['cumulative_ms']:>8.1f}ms")
+        if imports["collector_deps_loaded"]:
+            print(f"  ⚠️ 수집기 의존성이 즉시 로드됨: {', '.join(imports['collector_deps_loaded'])}")
+        print("-" * 60)
+        print(f"  /health 첫 200 (첫 시작, 테이블 생성): {cold * 1000:>8.1f}ms")
+        print(f"  /health 첫 200 (재시작, 중앙값):       {warm * 1000:>8.1f}ms")
+        print("=" * 60)
+        if args.budget is not None:
+            status = "❌ 예산 초과" if over_budget else "✅ 예산 이내"
+            print(f"{status}: {warm:.3f}s / {args.budget:.3f}s")
+
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+수집기 텍스트 분석 함수 마이크로 벤치마크 + 회귀 검사
+항목마다 실행되는 관련성 검사/카테고리 분류/위치·프로그램 추출/품질 평가를
+고정 코퍼스(짧은/긴 × 한국어/영어, 무관 기사 포함)에서 측정하고 저장된 기준선과 비교
+
+- 함수별로 라운드를 반복해 호출 1회당 시간(µs)의 최솟값/중앙값을 보고 (회귀 판정은 최솟값)
+- 기계 간 속도 차이는 라운드마다 함께 재는 순수 파이썬 보정 작업 대비 상대 비용으로 보정
+- --check: 기준선 대비 코퍼스 합계가 --threshold 이상 느려진 함수가 있으면 종료 코드 1
+
+사용 예:
+  python scripts/bench_text_analysis.py                    # 측정 + 기본 기준선과 비교
+  python scripts/bench_text_analysis.py --check            # 회귀 시 실패 (CI)
+  python scripts/bench_text_analysis.py --save-baseline    # 의도한 변경 후 기준선 갱신
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+backend_root = project_root / "backend"
+sys.path.insert(0, str(backend_root))
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "text_analysis.json"
+
+PARAGRAPHS = {
+    "ko": (
+        "발리 우붓의 요가 리트리트는 아침 명상과 빈야사 요가로 하루를 시작합니다. "
+        "유기농 채식 식단과 디톡스 주스가 제공되며, 오후에는 전통 발리니즈 마사지와 스파 테라피를 받을 수 있습니다. "
+        "1주일 프로그램은 합리적인 가격에 숙박과 공항 픽업이 포함되어 있어 처음 참가하는 분들께도 좋습니다. "
+    ),
+    "en": (
+        "This luxury wellness retreat in Chiang Mai, Thailand combines daily meditation and mindfulness sessions "
+        "with holistic spa treatments. Guests enjoy organic meals, forest walks and aromatherapy massage, "
+        "and the one week program includes accommodation and airport transfers. "
+    ),
+    "off_topic": (
+        "The quarterly earnings report showed revenue growth across all business segments, "
+        "while analysts expect the new smartphone lineup to lift sales in the next fiscal year. "
+    ),
+}
+TITLES = {
+    "ko": "발리 우붓 요가 & 명상 리트리트 1주일 가이드",
+    "en": "Luxury meditation and spa retreat in Thailand",
+    "off_topic": "Quarterly earnings call summary",
+}
+# (이름, 언어, 본문 길이) - 짧은 항목은 RSS 요약, 긴 항목은 전문 기사 수준
+CORPUS_SPEC = [
+    ("short_ko", "ko", 300),
+    ("short_en", "en", 300),
+    ("long_ko", "ko", 20_000),
+    ("long_en", "en", 20_000),
+    ("short_off_topic", "off_topic", 300),
+    ("long_off_topic", "off_topic", 20_000),
+]
+
+
+def build_corpus() -> List[Tuple[str, str, str]]:
+    """고정 코퍼스 (이름, 제목, 본문) - 항상 같은 내용"""
+    corpus = []
+    for name, language, length in CORPUS_SPEC:
+        paragraph = PARAGRAPHS[language]
+        content = (paragraph * (length // len(paragraph) + 1))[:length]
+        corpus.append((name, TITLES[language], content))
+    return corpus
+
+
+def _run_sync(coroutine):
+    """await 지점이 없는 코루틴을 이벤트 루프 없이 실행 (루프 오버헤드를 측정에서 제외)"""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("코루틴이 대기 상태로 전환되었습니다")
+
+
+def build_cases(corpus) -> Dict[str, Callable[[], object]]:
+    """함수 × 코퍼스 항목별 측정 대상 (인자 없는 호출로 고정)"""
+    from app.models.newsletter import Newsletter
+    from app.services.newsletter_collector import NewsletterCollector
+
+    collector = NewsletterCollector()
+    cases = {}
+    for name, title, content in corpus:
+        cases[f"is_wellness_related[{name}]"] = lambda t=title, c=content: collector._is_wellness_retreat_related(t, c)
+        cases[f"classify_category[{name}]"] = lambda t=title, c=content: collector._classify_category(t, c)
+        cases[f"extract_location[{name}]"] = lambda t=title, c=content: collector._extract_location(t, c)
+        cases[f"extract_program_info[{name}]"] = lambda t=title, c=content: collector._extract_program_info(t, c)
+
+        newsletter = Newsletter(
+            title=title,
+            summary=content[:200],
+            content=content,
+            content_text=content,
+            location=collector._extract_location(title, content),
+            program_info=collector._extract_program_info(title, content),
+        )
+        cases[f"evaluate_quality[{name}]"] = lambda n=newsletter: _run_sync(collector._evaluate_quality(n))
+    return cases
+
+
+def calibration_workload() -> int:
+    """기계 속도 보정용 순수 파이썬 작업 (문자열 검색 + 딕셔너리 + 정수 연산)"""
+    text = PARAGRAPHS["en"] * 20
+    total = 0
+    for word in ("retreat", "spa", "missing", "wellness", "yoga"):
+        total += text.count(word)
+    counts: Dict[str, int] = {}
+    for token in text.split():
+        counts[token] = counts.get(token, 0) + 1
+    return total + sum(i * i for i in range(2000)) + len(counts)
+
+
+def _loops_for(func: Callable[[], object], min_round_time: float) -> int:
+    """한 라운드가 min_round_time 이상 걸리는 반복 횟수"""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - started >= min_round_time:
+            return loops
+        loops *= 2
+
+
+def _timed(func: Callable[[], object], loops: int) -> float:
+    """호출 1회당 µs"""
+    started = time.perf_counter()
+    for _ in range(loops):
+        func()
+    return (time.perf_counter() - started) / loops * 1e6
+
+
+def measure(func: Callable[[], object], rounds: int, min_round_time: float,
+            reference_loops: int) -> Dict[str, float]:
+    """
+    호출 1회당 µs 통계 + 보정 작업 대비 상대 비용
+    라운드마다 보정 작업을 바로 앞에서 함께 재서 CPU 클럭 변동(터보/스로틀링)이 비율에 상쇄되게 한다
+    """
+    loops = _loops_for(func, min_round_time)
+    samples = []
+    ratios = []
+    for _ in range(rounds):
+        reference = _timed(calibration_workload, reference_loops)
+        sample = _timed(func, loops)
+        samples.append(sample)
+        ratios.append(sample / reference)
+    return {
+        "min_us": round(min(samples), 3),
+        "median_us": round(statistics.median(samples), 3),
+        "relative": round(statistics.median(ratios), 6),
+        "loops": loops,
+    }
+
+
+def function_totals(results: Dict[str, Dict]) -> Dict[str, float]:
+    """함수별 코퍼스 전체 상대 비용 합계 (케이스 이름 'function[item]' 기준)"""
+    totals: Dict[str, float] = {}
+    for name, result in results.items():
+        function = name.split("[", 1)[0]
+        totals[function] = totals.get(function, 0.0) + result["relative"]
+    return totals
+
+
+def compare(results: Dict[str, Dict], baseline: Dict, threshold: float) -> List[Dict]:
+    """
+    함수별 기준선 대비 변화율 (보정 작업 대비 상대 비용이라 기계/클럭 차이가 상쇄됨)
+    케이스 하나는 수 µs라 잡음이 크므로 회귀 판정은 코퍼스 전체 합계로
+    """
+    shared = {name: result for name, result in results.items() if name in baseline.get("results", {})}
+    before = function_totals({name: baseline["results"][name] for name in shared})
+    rows = []
+    for function, current in function_totals(shared).items():
+        change = (current - before[function]) / before[function]
+        rows.append({
+            "function": function,
+            "baseline": round(before[function], 4),
+            "current": round(current, 4),
+            "change": round(change, 4),
+            "regressed": change > threshold,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집기 텍스트 분석 함수 벤치마크 + 회귀 검사")
+    parser.add_argument("--rounds", type=int, default=7, help="함수별 라운드 수 (기본값: 7, 중앙값 보고)")
+    parser.add_argument("--min-round-time", type=float, default=0.05, help="라운드 최소 시간(초) (기본값: 0.05)")
+    parser.add_argument("--filter", help="이름에 이 문자열이 포함된 케이스만 실행")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help=f"기준선 JSON (기본값: {DEFAULT_BASELINE.name})")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    parser.add_argument("--check", action="store_true", help="회귀가 있으면 종료 코드 1")
+    parser.add_argument("--threshold", type=float, default=0.25, help="회귀 판정 비율 (기본값: 0.25 = 25%% 느려짐)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    import logging
+    logging.basicConfig(level=logging.WARNING)
+
+    cases = build_cases(build_corpus())
+    if args.filter:
+        cases = {name: func for name, func in cases.items() if args.filter in name}
+
+    # 보정 작업은 라운드마다 짧게 (~10ms) 실행
+    reference_loops = max(1, _loops_for(calibration_workload, 0.01))
+    calibration_us = round(min(_timed(calibration_workload, reference_loops) for _ in range(args.rounds)), 3)
+    results = {name: measure(func, args.rounds, args.min_round_time, reference_loops) for name, func in cases.items()}
+    report = {
+        "python": sys.version.split()[0],
+        "calibration_us": calibration_us,
+        "results": results,
+    }
+
+    baseline_path = Path(args.baseline)
+    comparison: List[Dict] = []
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    elif baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        comparison = compare(results, baseline, args.threshold)
+    regressions = [row for row in comparison if row["regressed"]]
+
+    if args.json:
+        print(json.dumps({**report, "comparison": comparison}, indent=2, ensure_ascii=False))
+    else:
+        print(f"🔬 텍스트 분석 벤치마크 (Python {report['python']}, 보정 작업 {calibration_us:.1f} µs)")
+        print("=" * 84)
+        print(f"  {'케이스':<40}{'min(µs)':>12}{'median(µs)':>12}")
+        for name, result in results.items():
+            print(f"  {name:<40}{result['min_us']:>12.2f}{result['median_us']:>12.2f}")
+        if comparison:
+            print("-" * 84)
+            print(f"  {'함수 (코퍼스 합계, 보정 작업 대비)':<40}{'기준선':>12}{'현재':>12}{'변화':>10}")
+            for row in comparison:
+                marker = " ❌" if row["regressed"] else ""
+                print(f"  {row['function']:<40}{row['baseline']:>12.4f}{row['current']:>12.4f}"
+                      f"{row['change'] * 100:>+9.1f}%{marker}")
+        print("=" * 84)
+        if args.save_baseline:
+            print(f"💾 기준선 저장: {baseline_path}")
+        elif not comparison:
+            print(f"ℹ️ 비교할 기준선이 없습니다: {baseline_path} (--save-baseline 으로 생성)")
+        elif regressions:
+            print(f"❌ {len(regressions)}개 함수가 기준선보다 {args.threshold * 100:.0f}% 이상 느려졌습니다")
+        else:
+            print(f"✅ 회귀 없음 ({len(comparison)}개 함수, 허용 {args.threshold * 100:.0f}%)")
+
+    if args.check and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
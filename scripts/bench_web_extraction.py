@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+웹 목록 페이지 항목 추출 벤치마크 + 결과 검증
+고정 픽스처 페이지(가짜 피드 서버 HTML, 블로그/뉴스 목록 유형, EUC-KR, 잘못된 마크업, 대형 페이지 등)에서
+item_extractor.extract_items를 html.parser(BeautifulSoup)와 lxml 경로로 각각 실행해 페이지당 시간(ms)을 재고
+두 경로의 결과를 기존 구현(lxml 도입 전 수집기의 BeautifulSoup 추출)이 만든 결과와 비교
+
+- 기준 결과(golden): baselines/web_extraction.json - 픽스처별 항목의 제목/URL/요약과 본문 해시
+  기존 구현으로만 만든다 (현재 코드로 다시 만들면 회귀를 잡지 못함)
+- 의도한 차이는 요약 길이 하나: 기존 300자 + '...'(303자)는 스키마 max_length=300을 넘어 항목이 버려졌으므로
+  297자 + '...'로 수정 (expected_items에서 기준 결과에 같은 규칙 적용)
+- --verify: 기준 결과와 다른 페이지가 있으면 종료 코드 1
+- --files: 저장해 둔 실제 페이지도 함께 측정 (기준 결과가 없으므로 두 파서 결과끼리 비교, --base-url 기준으로 링크 해석)
+
+사용 예:
+  python scripts/bench_web_extraction.py --verify
+  python scripts/bench_web_extraction.py --files saved/*.html --base-url https://example.com/blog/
+"""
+import argparse
+import hashlib
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+backend_root = project_root / "backend"
+sys.path.insert(0, str(backend_root))
+
+BASE_URL = "https://example.com/blog/"
+PARSERS = ("html.parser", "lxml")
+DEFAULT_GOLDEN = Path(__file__).parent / "baselines" / "web_extraction.json"
+SUMMARY_LENGTH = 300
+
+HEAD = (
+    "<head><meta charset=\"utf-8\"><title>Wellness Journal</title>"
+    "<link rel=\"stylesheet\" href=\"/static/site.css\"><style>.post{margin:0}</style>"
+    "<script>window.dataLayer=[];function gtag(){dataLayer.push(arguments)}</script></head>"
+)
+NAV = (
+    "<header><nav><ul>" + "".join(f"<li><a href=\"/c/{i}\">Category {i}</a></li>" for i in range(12))
+    + "</ul></nav></header>"
+)
+FOOTER = "<footer><p>&copy; 2025 Wellness Journal &middot; <a href=\"/privacy\">Privacy</a></p></footer>"
+TITLES = [
+    "Bali Ubud yoga &amp; meditation retreat guide",
+    "발리 우붓 요가 리트리트 1주일 후기",
+    "Forest bathing weekend in Jeju island",
+    "Thai spa therapy: what to expect",
+    "명상과 디톡스를 함께하는 템플스테이",
+    "Luxury wellness resort opens in Chiang Mai",
+]
+WORDS = (
+    "yoga retreat meditation spa detox healing 명상 요가 힐링 리트리트 프로그램 organic "
+    "massage forest breathwork the and with for daily guests"
+).split()
+
+
+def _body(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _page(body: str, head: str = HEAD) -> str:
+    return f"<!DOCTYPE html><html lang=\"ko\">{head}<body>{NAV}<main>{body}</main>{FOOTER}</body></html>"
+
+
+def blog_articles(rng: random.Random) -> bytes:
+    """article 목록 (제목 링크, 시간, 인라인 스크립트/주석, 엔티티)"""
+    articles = []
+    for index in range(12):
+        articles.append(
+            f"<article class=\"card\"><h2><a href=\"/blog/{index}-post\">{rng.choice(TITLES)} #{index}</a></h2>"
+            f"<time datetime=\"2025-01-{index + 1:02d}\">Jan {index + 1}</time>"
+            f"<!-- ad slot --><script>track({index})</script>"
+            f"<p>{_body(rng, 60)}&nbsp;<em>{_body(rng, 5)}</em> &hellip;</p>"
+            f"<a class=\"more\" href=\"https://example.com/blog/{index}\">Read more</a></article>"
+        )
+    return _page("".join(articles)).encode("utf-8")
+
+
+def class_posts(rng: random.Random) -> bytes:
+    """div.post 목록 (h3 제목, 상대 링크, 여러 클래스)"""
+    posts = []
+    for index in range(15):
+        classes = "post featured" if index % 4 == 0 else "post"
+        posts.append(
+            f"<div class=\"{classes}\"><div class=\"meta\"><span>by Editor</span></div>"
+            f"<h3>{rng.choice(TITLES)} ({index})</h3><div class=\"excerpt\">{_body(rng, 40)}</div>"
+            f"<a href=\"../posts/{index}\">more</a></div>"
+        )
+    return _page("<section>" + "".join(posts) + "</section>").encode("utf-8")
+
+
+def news_items_euc_kr(rng: random.Random) -> bytes:
+    """EUC-KR 인코딩 한국어 뉴스 목록 (li.news-item)"""
+    head = "<head><meta http-equiv=\"Content-Type\" content=\"text/html; charset=euc-kr\"><title>웰니스 뉴스</title></head>"
+    items = "".join(
+        f"<li class=\"news-item\"><a href=\"/news/view?id={index}\">{rng.choice(TITLES[1::3])} 소식 {index}</a>"
+        f"<span class=\"desc\">{' '.join(rng.choice(['명상', '요가', '힐링', '숲', '치유', '여행']) for _ in range(30))}</span></li>"
+        for index in range(10)
+    )
+    return _page(f"<ul>{items}</ul>", head=head).encode("euc-kr")
+
+
+def headings_only(rng: random.Random) -> bytes:
+    """항목 컨테이너 없이 h2/h3 제목만 있는 목록"""
+    rows = "".join(
+        f"<li><h{2 + index % 2}><a href=\"/r/{index}\">{rng.choice(TITLES)} - {index}</a></h{2 + index % 2}>"
+        f"<p>{_body(rng, 20)}</p></li>"
+        for index in range(14)
+    )
+    return _page(f"<ul class=\"list\">{rows}</ul>").encode("utf-8")
+
+
+def single_article(rng: random.Random) -> bytes:
+    """article이 하나뿐이라 다음 셀렉터(.entry)로 넘어가는 페이지"""
+    entries = "".join(
+        f"<div class=\"entry\"><h4><a href=\"entry-{index}.html\">{rng.choice(TITLES)} / {index}</a></h4>"
+        f"<p>{_body(rng, 30)}</p></div>"
+        for index in range(8)
+    )
+    return _page(f"<article><h1>Weekly digest</h1>{entries}</article>").encode("utf-8")
+
+
+def template_and_noscript(rng: random.Random) -> bytes:
+    """template 안의 article(텍스트 제외), noscript/textarea 텍스트"""
+    template = "<template><article><h2>Template placeholder title</h2><p>hidden</p></article></template>"
+    articles = "".join(
+        f"<article><h2>{rng.choice(TITLES)} [{index}]</h2><noscript>Enable JavaScript</noscript>"
+        f"<p>{_body(rng, 25)}</p><textarea>note {index}</textarea></article>"
+        for index in range(6)
+    )
+    return _page(template + articles).encode("utf-8")
+
+
+def malformed(rng: random.Random) -> bytes:
+    """닫히지 않은 p/li, 빈 href, 짧은 제목이 섞인 페이지"""
+    articles = []
+    for index in range(10):
+        title = "Short" if index % 5 == 0 else f"{rng.choice(TITLES)} {index}"
+        articles.append(
+            f"<article><h2>{title}</h2><p>{_body(rng, 15)}<p>{_body(rng, 15)}"
+            f"<ul><li>{_body(rng, 3)}<li>{_body(rng, 3)}</ul><a href=\"\">self</a></article>"
+        )
+    return _page("".join(articles)).encode("utf-8")
+
+
+def misnested_headings(rng: random.Random) -> bytes:
+    """제목 태그 안에 p가 들어간 페이지 (libxml2는 h2를 먼저 닫고 html.parser는 그대로 둠)"""
+    articles = "".join(
+        f"<article><h2>{rng.choice(TITLES)} {index}<p>{_body(rng, 8)}</p></h2>"
+        f"<p>{_body(rng, 20)}</p><a href=\"/m/{index}\">more</a></article>"
+        for index in range(6)
+    )
+    return _page(articles).encode("utf-8")
+
+
+def fake_feed_web(rng: random.Random) -> bytes:
+    """가짜 피드 서버의 웹 목록 페이지 (수집기 벤치마크와 같은 형식)"""
+    from fake_feed_server import FeedConfig, render_web
+    return render_web(FeedConfig(entries=30, entry_size=2000), 1, "http://127.0.0.1:8765")
+
+
+def large_page(rng: random.Random) -> bytes:
+    """~500KB 대형 목록 페이지 (사이드바/댓글 등 항목과 무관한 마크업이 대부분)"""
+    sidebar = "<aside>" + "".join(
+        f"<div class=\"widget\"><ul>{''.join(f'<li><a href=/t/{i}-{j}>tag {j}</a></li>' for j in range(20))}</ul></div>"
+        for i in range(60)
+    ) + "</aside>"
+    articles = "".join(
+        f"<article class=\"post\"><header><h2><a href=\"/p/{index}\">{rng.choice(TITLES)} {index}</a></h2></header>"
+        f"<div class=\"content\"><p>{_body(rng, 150)}</p></div>"
+        f"<section class=\"comments\">{''.join(f'<div class=comment><p>{_body(rng, 12)}</p></div>' for _ in range(8))}</section>"
+        f"</article>"
+        for index in range(120)
+    )
+    return _page(articles + sidebar).encode("utf-8")
+
+
+def no_items(rng: random.Random) -> bytes:
+    return _page(f"<div><p>{_body(rng, 100)}</p></div>").encode("utf-8")
+
+
+def empty(rng: random.Random) -> bytes:
+    return b""
+
+
+FIXTURES: List[Tuple[str, Callable[[random.Random], bytes]]] = [
+    ("fake_feed_web", fake_feed_web),
+    ("blog_articles", blog_articles),
+    ("class_posts", class_posts),
+    ("news_items_euc_kr", news_items_euc_kr),
+    ("headings_only", headings_only),
+    ("single_article", single_article),
+    ("template_and_noscript", template_and_noscript),
+    ("malformed", malformed),
+    ("misnested_headings", misnested_headings),
+    ("large_page", large_page),
+    ("no_items", no_items),
+    ("empty", empty),
+]
+
+
+def build_pages(files: List[str], base_url: str) -> List[Tuple[str, bytes, str]]:
+    """(이름, 페이지 바이트, 기준 URL) - 픽스처는 항상 같은 내용"""
+    pages = [(name, build(random.Random(name)), BASE_URL) for name, build in FIXTURES]
+    for path in files:
+        pages.append((Path(path).name, Path(path).read_bytes(), base_url))
+    return pages
+
+
+def time_page(extract: Callable[[], object], rounds: int, min_round_time: float) -> float:
+    """페이지 1회 추출 시간(ms) - 라운드별 평균의 최솟값"""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            extract()
+        if time.perf_counter() - started >= min_round_time:
+            break
+        loops *= 2
+
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(loops):
+            extract()
+        best = min(best, (time.perf_counter() - started) / loops)
+    return best * 1000
+
+
+def golden_items(items: List[Dict]) -> List[Dict]:
+    """비교용 항목 (본문은 길이와 해시만)"""
+    return [
+        {
+            "title": item["title"],
+            "url": item["url"],
+            "summary": item["summary"],
+            "content_length": len(item["content"]),
+            "content_sha256": hashlib.sha256(item["content"].encode("utf-8")).hexdigest(),
+        }
+        for item in items
+    ]
+
+
+def expected_items(baseline: List[Dict]) -> List[Dict]:
+    """기존 구현 결과에 의도한 요약 길이 수정만 반영"""
+    expected = []
+    for item in baseline:
+        summary = item["summary"]
+        if len(summary) > SUMMARY_LENGTH:
+            summary = summary[:SUMMARY_LENGTH - 3] + "..."
+        expected.append(dict(item, summary=summary))
+    return expected
+
+
+def first_difference(expected: List[Dict], actual: List[Dict]) -> str:
+    if len(expected) != len(actual):
+        return f"항목 수 {len(expected)} != {len(actual)}"
+    for index, (left, right) in enumerate(zip(expected, actual)):
+        for key in left:
+            if left[key] != right.get(key):
+                return f"항목 {index} {key}: {str(left[key])[:60]!r} != {str(right.get(key))[:60]!r}"
+    return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="웹 목록 페이지 항목 추출 벤치마크 + 결과 검증")
+    parser.add_argument("--rounds", type=int, default=5, help="페이지별 라운드 수 (기본값: 5, 최솟값 보고)")
+    parser.add_argument("--min-round-time", type=float, default=0.05, help="라운드 최소 시간(초) (기본값: 0.05)")
+    parser.add_argument("--files", nargs="*", default=[], help="함께 측정할 저장된 HTML 파일")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"--files 링크 해석 기준 URL (기본값: {BASE_URL})")
+    parser.add_argument("--golden", default=str(DEFAULT_GOLDEN), help=f"기준 결과 JSON (기본값: {DEFAULT_GOLDEN.name})")
+    parser.add_argument("--verify", action="store_true", help="기준 결과와 다르면 종료 코드 1")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    import logging
+    logging.basicConfig(level=logging.WARNING)
+
+    from app.services.item_extractor import extract_items, parser_name
+
+    if parser_name() != "lxml":
+        print("❌ lxml이 설치되어 있지 않아 비교할 수 없습니다 (pip install lxml)")
+        sys.exit(1 if args.verify else 0)
+
+    golden_path = Path(args.golden)
+    golden = json.loads(golden_path.read_text(encoding="utf-8"))["pages"] if golden_path.exists() else {}
+    if not golden:
+        print(f"⚠️ 기준 결과가 없어 두 파서 결과끼리만 비교합니다: {golden_path}")
+
+    results = []
+    for name, markup, base_url in build_pages(args.files, args.base_url):
+        outputs = {parser: golden_items(extract_items(markup, base_url, parser=parser)) for parser in PARSERS}
+        timings = {
+            parser: round(time_page(lambda p=parser: extract_items(markup, base_url, parser=p),
+                                    args.rounds, args.min_round_time), 4)
+            for parser in PARSERS
+        }
+        if name in golden:
+            expected = expected_items(golden[name])
+            difference = "; ".join(
+                f"{parser}: {diff}" for parser in PARSERS
+                for diff in [first_difference(expected, outputs[parser])] if diff
+            )
+        else:
+            difference = first_difference(outputs["html.parser"], outputs["lxml"])
+        results.append({
+            "page": name,
+            "bytes": len(markup),
+            "items": len(outputs["html.parser"]),
+            "html_parser_ms": timings["html.parser"],
+            "lxml_ms": timings["lxml"],
+            "speedup": round(timings["html.parser"] / timings["lxml"], 2) if timings["lxml"] else None,
+            "reference": "golden" if name in golden else "html.parser",
+            "match": not difference,
+            "difference": difference or None,
+        })
+    mismatches = [result for result in results if not result["match"]]
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        print("🔬 웹 목록 항목 추출 (페이지당 ms)")
+        print("=" * 92)
+        print(f"  {'페이지':<26}{'크기(KB)':>10}{'항목':>6}{'html.parser':>14}{'lxml':>10}{'배속':>8}  일치")
+        for result in results:
+            speedup = f"{result['speedup']:.1f}x" if result["speedup"] else "-"
+            print(f"  {result['page']:<26}{result['bytes'] / 1024:>10.1f}{result['items']:>6}"
+                  f"{result['html_parser_ms']:>14.3f}{result['lxml_ms']:>10.3f}{speedup:>8}  "
+                  f"{'✅' if result['match'] else '❌'}")
+        print("=" * 92)
+        for result in mismatches:
+            print(f"❌ {result['page']}: {result['difference']}")
+        if not mismatches:
+            checked = sum(1 for result in results if result["reference"] == "golden")
+            print(f"✅ {len(results)}개 페이지 모두 결과 일치 (기준 결과 비교 {checked}개)")
+
+    if args.verify and mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+정적 자산 빌드 스크립트
+frontend/static의 CSS/JS를 압축(minify)하고 내용 해시 파일명으로 복사한 뒤
+.gz / .br 사전 압축본과 매니페스트를 frontend/static/dist에 생성
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import shutil
+import sys
+from pathlib import Path
+
+try:
+    import brotli  # 선택 의존성: 없으면 .br 생성 생략
+except ImportError:
+    brotli = None
+
+project_root = Path(__file__).parent.parent
+static_root = project_root / "frontend" / "static"
+DIST_DIR = "dist"
+MANIFEST_FILE = "manifest.json"
+ASSET_SUFFIXES = {".css", ".js"}
+
+
+def minify_css(source: str) -> str:
+    """주석/불필요한 공백 제거 (선택자 의미를 바꾸지 않는 보수적 처리)"""
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.S)
+    source = re.sub(r"\s+", " ", source)
+    source = re.sub(r"\s*([{};,])\s*", r"\1", source)
+    source = re.sub(r":\s+", ":", source)
+    source = source.replace(";}", "}")
+    return source.strip()
+
+
+def minify_js(source: str) -> str:
+    """
+    맨 앞 헤더 주석과 줄 끝 공백만 제거
+    문자열/정규식 리터럴 안의 "/*", "//"를 주석으로 오인하지 않도록 본문은 줄 끝 공백 외에는 바꾸지 않는다
+    (전송 크기는 .gz / .br 사전 압축본으로 줄인다)
+    """
+    lines = source.splitlines()
+    index = 0
+    in_block = False
+    while index < len(lines):
+        stripped = lines[index].strip()
+        if in_block:
+            if "*/" in stripped:
+                rest = stripped.split("*/", 1)[1].strip()
+                if rest:
+                    lines[index] = rest
+                    break
+                in_block = False
+        elif stripped.startswith("/*"):
+            in_block = True
+            continue
+        elif stripped and not stripped.startswith("//"):
+            break
+        index += 1
+    return "\n".join(line.rstrip() for line in lines[index:]) + "\n"
+
+
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+
+
+def build(gzip_level: int, brotli_quality: int) -> dict:
+    """자산 빌드 후 매니페스트 반환"""
+    dist_root = static_root / DIST_DIR
+    if dist_root.exists():
+        shutil.rmtree(dist_root)
+    dist_root.mkdir(parents=True)
+
+    manifest = {}
+    for source_path in sorted(static_root.rglob("*")):
+        if source_path.suffix not in ASSET_SUFFIXES or dist_root in source_path.parents:
+            continue
+
+        logical_path = source_path.relative_to(static_root).as_posix()
+        minified = MINIFIERS[source_path.suffix](source_path.read_text(encoding="utf-8")).encode("utf-8")
+        digest = hashlib.blake2b(minified, digest_size=6).hexdigest()
+
+        hashed_path = Path(DIST_DIR) / Path(logical_path).with_name(
+            f"{source_path.stem}.{digest}{source_path.suffix}"
+        )
+        output_path = static_root / hashed_path
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(minified)
+
+        gz_bytes = gzip.compress(minified, compresslevel=gzip_level, mtime=0)
+        Path(f"{output_path}.gz").write_bytes(gz_bytes)
+        sizes = f"{source_path.stat().st_size:>7} → {len(minified):>7} (gz {len(gz_bytes):>6}"
+        if brotli is not None:
+            br_bytes = brotli.compress(minified, quality=brotli_quality)
+            Path(f"{output_path}.br").write_bytes(br_bytes)
+            sizes += f", br {len(br_bytes):>6}"
+
+        manifest[logical_path] = hashed_path.as_posix()
+        print(f"  {logical_path:<28} {sizes}) → {hashed_path.as_posix()}")
+
+    (dist_root / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정적 자산 빌드 (minify + 해시 파일명 + 사전 압축)")
+    parser.add_argument("--gzip-level", type=int, default=9, help="gzip 압축 레벨 (기본값: 9)")
+    parser.add_argument("--brotli-quality", type=int, default=11, help="brotli 품질 (기본값: 11)")
+    parser.add_argument("--clean", action="store_true", help="빌드 결과 삭제 (원본 경로로 제공)")
+    args = parser.parse_args()
+
+    if args.clean:
+        shutil.rmtree(static_root / DIST_DIR, ignore_errors=True)
+        print("🧹 빌드 결과를 삭제했습니다")
+        return
+
+    print("📦 정적 자산 빌드")
+    print("=" * 50)
+    if brotli is None:
+        print("⚠️ brotli 패키지가 없어 .br 파일은 생성하지 않습니다")
+
+    manifest = build(args.gzip_level, args.brotli_quality)
+
+    print("=" * 50)
+    print(f"✅ {len(manifest)}개 자산 빌드 완료: {static_root / DIST_DIR / MANIFEST_FILE}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"❌ 자산 빌드 실패: {e}")
+        sys.exit(1)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+수집기 벤치마크용 가짜 피드 서버
+합성 RSS/Atom 피드와 HTML 목록 페이지를 결정적으로(seed) 생성해 제공
+항목 수, 본문 크기, 응답 지연, 오류 비율을 조절할 수 있다
+
+경로:
+  /rss/{n}.xml   RSS 2.0 피드
+  /atom/{n}.xml  Atom 피드
+  /web/{n}/      HTML 목록 페이지 (article 요소)
+  /robots.txt    모든 경로 허용
+
+단독 실행: python scripts/fake_feed_server.py --port 8799 --entries 50
+"""
+import argparse
+import http.server
+import multiprocessing
+import random
+import socket
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from html import escape
+from typing import Optional
+
+WELLNESS_TITLES = [
+    "Bali yoga retreat for deep rest", "발리 요가 리트리트 7일 프로그램", "Thai spa detox wellness week",
+    "제주 명상 힐링 스테이", "Ayurveda healing retreat in Kerala", "템플스테이와 산림욕 주말 코스",
+    "Mindfulness meditation retreat in Kyoto", "Costa Rica holistic wellness escape",
+]
+OFF_TOPIC_TITLES = [
+    "Quarterly earnings call summary", "New smartphone launch event recap", "주간 부동산 시장 동향",
+    "Local football league results",
+]
+BODY_WORDS = [
+    "wellness", "retreat", "yoga", "meditation", "spa", "detox", "healing", "breathwork", "journey",
+    "웰니스", "리트리트", "명상", "요가", "스파", "디톡스", "힐링", "자연", "휴식", "프로그램",
+    "the", "and", "with", "for", "a", "daily", "guided", "sessions", "organic", "meals",
+]
+
+
+class FeedConfig:
+    """피드 생성 설정"""
+
+    def __init__(self, entries: int = 20, entry_size: int = 2000, latency_ms: float = 0.0,
+                 error_rate: float = 0.0, off_topic_ratio: float = 0.1, seed: int = 42):
+        self.entries = entries
+        self.entry_size = entry_size
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.off_topic_ratio = off_topic_ratio
+        self.seed = seed
+
+
+def _entries(config: FeedConfig, kind: str, feed_id: int, base_url: str):
+    """피드 하나의 항목 (같은 seed/피드면 항상 같은 내용)"""
+    rng = random.Random(f"{config.seed}:{kind}:{feed_id}")
+    published = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for index in range(config.entries):
+        off_topic = rng.random() < config.off_topic_ratio
+        title = rng.choice(OFF_TOPIC_TITLES if off_topic else WELLNESS_TITLES)
+        title = f"{title} #{feed_id}-{index}"
+        words = [rng.choice(BODY_WORDS) for _ in range(max(1, config.entry_size // 7))]
+        if off_topic:
+            words = [word for word in words if word.isascii() and len(word) <= 5] or ["report"]
+        body = " ".join(words)[: config.entry_size]
+        yield {
+            "title": title,
+            "link": f"{base_url}/articles/{kind}-{feed_id}-{index}",
+            "summary": body[:200],
+            "content": body,
+            "published": published - timedelta(hours=index),
+        }
+
+
+def render_rss(config: FeedConfig, feed_id: int, base_url: str) -> bytes:
+    items = []
+    for entry in _entries(config, "rss", feed_id, base_url):
+        items.append(
+            f"<item><title>{escape(entry['title'])}</title><link>{entry['link']}</link>"
+            f"<pubDate>{format_datetime(entry['published'])}</pubDate>"
+            f"<description>{escape(entry['summary'])}</description>"
+            f"<content:encoded><![CDATA[<p>{escape(entry['content'])}</p>]]></content:encoded></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel>'
+        f"<title>Fake RSS {feed_id}</title><link>{base_url}/</link><description>bench</description>"
+        + "".join(items) + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def render_atom(config: FeedConfig, feed_id: int, base_url: str) -> bytes:
+    items = []
+    for entry in _entries(config, "atom", feed_id, base_url):
+        items.append(
+            f"<entry><title>{escape(entry['title'])}</title><link href=\"{entry['link']}\"/>"
+            f"<id>{entry['link']}</id><updated>{entry['published'].isoformat()}</updated>"
+            f"<summary>{escape(entry['summary'])}</summary>"
+            f"<content type=\"html\">{escape('<p>' + entry['content'] + '</p>')}</content></entry>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>Fake Atom {feed_id}</title><id>{base_url}/atom/{feed_id}</id>"
+        f"<updated>{datetime(2025, 1, 1, tzinfo=timezone.utc).isoformat()}</updated>"
+        + "".join(items) + "</feed>"
+    ).encode("utf-8")
+
+
+def render_web(config: FeedConfig, feed_id: int, base_url: str) -> bytes:
+    articles = []
+    for entry in _entries(config, "web", feed_id, base_url):
+        articles.append(
+            f"<article class=\"post\"><h2><a href=\"{entry['link']}\">{escape(entry['title'])}</a></h2>"
+            f"<p>{escape(entry['content'])}</p></article>"
+        )
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Fake listing</title></head><body>"
+        "<header><nav><a href=\"/\">Home</a></nav></header><main>"
+        + "".join(articles) + "</main><footer>bench</footer></body></html>"
+    ).encode("utf-8")
+
+
+def make_handler(config: FeedConfig):
+    """설정을 담은 요청 핸들러 클래스"""
+    rng = random.Random(config.seed)
+
+    class FeedHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive (수집기 연결 재사용 측정)
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, body: bytes, content_type: str) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if config.latency_ms:
+                time.sleep(config.latency_ms / 1000)
+            base_url = f"http://{self.headers.get('Host', 'localhost')}"
+            path = self.path.split("?", 1)[0]
+
+            if path == "/robots.txt":
+                self._send(200, b"User-agent: *\nAllow: /\n", "text/plain")
+                return
+            if config.error_rate and rng.random() < config.error_rate:
+                self._send(500, b"injected error", "text/plain")
+                return
+
+            try:
+                if path.startswith("/rss/") and path.endswith(".xml"):
+                    self._send(200, render_rss(config, int(path[5:-4]), base_url), "application/rss+xml")
+                elif path.startswith("/atom/") and path.endswith(".xml"):
+                    self._send(200, render_atom(config, int(path[6:-4]), base_url), "application/atom+xml")
+                elif path.startswith("/web/"):
+                    self._send(200, render_web(config, int(path[5:].strip("/")), base_url), "text/html; charset=utf-8")
+                else:
+                    self._send(404, b"not found", "text/plain")
+            except ValueError:
+                self._send(404, b"not found", "text/plain")
+
+    return FeedHandler
+
+
+def serve(config: FeedConfig, port: int, ready=None) -> None:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", port), make_handler(config))
+    server.daemon_threads = True
+    if ready is not None:
+        ready.set()
+    server.serve_forever()
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class FakeFeedServer:
+    """
+    별도 프로세스에서 가짜 피드 서버 실행 (벤치마크 대상 프로세스와 GIL/메모리를 공유하지 않음)
+    with FakeFeedServer(config) as server: server.url("/rss/1.xml")
+    """
+
+    def __init__(self, config: FeedConfig, port: Optional[int] = None):
+        self.config = config
+        self.port = port or free_port()
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://localhost:{self.port}"
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def __enter__(self):
+        ready = multiprocessing.Event()
+        self._process = multiprocessing.Process(target=serve, args=(self.config, self.port, ready), daemon=True)
+        self._process.start()
+        if not ready.wait(timeout=10):
+            raise RuntimeError("가짜 피드 서버가 시작되지 않았습니다")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(timeout=5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집기 벤치마크용 가짜 피드 서버")
+    parser.add_argument("--port", type=int, default=8799, help="포트 (기본값: 8799)")
+    parser.add_argument("--entries", type=int, default=20, help="피드당 항목 수 (기본값: 20)")
+    parser.add_argument("--entry-size", type=int, default=2000, help="항목 본문 크기(문자) (기본값: 2000)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args()
+
+    config = FeedConfig(args.entries, args.entry_size, args.latency_ms, args.error_rate, seed=args.seed)
+    print(f"🛰️ 가짜 피드 서버: http://localhost:{args.port}/rss/1.xml, /atom/1.xml, /web/1/")
+    serve(config, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+규모 테스트용 합성 뉴스레터 코퍼스 생성기
+한국어/영어가 섞인 제목과 본문(로그정규 길이 분포), 태그, 위치/프로그램 JSON, 한쪽으로 치우친 조회수,
+대응하는 NewsletterSource 행을 결정적(seed)으로 생성해 일괄 삽입
+
+- SQLite/기타: Core executemany (배치 단위 트랜잭션)
+- PostgreSQL + psycopg 3: COPY FROM STDIN
+- --defer-indexes: 적재 중 보조 인덱스를 지웠다가 마지막에 다시 생성 (대량 적재 시 수 배 빠름)
+- 이미 있는 생성 행 수를 이어서 추가하므로 --rows 를 늘려 다시 실행하면 부족분만 생성
+
+사용 예:
+  python scripts/generate_corpus.py --database sqlite:///./corpus.db --rows 1000000 --defer-indexes
+"""
+import argparse
+import hashlib
+import math
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+backend_root = project_root / "backend"
+sys.path.insert(0, str(backend_root))
+
+ID_PREFIX = "nl_gen_"
+
+CATEGORIES = ["mind_wellness", "body_wellness", "spa_therapy"]
+DURATIONS = ["당일", "1박2일", "2-3일", "1주일", "1주일이상"]
+PRICE_RANGES = ["저가", "중가", "고가", "럭셔리"]
+LOCATIONS = [
+    ("인도네시아", "발리", "우붓"), ("태국", "치앙마이", "도이수텝"), ("태국", "코사무이", None),
+    ("인도", "케랄라", "코친"), ("인도", "리시케시", None), ("한국", "제주", "서귀포"), ("한국", "강원", "평창"),
+    ("일본", "교토", "아라시야마"), ("일본", "홋카이도", "니세코"), ("코스타리카", "노사라", None),
+    ("포르투갈", "신트라", None), ("멕시코", "툴룸", None), ("스리랑카", "갈레", None), ("베트남", "다낭", None),
+]
+PROGRAMS_KO = ["요가", "명상", "디톡스", "스파", "아유르베다", "템플스테이", "산림욕", "필라테스", "싱잉볼", "마음챙김"]
+PROGRAMS_EN = ["yoga", "meditation", "detox", "spa", "ayurveda", "breathwork", "sound healing", "pilates",
+               "mindfulness", "forest bathing"]
+TITLE_TEMPLATES = [
+    "{place} {program_ko} 리트리트 {duration} 가이드",
+    "{program_en} retreat in {place_en}: what to expect",
+    "{place}에서 즐기는 {program_ko}와 {program_ko2}",
+    "Top {n} {program_en} retreats in {place_en} this season",
+    "{duration} {program_ko} 힐링 프로그램 후기 - {place}",
+    "A quiet week of {program_en} and {program_en2} in {place_en}",
+]
+SENTENCES_KO = [
+    "아침에는 해가 뜨기 전에 {program} 세션으로 하루를 시작합니다.",
+    "{place}의 자연 속에서 몸과 마음의 균형을 되찾는 시간을 보냅니다.",
+    "모든 식사는 현지 유기농 재료로 만든 채식 위주의 메뉴로 제공됩니다.",
+    "참가자는 개인 상담을 통해 자신에게 맞는 {program} 루틴을 설계합니다.",
+    "저녁에는 가벼운 스트레칭과 명상으로 깊은 휴식을 준비합니다.",
+    "가격에는 숙박, 식사, 모든 프로그램과 공항 픽업이 포함되어 있습니다.",
+    "초보자도 부담 없이 참여할 수 있도록 소규모 그룹으로 진행됩니다.",
+]
+SENTENCES_EN = [
+    "Mornings begin with a sunrise {program} session overlooking {place}.",
+    "Guests stay in eco-friendly villas surrounded by rice terraces and jungle.",
+    "The program combines daily {program} classes with nourishing plant-based meals.",
+    "Certified teachers guide small groups, so beginners feel welcome from day one.",
+    "Afternoons are free for spa treatments, journaling or exploring the village.",
+    "Prices include accommodation, all meals, workshops and airport transfers.",
+    "Many guests report better sleep and lower stress after just a few days.",
+]
+TAG_VOCABULARY = [
+    "요가", "명상", "디톡스", "스파", "발리", "태국", "제주", "아유르베다", "마음챙김", "힐링", "비건", "템플스테이",
+    "yoga", "meditation", "retreat", "wellness", "detox", "spa", "bali", "luxury", "budget", "solo", "couples",
+]
+
+
+def _zipf_weights(count: int, exponent: float = 1.1) -> List[float]:
+    return [1 / (rank ** exponent) for rank in range(1, count + 1)]
+
+
+class CorpusGenerator:
+    """결정적 합성 뉴스레터 생성기 (같은 seed와 인덱스면 같은 행)"""
+
+    def __init__(self, seed: int = 42, sources: int = 40, median_length: int = 1500,
+                 max_length: int = 50_000, paragraph_pool: int = 4000):
+        self.seed = seed
+        self.median_length = median_length
+        self.max_length = max_length
+        rng = random.Random(seed)
+        self.sources = [
+            {
+                "name": f"Synthetic Wellness Source {i:03d}",
+                "url": f"https://source{i:03d}.example.com/feed/",
+                "type": "rss" if i % 5 else "web",
+                "default_category": CATEGORIES[i % len(CATEGORIES)],
+                "description": "합성 코퍼스 소스",
+                "is_active": True,
+            }
+            for i in range(sources)
+        ]
+        self.source_weights = _zipf_weights(sources)
+        self.tag_weights = _zipf_weights(len(TAG_VOCABULARY), 0.9)
+        # 본문은 미리 만든 문단을 이어 붙여 생성 (행마다 문장을 새로 만드는 것보다 훨씬 빠름)
+        self.paragraphs = [self._paragraph(rng) for _ in range(paragraph_pool)]
+
+    def _paragraph(self, rng: random.Random) -> str:
+        country, region, _ = rng.choice(LOCATIONS)
+        korean = rng.random() < 0.6
+        templates = SENTENCES_KO if korean else SENTENCES_EN
+        program = rng.choice(PROGRAMS_KO if korean else PROGRAMS_EN)
+        place = f"{country} {region}" if korean else region
+        return " ".join(
+            rng.choice(templates).format(program=program, place=place) for _ in range(rng.randint(2, 6))
+        )
+
+    def _content(self, rng: random.Random) -> str:
+        # 로그정규 분포: 대부분 1~3KB, 일부 긴 기사 (MAX_CONTENT_LENGTH에서 자름)
+        target = int(min(self.max_length, max(200, rng.lognormvariate(math.log(self.median_length), 0.8))))
+        parts: List[str] = []
+        length = 0
+        while length < target:
+            paragraph = rng.choice(self.paragraphs)
+            parts.append(paragraph)
+            length += len(paragraph) + 2
+        return "\n\n".join(parts)[:target]
+
+    def _title(self, rng: random.Random, country: str, region: str, duration: str) -> str:
+        programs_ko = rng.sample(PROGRAMS_KO, 2)
+        programs_en = rng.sample(PROGRAMS_EN, 2)
+        return rng.choice(TITLE_TEMPLATES).format(
+            place=f"{country} {region}", place_en=region, duration=duration, n=rng.randint(3, 12),
+            program_ko=programs_ko[0], program_ko2=programs_ko[1],
+            program_en=programs_en[0], program_en2=programs_en[1],
+        )
+
+    def row(self, index: int, now: datetime) -> Dict:
+        rng = random.Random(self.seed * 1_000_003 + index)
+        source = rng.choices(self.sources, self.source_weights)[0]
+        country, region, specific = rng.choice(LOCATIONS)
+        duration = rng.choice(DURATIONS)
+        price_range = rng.choice(PRICE_RANGES)
+        title = self._title(rng, country, region, duration)
+        content = self._content(rng)
+        newsletter_id = f"{ID_PREFIX}{index:09d}"
+        collected = now - timedelta(seconds=rng.randint(0, 730 * 86400))
+        tags = list(dict.fromkeys(rng.choices(TAG_VOCABULARY, self.tag_weights, k=rng.randint(1, 5))))
+
+        location = {"country": country, "region": region}
+        if specific:
+            location["specific"] = specific
+        return {
+            "id": newsletter_id,
+            "title": title,
+            "summary": content[:150],
+            "content": content,
+            "content_text": content,
+            "source": source["name"],
+            "source_url": f"{source['url'].rsplit('/feed/', 1)[0]}/articles/{index}",
+            "primary_category": source["default_category"] if rng.random() < 0.8 else rng.choice(CATEGORIES),
+            "tags": tags,
+            "location": location,
+            "program_info": {"duration": duration, "price_range": price_range},
+            "country": country,
+            "duration": duration,
+            "price_range": price_range,
+            "published_date": collected - timedelta(hours=rng.randint(1, 72)),
+            "collected_date": collected,
+            "quality_score": round(rng.betavariate(5, 2), 3),
+            "is_active": rng.random() < 0.97,
+            "views": min(int(rng.paretovariate(1.16)) - 1, 10_000_000),  # 소수 기사에 조회수 집중
+            # 컨텐츠 해시 (수집기와 같은 제목+본문 해시, 합성 본문 충돌을 피하려고 ID 포함)
+            "content_hash": hashlib.sha256(f"{title}{content}{newsletter_id}".encode("utf-8")).hexdigest(),
+            "created_at": collected,
+            "updated_at": collected,
+        }
+
+    def rows(self, start: int, stop: int) -> Iterator[Dict]:
+        now = datetime(2025, 1, 1)  # 고정 기준 시각 (재실행해도 같은 날짜)
+        for index in range(start, stop):
+            yield self.row(index, now)
+
+
+def _copy_rows(connection, table, rows: List[Dict]) -> None:
+    """PostgreSQL COPY (psycopg 3), JSON 컬럼은 문자열로 직렬화"""
+    import json
+
+    columns = list(rows[0])
+    raw = connection.connection.driver_connection
+    with raw.cursor() as cursor:
+        with cursor.copy(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row([
+                    json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+                    for value in (row[column] for column in columns)
+                ])
+
+
+def generate(database_url: str, rows: int, seed: int = 42, sources: int = 40, batch_size: int = 20_000,
+             median_length: int = 1500, defer_indexes: bool = False, with_tags: bool = True,
+             quiet: bool = False) -> int:
+    """
+    생성 행이 rows개가 될 때까지 추가 (반환값: 새로 추가한 행 수)
+    DATABASE_URL 환경변수를 설정한 뒤 app 모듈을 import 하므로 프로세스당 한 DB만 사용
+    """
+    os.environ["DATABASE_URL"] = database_url
+    from sqlalchemy import insert, text
+    from sqlalchemy.dialects import postgresql, sqlite
+
+    from app.core.config import settings
+    from app.core.database import engine, create_tables
+    from app.models.newsletter import Newsletter, NewsletterSource, NewsletterTag
+
+    create_tables()
+    generator = CorpusGenerator(seed, sources, median_length, settings.MAX_CONTENT_LENGTH)
+    newsletters = Newsletter.__table__
+    tags_table = NewsletterTag.__table__
+    dialect = engine.dialect.name
+    use_copy = False
+    if dialect == "postgresql":
+        try:
+            import psycopg  # noqa: F401 - COPY는 psycopg 3 드라이버에서만
+            use_copy = engine.dialect.driver == "psycopg"
+        except ImportError:
+            use_copy = False
+
+    with engine.begin() as conn:
+        upsert = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(dialect)
+        if upsert is not None:
+            conn.execute(upsert(NewsletterSource.__table__).on_conflict_do_nothing(index_elements=["name"]),
+                         generator.sources)
+        existing = conn.execute(
+            text("SELECT COUNT(*) FROM newsletters WHERE id LIKE :prefix"), {"prefix": f"{ID_PREFIX}%"}
+        ).scalar()
+    if existing >= rows:
+        return 0
+
+    deferred = [index for index in list(newsletters.indexes) + list(tags_table.indexes)] if defer_indexes else []
+    for index in deferred:
+        index.drop(bind=engine, checkfirst=True)
+
+    started = time.perf_counter()
+    added = 0
+    try:
+        for start in range(existing, rows, batch_size):
+            batch = list(generator.rows(start, min(start + batch_size, rows)))
+            with engine.begin() as conn:
+                if dialect == "sqlite":
+                    conn.exec_driver_sql("PRAGMA synchronous=OFF")  # 적재 중에만 (배치 커밋마다 fsync 생략)
+                if use_copy:
+                    _copy_rows(conn, newsletters, batch)
+                else:
+                    conn.execute(insert(newsletters), batch)
+                if with_tags:
+                    tag_rows = [
+                        {"newsletter_id": row["id"], "tag": tag, "collected_date": row["collected_date"]}
+                        for row in batch for tag in row["tags"]
+                    ]
+                    if use_copy:
+                        _copy_rows(conn, tags_table, tag_rows)
+                    else:
+                        conn.execute(insert(tags_table), tag_rows)
+            added += len(batch)
+            if not quiet:
+                elapsed = time.perf_counter() - started
+                print(f"  🌱 {start + len(batch):,}/{rows:,}개 ({added / elapsed:,.0f} 행/초)", end="\r", flush=True)
+    finally:
+        if deferred:
+            if not quiet:
+                print(f"\n  🧱 인덱스 {len(deferred)}개 재생성 중...", end="", flush=True)
+            for index in deferred:
+                index.create(bind=engine, checkfirst=True)
+        if not quiet:
+            print()
+
+    with engine.begin() as conn:
+        if dialect in ("sqlite", "postgresql"):
+            conn.exec_driver_sql("ANALYZE")  # 플래너 통계 갱신
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="규모 테스트용 합성 뉴스레터 코퍼스 생성")
+    parser.add_argument("--database", default="sqlite:///./corpus.db", help="대상 DB URL (기본값: sqlite:///./corpus.db)")
+    parser.add_argument("--rows", type=int, default=100_000, help="생성할 뉴스레터 수 (기본값: 100000)")
+    parser.add_argument("--sources", type=int, default=40, help="소스 수 (기본값: 40, 지프 분포로 배분)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (기본값: 42)")
+    parser.add_argument("--batch-size", type=int, default=20_000, help="배치 크기 (기본값: 20000)")
+    parser.add_argument("--median-length", type=int, default=1500, help="본문 길이 중앙값(문자) (기본값: 1500)")
+    parser.add_argument("--defer-indexes", action="store_true", help="적재 후 인덱스 생성 (대량 적재 권장)")
+    parser.add_argument("--no-tags", action="store_true", help="태그 색인(newsletter_tags) 생략")
+    args = parser.parse_args()
+
+    print(f"🏭 합성 코퍼스 생성: {args.database} ({args.rows:,}개, seed={args.seed})")
+    started = time.perf_counter()
+    added = generate(
+        args.database, args.rows, seed=args.seed, sources=args.sources, batch_size=args.batch_size,
+        median_length=args.median_length, defer_indexes=args.defer_indexes, with_tags=not args.no_tags,
+    )
+    elapsed = time.perf_counter() - started
+    if added:
+        print(f"✅ {added:,}개 추가, {elapsed:.1f}초 ({added / elapsed:,.0f} 행/초)")
+    else:
+        print("✅ 이미 충분한 행이 있어 건너뜀")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+API 부하 테스트
+비동기 클라이언트로 시나리오 조합(목록/검색/상세/통계/메인 페이지)을 고정 동시성에서 실행하고
+엔드포인트별 p50/p95/p99 지연 시간과 처리량을 보고
+
+서버 준비 방법:
+  --base-url       이미 실행 중인 서버에 요청
+  --spawn          임시(또는 --database) DB로 uvicorn을 직접 띄움, --rows 만큼 시드 데이터 생성
+
+사용 예:
+  python scripts/load_test.py --spawn --rows 100000 --concurrency 1 10 50 --duration 20
+  python scripts/load_test.py --base-url http://127.0.0.1:8000 --mix list=50,search=30,detail=20
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+backend_root = project_root / "backend"
+sys.path.insert(0, str(backend_root))
+
+import httpx  # noqa: E402
+
+DEFAULT_MIX = "list=35,search=20,detail=25,stats=10,landing=10"
+SEARCH_TERMS = ["요가", "명상", "retreat", "spa", "발리", "detox", "meditation", "힐링", "치앙마이", "아유르베다"]
+CATEGORIES = ["mind_wellness", "body_wellness", "spa_therapy"]
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = int(weight or 1)
+    unknown = set(mix) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"❌ 알 수 없는 시나리오: {', '.join(sorted(unknown))} (가능: {', '.join(SCENARIOS)})")
+    return mix
+
+
+# 시나리오별 요청 생성 (rng, 상세 조회용 ID 목록) → (메서드, 경로)
+SCENARIOS = {
+    "list": lambda rng, ids: f"/api/v1/newsletters/?page={rng.randint(1, 50)}&per_page=20"
+                             + (f"&category={rng.choice(CATEGORIES)}" if rng.random() < 0.5 else ""),
+    "search": lambda rng, ids: f"/api/v1/newsletters/?query={rng.choice(SEARCH_TERMS)}&per_page=20",
+    "detail": lambda rng, ids: f"/api/v1/newsletters/{rng.choice(ids)}" if ids else "/api/v1/newsletters/",
+    "stats": lambda rng, ids: "/api/v1/newsletters/stats/",
+    "landing": lambda rng, ids: "/",
+}
+
+
+def seed_database(database_url: str, rows: int, seed: int = 42) -> int:
+    """부하 테스트용 시드 데이터 (scripts/generate_corpus.py 합성 코퍼스), 반환값: 새로 추가한 행 수"""
+    from generate_corpus import generate
+
+    return generate(database_url, rows, seed=seed, quiet=True)
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def spawn_server(database_url: str, tmp_dir: str, workers: int) -> tuple:
+    """uvicorn 실행 (요청 제한 해제, 예약 수집 끔) → (프로세스, base_url)"""
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "DATA_VERSION_FILE": os.path.join(tmp_dir, "data_version"),
+        "LEADER_LOCK_FILE": os.path.join(tmp_dir, "leader.lock"),
+        "COLLECTION_LOCK_FILE": os.path.join(tmp_dir, "collection.lock"),
+        "BOOTSTRAP_LOCK_FILE": os.path.join(tmp_dir, "bootstrap.lock"),
+        "RATE_LIMIT_STORAGE_URI": "memory://",
+        "LANDING_RATE_LIMIT": "1000000/minute",
+        "COLLECTION_ENABLED": "false",
+        "LOG_LEVEL": "WARNING",
+        "PYTHONPATH": str(backend_root),
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=backend_root, env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise SystemExit("❌ 서버가 시작 중 종료되었습니다")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return process, base_url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise SystemExit("❌ 서버가 60초 안에 응답하지 않았습니다")
+
+
+async def fetch_ids(client: httpx.AsyncClient, pages: int = 5) -> List[str]:
+    """상세 조회에 쓸 뉴스레터 ID (목록 API 앞쪽 페이지)"""
+    ids = []
+    for page in range(1, pages + 1):
+        response = await client.get(f"/api/v1/newsletters/?page={page}&per_page=100&sort_by=views")
+        if response.status_code != 200:
+            break
+        items = response.json().get("newsletters") or response.json().get("items") or []
+        ids.extend(item["id"] for item in items)
+        if len(items) < 100:
+            break
+    return ids
+
+
+async def run_level(client: httpx.AsyncClient, mix: Dict[str, int], ids: List[str],
+                    concurrency: int, duration: float, seed: int) -> Dict[str, dict]:
+    """동시 실행 concurrency개가 duration초 동안 요청을 반복 (닫힌 루프)"""
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    latencies: Dict[str, List[float]] = {name: [] for name in names}
+    errors: Dict[str, int] = {name: 0 for name in names}
+    deadline = time.perf_counter() + duration
+
+    async def worker(worker_id: int):
+        rng = random.Random(seed * 1000 + worker_id)
+        while time.perf_counter() < deadline:
+            scenario = rng.choices(names, weights)[0]
+            path = SCENARIOS[scenario](rng, ids)
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            latencies[scenario].append(time.perf_counter() - started)
+            if not ok:
+                errors[scenario] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {name: summarize(latencies[name], errors[name], elapsed) for name in names if latencies[name]}
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / elapsed, 1),
+        "p50_ms": round(_percentile(ordered, 0.50) * 1000, 2),
+        "p95_ms": round(_percentile(ordered, 0.95) * 1000, 2),
+        "p99_ms": round(_percentile(ordered, 0.99) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+async def run(base_url: str, args, mix: Dict[str, int]) -> List[dict]:
+    limits = httpx.Limits(max_connections=max(args.concurrency), max_keepalive_connections=max(args.concurrency))
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        ids = await fetch_ids(client)
+        if args.warmup:
+            await run_level(client, mix, ids, min(args.concurrency), args.warmup, args.seed)
+        results = []
+        for concurrency in args.concurrency:
+            endpoints = await run_level(client, mix, ids, concurrency, args.duration, args.seed)
+            total_requests = sum(row["requests"] for row in endpoints.values())
+            results.append({
+                "concurrency": concurrency,
+                "total_rps": round(total_requests / args.duration, 1),
+                "endpoints": endpoints,
+            })
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 부하 테스트 (엔드포인트별 지연 백분위수/처리량)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--base-url", help="실행 중인 서버 주소")
+    target.add_argument("--spawn", action="store_true", help="uvicorn을 직접 실행해서 측정")
+    parser.add_argument("--database", help="--spawn 시 사용할 DB URL (기본값: 임시 SQLite)")
+    parser.add_argument("--rows", type=int, default=100_000, help="--spawn 시 최소 뉴스레터 수 (부족하면 시드, 기본값: 100000)")
+    parser.add_argument("--workers", type=int, default=1, help="--spawn 시 uvicorn 워커 수 (기본값: 1)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50], help="동시성 수준 (기본값: 1 10 50)")
+    parser.add_argument("--duration", type=float, default=15.0, help="동시성 수준별 측정 시간(초) (기본값: 15)")
+    parser.add_argument("--warmup", type=float, default=3.0, help="예열 시간(초) (기본값: 3)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"시나리오 가중치 (기본값: {DEFAULT_MIX})")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃(초)")
+    parser.add_argument("--seed", type=int, default=42, help="요청 순서 시드")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    process: Optional[subprocess.Popen] = None
+    base_url = args.base_url
+    if args.spawn:
+        tmp_dir = tempfile.mkdtemp(prefix="load_test_")
+        database_url = args.database or f"sqlite:///{os.path.join(tmp_dir, 'load.db')}"
+        added = seed_database(database_url, args.rows, args.seed)
+        if not args.json:
+            print(f"🌱 시드 데이터: {added:,}개 추가 (목표 {args.rows:,}개)")
+        process, base_url = spawn_server(database_url, tmp_dir, args.workers)
+
+    try:
+        results = asyncio.run(run(base_url, args, mix))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    if args.json:
+        print(json.dumps({"base_url": base_url, "mix": mix, "results": results}, indent=2, ensure_ascii=False))
+        return
+
+    print(f"🔥 부하 테스트: {base_url} (시나리오 {args.mix}, 수준별 {args.duration:.0f}초)")
+    for level in results:
+        print("=" * 78)
+        print(f"  동시성 {level['concurrency']}  |  전체 {level['total_rps']} req/s")
+        print(f"  {'시나리오':<10} {'요청':>7} {'오류':>5} {'req/s':>8} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9}")
+        for name, row in level["endpoints"].items():
+            print(f"  {name:<10} {row['requests']:>7} {row['errors']:>5} {row['rps']:>8} "
+                  f"{row['p50_ms']:>9} {row['p95_ms']:>9} {row['p99_ms']:>9} {row['max_ms']:>9}")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -67,6 +67,8 @@ def main():
         print(f"   개발 모드: 자동 리로드 활성화")
     else:
         print(f"   프로덕션 모드: 워커 {args.workers}개")
+        if args.workers > 1:
+            print(f"   예약 수집: 리더 워커 1개만 실행 (잠금 파일: logs/collection_leader.lock)")
     
     print("   Ctrl+C로 종료")
     print("-" * 50)
@@ -40,6 +40,7 @@ def main():
     parser.add_argument("--html-coverage", action="store_true", help="HTML 커버리지 리포트")
     parser.add_argument("--lint", action="store_true", help="린트 검사 실행")
     parser.add_argument("--format", action="store_true", help="코드 포맷팅 실행")
+    parser.add_argument("--benchmark", action="store_true", help="텍스트 분석 성능 회귀 검사 (기준선 대비)")
     
     args = parser.parse_args()
     
@@ -120,6 +121,13 @@ def main():
         
         success = run_command(cmd)
     
+    # 성능 회귀 검사
+    if args.benchmark:
+        print("\n⏱️ 텍스트 분석 성능 회귀 검사...")
+        cmd = ["uv", "run", "python", str(project_root / "scripts" / "bench_text_analysis.py"), "--check"]
+        if not run_command(cmd):
+            success = False
+    
     # 결과 출력
     print("\n" + "=" * 50)
     if success: